@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+DNS pre-resolution and a negative cache for dead business websites
+Parked, expired and misconfigured domains each cost the analyzer a full
+request timeout. Before fetching, every hostname in a batch is resolved
+concurrently with a short timeout; hosts that get a definite NXDOMAIN, and
+hosts whose fetch was refused or timed out, are remembered in SQLite with
+a TTL so later runs skip them without touching the network. Slow or
+temporarily failing lookups are left to the normal fetch.
+"""
+
+import os
+import socket
+import sqlite3
+import sys
+import threading
+import time
+from typing import Dict, Iterable, Optional
+from urllib.parse import urlparse
+
+import requests
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.metrics import METRICS
+
+# How long a failure keeps a host skipped
+FAILURE_TTL_HOURS = {
+    'nxdomain': 7 * 24,  # Domain gone; a re-registration is rare
+    'refused': 24,       # Something answers but nothing listens on the web port
+    'timeout': 12,       # Could be a bad hour rather than a dead host
+}
+
+DNS_TIMEOUT = 2.0
+DNS_CONCURRENCY = 64
+
+# A batch where most lookups fail may point at our resolver, not at the hosts.
+# Then well-known names are looked up too; if they fail as well, the
+# failures are ignored rather than marking every host dead
+BROKEN_DNS_SHARE = 0.8
+CANARY_HOSTS = ['example.com', 'www.google.com']
+RESOLVER_CHECK_SECONDS = 300
+
+FAILURE_DETAILS = {
+    'nxdomain': 'domain does not resolve',
+    'refused': 'connection refused',
+    'timeout': 'no response',
+}
+
+def hostname(url: str) -> Optional[str]:
+    try:
+        return urlparse(url).hostname
+    except ValueError:
+        return None
+
+def classify_error(error: BaseException) -> Optional[str]:
+    """
+    'nxdomain', 'refused' or 'timeout' if a fetch error means the host is
+    dead, None for anything else (HTTP errors, read timeouts, TLS problems,
+    temporary resolver failures). Walks the requests -> urllib3 -> socket
+    exception chain
+    """
+    seen = set()
+    stack = [error]
+    while stack:
+        e = stack.pop()
+        if e is None or id(e) in seen:
+            continue
+        seen.add(id(e))
+        
+        if isinstance(e, requests.exceptions.ReadTimeout):
+            return None  # Connected, just slow
+        if isinstance(e, requests.exceptions.ConnectTimeout):
+            return 'timeout'
+        if isinstance(e, socket.gaierror):
+            return None if e.errno == socket.EAI_AGAIN else 'nxdomain'
+        if isinstance(e, ConnectionRefusedError):
+            return 'refused'
+        
+        stack.extend([e.__cause__, e.__context__, getattr(e, 'reason', None)])
+        stack.extend(arg for arg in getattr(e, 'args', ()) if isinstance(arg, BaseException))
+    return None
+
+def resolve(host: str) -> Optional[str]:
+    """None if host resolves, else 'nxdomain' or 'timeout' (resolver gave up)"""
+    try:
+        socket.getaddrinfo(host, None, type=socket.SOCK_STREAM)
+        return None
+    except socket.gaierror as e:
+        return 'timeout' if e.errno == socket.EAI_AGAIN else 'nxdomain'
+    except UnicodeError:
+        return 'nxdomain'  # Not a valid hostname at all
+
+def pre_resolve(hosts: Iterable[str], concurrency: int = DNS_CONCURRENCY,
+                timeout: float = DNS_TIMEOUT) -> Dict[str, Optional[str]]:
+    """
+    Resolve hostnames concurrently, returns {host: None | 'nxdomain' | 'timeout'}
+    A lookup still running timeout seconds after it started counts as
+    'timeout', which says nothing about the host yet. getaddrinfo can't be cancelled, so its (daemon) thread is
+    abandoned and a fresh worker takes its place in the pool.
+    """
+    queue = list(dict.fromkeys(host for host in hosts if host))
+    queue.reverse()  # pop() from the end keeps input order
+    if not queue:
+        return {}
+    
+    lock = threading.Lock()
+    results = {}
+    started = {}
+    
+    def worker():
+        while True:
+            with lock:
+                if not queue:
+                    return
+                host = queue.pop()
+                started[host] = time.monotonic()
+            lookup_start = time.perf_counter()
+            failure = resolve(host)
+            METRICS.observe('dns_lookup_seconds', time.perf_counter() - lookup_start)
+            with lock:
+                results.setdefault(host, failure)
+    
+    def spawn():
+        threading.Thread(target=worker, daemon=True).start()
+    
+    total = len(queue)
+    for _ in range(min(concurrency, total)):
+        spawn()
+    
+    while True:
+        time.sleep(0.02)
+        with lock:
+            now = time.monotonic()
+            stuck = [host for host, began in started.items()
+                     if host not in results and now - began > timeout]
+            for host in stuck:
+                results[host] = 'timeout'
+            finished = len(results) == total
+        if finished:
+            break
+        for _ in stuck:
+            spawn()
+    
+    for failure in results.values():
+        METRICS.inc('dns_lookups_total', result=failure or 'ok')
+    return results
+
+_resolver_lock = threading.Lock()
+_resolver_checked = {'at': 0.0, 'healthy': True}
+
+def resolver_healthy() -> bool:
+    """True if any of CANARY_HOSTS resolves; rechecked every RESOLVER_CHECK_SECONDS"""
+    with _resolver_lock:
+        if time.monotonic() - _resolver_checked['at'] < RESOLVER_CHECK_SECONDS:
+            return _resolver_checked['healthy']
+        healthy = any(failure is None for failure in pre_resolve(CANARY_HOSTS).values())
+        _resolver_checked.update(at=time.monotonic(), healthy=healthy)
+        if not healthy:
+            print(f"⚠️  DNS: none of {', '.join(CANARY_HOSTS)} resolves - not trusting lookup failures")
+        return healthy
+
+class DeadHostCache:
+    """Hosts known to be dead, each until its failure's TTL runs out"""
+    
+    def __init__(self, path: str = 'data/dead_hosts.db', ttl_hours: Dict[str, float] = None):
+        self.path = path
+        self.ttl_hours = {**FAILURE_TTL_HOURS, **(ttl_hours or {})}
+        self.hits = 0
+        self.recorded = 0
+        
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        # Shared by the analysis worker threads
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS dead_hosts (
+                host TEXT PRIMARY KEY,
+                reason TEXT NOT NULL,
+                failures INTEGER NOT NULL,
+                first_failed REAL NOT NULL,
+                expires_at REAL NOT NULL
+            )
+        """)
+        self._conn.commit()
+        self.purge_expired()
+    
+    def lookup(self, hosts: Iterable[str]) -> Dict[str, str]:
+        """{host: reason} for the given hosts that are still inside their TTL"""
+        hosts = list(dict.fromkeys(host for host in hosts if host))
+        now = time.time()
+        dead = {}
+        with self._lock:
+            # Stay under SQLite's bound-parameter limit
+            for start in range(0, len(hosts), 500):
+                batch = hosts[start:start + 500]
+                rows = self._conn.execute(
+                    f"SELECT host, reason FROM dead_hosts WHERE expires_at > ? AND host IN ({','.join('?' * len(batch))})",
+                    [now] + batch
+                ).fetchall()
+                dead.update(rows)
+            self.hits += len(dead)
+        return dead
+    
+    def record(self, host: str, reason: str):
+        """Mark host dead for its reason's TTL (failures counts how often it was found dead)"""
+        if not host or reason not in self.ttl_hours:
+            return
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT failures, first_failed FROM dead_hosts WHERE host = ?", (host,)).fetchone()
+            failures, first_failed = (row[0] + 1, row[1]) if row else (1, now)
+            ttl = self.ttl_hours[reason] * 3600
+            self._conn.execute(
+                "INSERT OR REPLACE INTO dead_hosts (host, reason, failures, first_failed, expires_at) VALUES (?, ?, ?, ?, ?)",
+                (host, reason, failures, first_failed, now + ttl)
+            )
+            self._conn.commit()
+            self.recorded += 1
+    
+    def record_error(self, url: str, error: BaseException) -> Optional[str]:
+        """Record a failed fetch if it means the host is dead, returns the reason or None"""
+        reason = classify_error(error)
+        if reason == 'nxdomain' and not resolver_healthy():
+            return None
+        if reason:
+            self.record(hostname(url), reason)
+        return reason
+    
+    def purge_expired(self) -> int:
+        """Delete entries past their TTL, returns number removed"""
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM dead_hosts WHERE expires_at <= ?", (time.time(),))
+            self._conn.commit()
+            return cursor.rowcount
+    
+    def stats(self) -> Dict:
+        with self._lock:
+            by_reason = dict(self._conn.execute(
+                "SELECT reason, COUNT(*) FROM dead_hosts WHERE expires_at > ? GROUP BY reason", (time.time(),)
+            ).fetchall())
+        return {'skipped': self.hits, 'recorded': self.recorded, 'dead': by_reason}
+    
+    def report(self):
+        stats = self.stats()
+        dead = ', '.join(f"{count} {reason}" for reason, count in sorted(stats['dead'].items())) or 'none'
+        print(f"💀 Dead hosts: {stats['skipped']} skipped from cache, {stats['recorded']} newly recorded ({dead})")
+    
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+def find_dead_hosts(urls: Iterable[str], cache: DeadHostCache = None, resolve_dns: bool = True,
+                    concurrency: int = DNS_CONCURRENCY, timeout: float = DNS_TIMEOUT) -> Dict[str, str]:
+    """
+    Pre-resolution stage: {host: reason} for every host among urls that is dead
+    Hosts the cache already knows are not looked up again; new NXDOMAIN
+    answers are added to it. Lookups that timed out or failed temporarily
+    are not counted dead - the fetch decides those. With resolve_dns=False
+    only the cache is consulted.
+    """
+    hosts = [host for host in dict.fromkeys(hostname(url) for url in urls) if host]
+    known = cache.lookup(hosts) if cache else {}
+    if cache:
+        METRICS.inc('cache_requests_total', len(known), cache='dead_hosts', result='hit')
+        METRICS.inc('cache_requests_total', len(hosts) - len(known), cache='dead_hosts', result='miss')
+    if not resolve_dns:
+        return known
+    
+    start = time.perf_counter()
+    resolved = pre_resolve([host for host in hosts if host not in known], concurrency, timeout)
+    dead = {host: reason for host, reason in resolved.items() if reason == 'nxdomain'}
+    
+    if dead and len(dead) > BROKEN_DNS_SHARE * len(resolved) and not resolver_healthy():
+        print(f"⚠️  DNS pre-check: {len(dead)}/{len(resolved)} lookups failed - resolver problem? Ignoring them")
+        return known
+    
+    if cache:
+        for host, reason in dead.items():
+            cache.record(host, reason)
+    if hosts:
+        undecided = sum(1 for reason in resolved.values() if reason == 'timeout')
+        print(f"🌐 DNS pre-check: {len(resolved)} hosts resolved in {time.perf_counter() - start:.1f}s, "
+              f"{len(dead)} dead, {undecided} slow (left to the fetch), {len(known)} known dead from cache")
+    return {**known, **dead}
+
+def dead_host_result(url: str, reason: str) -> Dict:
+    """Analysis result for a website that can't be reached - as strong a lead as no website"""
+    return {
+        'score': 0,
+        'has_website': False,
+        'details': f"Dead website: {FAILURE_DETAILS[reason]}",
+        'needs_website': True,
+        'url': url,
+        'dead_host': reason
+    }
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Feature extraction for website scoring
+Lowercases a page once and collects every scoring signal from that copy
+"""
+
+import re
+from datetime import datetime
+
+MODERN_FRAMEWORKS = ['react', 'vue', 'angular', 'next.js', 'nuxt.js', 'svelte']
+OLD_TECH = ['jquery', 'flash', 'marquee', '<table> for layout', 'frameset']
+CONTACT_KEYWORDS = ['phone', 'tel:', 'email']
+SOCIAL_PATTERNS = ['facebook.com', 'twitter.com', 'instagram.com', 'linkedin.com']
+CSS_INDICATORS = ['bootstrap', 'tailwind', 'material', 'font-awesome', 'google-fonts']
+
+SIGNAL_KEYWORDS = (['viewport', 'copyright', 'contact', 'form'] +
+                   MODERN_FRAMEWORKS + OLD_TECH + CONTACT_KEYWORDS + SOCIAL_PATTERNS + CSS_INDICATORS)
+
+COPYRIGHT_RE = re.compile(r'copyright.*?(\d{4})')
+CONTACT_FORM_RE = re.compile(r'contact.*?form')
+EMAIL_RE = re.compile(r'@.*?\.(com|ie|eu)')
+# Second halves of the three patterns, for a line cut between the halves
+YEAR_RE = re.compile(r'\d{4}')
+EMAIL_END_RE = re.compile(r'\.(com|ie|eu)')
+
+# A page with no newlines (minified HTML) is cut once this much is held back,
+# before one of CUT_BEFORE: no keyword has them past its first character and
+# none is a digit, so a cut there never splits a keyword or a year
+MAX_CARRY = 64 * 1024
+CUT_BEFORE = '<"\'/;,(){}'
+# Markers still looked for once the presence signals are decided (the rest can't change)
+SETTLED_MARKERS = OLD_TECH + SOCIAL_PATTERNS
+# Longest marker still counted once the presence signals are decided, minus one
+SETTLED_TAIL = max(len(marker) for marker in SETTLED_MARKERS + ['<img', 'alt=']) - 1
+
+def find_keywords(text):
+    """Return (keywords found, <img count, alt= count) for lowercased text"""
+    # str's C search beats one combined alternation regex here, since
+    # CPython's re tries every alternative at every position
+    found = {keyword for keyword in SIGNAL_KEYWORDS if keyword in text}
+    return found, text.count('<img'), text.count('alt=')
+
+class FeatureScanner:
+    """
+    Incremental feature extraction over a page fed in chunks
+    Keywords and regexes never span a newline, so scanning whole lines
+    one batch at a time gives the same features as scanning the full page.
+    A line longer than MAX_CARRY is cut where no keyword or year can span
+    (see CUT_BEFORE) instead, and a copyright, contact or '@' still waiting
+    for its second half is carried over to the next batch.
+    With skip_when_decided, once every presence signal is seen the rest of
+    the page is only counted for images, old tech and social links - the
+    things that can still change - so the features still match a full scan.
+    """
+    
+    def __init__(self, skip_when_decided=False):
+        self.skip_when_decided = skip_when_decided
+        self.settled = False
+        self.found = set()
+        self.img_tags = 0
+        self.alt_attrs = 0
+        self.copyright_year = None
+        self.contact_form = False
+        self.email = False
+        self._carry = ''
+        self._tail = ''  # Part of _carry already counted in settled mode
+        # Halves of COPYRIGHT_RE, CONTACT_FORM_RE and EMAIL_RE seen on a line cut before its end
+        self._open_copyright = False
+        self._open_contact = False
+        self._open_email = False
+    
+    def feed(self, chunk):
+        """Scan the complete lines of a decoded HTML chunk, holding back the last partial line"""
+        text = self._carry + chunk.lower()
+        if self.settled:
+            self._count_settled(text)
+            return
+        
+        cut = text.rfind('\n') + 1
+        if not cut and len(text) > MAX_CARRY:
+            cut = max(text.rfind(char) for char in CUT_BEFORE)
+            if cut <= 0:
+                cut = len(text)  # 64KB without one of them (not HTML); a keyword may be split
+        self._carry = text[cut:]
+        if cut:
+            self.scan(text[:cut])
+            if self.skip_when_decided and self.decided():
+                self.settled = True
+    
+    def _count_settled(self, text):
+        # Matches wholly inside the counted tail were counted last time
+        self.img_tags += text.count('<img') - self._tail.count('<img')
+        self.alt_attrs += text.count('alt=') - self._tail.count('alt=')
+        self.found.update(marker for marker in SETTLED_MARKERS if marker not in self.found and marker in text)
+        self._carry = self._tail = text[-SETTLED_TAIL:]
+    
+    def close(self):
+        """Scan whatever partial line is left at end of input"""
+        if self.settled:
+            # Settling during the last feed leaves its partial line uncounted
+            self._count_settled(self._carry)
+            self._carry = self._tail = ''
+        elif self._carry:
+            self.scan(self._carry)
+            self._carry = ''
+    
+    def scan(self, text):
+        """Scan lowercased text made of whole lines (or ending in a cut one, see feed)"""
+        if self._open_copyright or self._open_contact or self._open_email:
+            self._finish_line(text)
+        
+        found, img_tags, alt_attrs = find_keywords(text)
+        self.found |= found
+        self.img_tags += img_tags
+        self.alt_attrs += alt_attrs
+        
+        if self.copyright_year is None and 'copyright' in found:
+            match = COPYRIGHT_RE.search(text)
+            if match:
+                self.copyright_year = int(match.group(1))
+        
+        # Contact info needs 2+ signals; only run the line regexes if still short
+        if self._contact_signals() < 2:
+            if not self.contact_form and 'contact' in found and 'form' in found:
+                self.contact_form = CONTACT_FORM_RE.search(text) is not None
+            if not self.email and self._contact_signals() < 2:
+                self.email = EMAIL_RE.search(text) is not None
+        
+        # The last line may go on in the next batch: note which first halves it holds
+        line = text[text.rfind('\n') + 1:]
+        continued = '\n' not in text
+        self._open_copyright = self.copyright_year is None and (
+            'copyright' in line or (continued and self._open_copyright))
+        self._open_contact = not self.contact_form and ('contact' in line or (continued and self._open_contact))
+        self._open_email = not self.email and ('@' in line or (continued and self._open_email))
+    
+    def _finish_line(self, text):
+        """Look for the second halves of patterns left open by a cut line, up to that line's end"""
+        end = text.find('\n')
+        rest = text if end < 0 else text[:end]
+        # Earlier on the line than anything this batch finds, so it wins
+        if self._open_copyright and self.copyright_year is None:
+            match = YEAR_RE.search(rest)
+            if match:
+                self.copyright_year = int(match.group())
+        if self._open_contact and 'form' in rest:
+            self.contact_form = True
+        if self._open_email and EMAIL_END_RE.search(rest):
+            self.email = True
+    
+    def _contact_signals(self):
+        keywords = sum(1 for keyword in CONTACT_KEYWORDS if keyword in self.found)
+        return keywords + self.contact_form + self.email
+    
+    def decided(self):
+        """
+        True once every point-scoring presence signal has been seen. Only
+        the image alt-text ratio (and the old-tech list) can still change.
+        """
+        return ('viewport' in self.found and
+                self.copyright_year is not None and
+                self._contact_signals() >= 2 and
+                any(framework in self.found for framework in MODERN_FRAMEWORKS) and
+                any(pattern in self.found for pattern in SOCIAL_PATTERNS) and
+                any(indicator in self.found for indicator in CSS_INDICATORS))
+    
+    def features(self):
+        found = self.found
+        return {
+            'viewport': 'viewport' in found,
+            'modern_framework': any(framework in found for framework in MODERN_FRAMEWORKS),
+            'old_tech': [tech for tech in OLD_TECH if tech in found],
+            'copyright_year': self.copyright_year,
+            'img_tags': self.img_tags,
+            'alt_attrs': self.alt_attrs,
+            'contact_info': self._contact_signals() >= 2,
+            'social_links': sum(1 for pattern in SOCIAL_PATTERNS if pattern in found),
+            'css_framework': any(indicator in found for indicator in CSS_INDICATORS)
+        }
+
+def extract_features(html):
+    """Extract every scoring signal from a page's HTML"""
+    scanner = FeatureScanner()
+    scanner.scan(html.lower())
+    return scanner.features()
+
+def score_features(url, features):
+    """Score extracted features 0-30, returns (score, details list)"""
+    score = 0
+    details = []
+    
+    # 1. HTTPS/SSL (2 points)
+    if url.startswith('https://'):
+        score += 2
+        details.append('HTTPS/SSL: +2')
+    
+    # 2. Mobile friendly check (3 points)
+    if features['viewport']:
+        score += 3
+        details.append('Mobile viewport: +3')
+    
+    # 3. Modern framework detection (3 points)
+    if features['modern_framework']:
+        score += 3
+        details.append('Modern framework: +3')
+    
+    # 4. Old tech detection (negative indicators)
+    if features['old_tech']:
+        details.append(f'Old tech found: {", ".join(features["old_tech"])}')
+        # Don't subtract, just don't add points
+    
+    # 5. Copyright year check (3 points if recent)
+    current_year = datetime.now().year
+    year = features['copyright_year']
+    if year is not None and year >= current_year - 2:  # Updated in last 2 years
+        score += 3
+        details.append(f'Recent copyright ({year}): +3')
+    
+    # 6. Image optimization check (2 points)
+    img_tags = features['img_tags']
+    if img_tags > 0:
+        # Check for alt attributes (accessibility)
+        if features['alt_attrs'] / max(img_tags, 1) > 0.5:  # More than 50% have alt
+            score += 2
+            details.append('Good image alt text: +2')
+    
+    # 7. Contact info detection (2 points)
+    if features['contact_info']:
+        score += 2
+        details.append('Contact info present: +2')
+    
+    # 8. Social media links (2 points)
+    if features['social_links'] >= 1:
+        score += 2
+        details.append('Social media links: +2')
+    
+    # 9. Professional design indicators (3 points)
+    if features['css_framework']:
+        score += 3
+        details.append('CSS framework: +3')
+    
+    # Cap score at 30
+    score = min(score, 30)
+    
+    return score, details
+
+def score_html(url, html):
+    """Extract features and score a page in one call"""
+    return score_features(url, extract_features(html))
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Conditional-revalidation cache for website analysis
+Stores ETag / Last-Modified and extracted features per URL so re-runs
+can send If-None-Match / If-Modified-Since and reuse features on a 304
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+class AnalysisCache:
+    def __init__(self, path: str = 'data/analysis_cache.db', max_entries: int = 20000, max_age_days: float = 90):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_age_seconds = max_age_days * 86400
+        self.revalidated = 0
+        self.misses = 0
+        self.bytes_saved = 0
+        self.evictions = 0
+        
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        # Shared by the analysis worker threads
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS pages (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                features TEXT NOT NULL,
+                body_bytes INTEGER NOT NULL,
+                truncated INTEGER NOT NULL,
+                fetched_at REAL NOT NULL,
+                last_used REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_pages_last_used ON pages (last_used)")
+        self._conn.commit()
+    
+    def lookup(self, url: str) -> Optional[Dict]:
+        """Return the stored entry for a URL, or None if missing or too old"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified, features, body_bytes, truncated, fetched_at FROM pages WHERE url = ?",
+                (url,)
+            ).fetchone()
+        
+        if row is None or time.time() - row[5] > self.max_age_seconds:
+            return None
+        
+        return {
+            'etag': row[0],
+            'last_modified': row[1],
+            'features': json.loads(row[2]),
+            'body_bytes': row[3],
+            'truncated': bool(row[4])
+        }
+    
+    def conditional_headers(self, entry: Dict) -> Dict:
+        headers = {}
+        if entry['etag']:
+            headers['If-None-Match'] = entry['etag']
+        if entry['last_modified']:
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+    
+    def record_revalidated(self, url: str, entry: Dict):
+        """A 304 came back: count the body we didn't download"""
+        with self._lock:
+            self.revalidated += 1
+            self.bytes_saved += entry['body_bytes']
+            self._conn.execute("UPDATE pages SET last_used = ? WHERE url = ?", (time.time(), url))
+            self._conn.commit()
+    
+    def store(self, url: str, headers, features: Dict, body_bytes: int, truncated: bool):
+        """Store features for a freshly downloaded page, if it can be revalidated"""
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        
+        with self._lock:
+            self.misses += 1
+            if not etag and not last_modified:
+                return
+            
+            now = time.time()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, etag, last_modified, json.dumps(features), body_bytes, int(truncated), now, now)
+            )
+            
+            # Evict least recently used entries over the cap
+            count = self._conn.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+            if count > self.max_entries:
+                excess = count - self.max_entries
+                self._conn.execute(
+                    "DELETE FROM pages WHERE rowid IN (SELECT rowid FROM pages ORDER BY last_used LIMIT ?)",
+                    (excess,)
+                )
+                self.evictions += excess
+            self._conn.commit()
+    
+    def purge_expired(self) -> int:
+        """Delete entries older than max_age_days, returns number removed"""
+        cutoff = time.time() - self.max_age_seconds
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM pages WHERE fetched_at < ?", (cutoff,))
+            self._conn.commit()
+            return cursor.rowcount
+    
+    def stats(self) -> Dict:
+        with self._lock:
+            size = self._conn.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+        return {
+            'revalidated': self.revalidated,
+            'downloaded': self.misses,
+            'bytes_saved': self.bytes_saved,
+            'evictions': self.evictions,
+            'entries': size
+        }
+    
+    def report(self):
+        stats = self.stats()
+        print(f"♻️  Analysis cache: {stats['revalidated']} unchanged (304), {stats['downloaded']} downloaded, "
+              f"{stats['bytes_saved']/1_000_000:.2f} MB saved, {stats['entries']} cached")
+    
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Persistent lead state for incremental website analysis
+Remembers which website each business had and when it was last analyzed
+"""
+
+import os
+import sqlite3
+import time
+from typing import Dict
+
+def _text(value) -> str:
+    """A CSV field as text, '' when missing however it was read (None, NaN, pd.NA)"""
+    if value is None:
+        return ''
+    try:
+        if value != value:  # NaN
+            return ''
+    except TypeError:  # pd.NA refuses to be compared
+        return ''
+    return str(value).strip()
+
+def lead_key(row: Dict) -> str:
+    """Identify a business by name + address (present in input and output CSVs)"""
+    return f"{_text(row['name'])}|{_text(row['address'])}".lower()
+
+class LeadStateStore:
+    def __init__(self, path: str = 'data/lead_state.db', max_age_hours: float = 24 * 7):
+        self.path = path
+        self.max_age_seconds = max_age_hours * 3600
+        
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS leads (
+                lead_key TEXT PRIMARY KEY,
+                website TEXT,
+                analyzed_at REAL NOT NULL
+            )
+        """)
+        self._conn.commit()
+    
+    def contains(self, row: Dict) -> bool:
+        """True if this business has been analyzed before, whatever its website"""
+        return self._conn.execute(
+            "SELECT 1 FROM leads WHERE lead_key = ?", (lead_key(row),)
+        ).fetchone() is not None
+    
+    def is_fresh(self, row: Dict) -> bool:
+        """True if this business was analyzed recently with the same website"""
+        found = self._conn.execute(
+            "SELECT website, analyzed_at FROM leads WHERE lead_key = ?", (lead_key(row),)
+        ).fetchone()
+        if found is None:
+            return False
+        website, analyzed_at = found
+        return website == _text(row['website']) and time.time() - analyzed_at <= self.max_age_seconds
+    
+    def mark_analyzed(self, rows):
+        """Record that these businesses were just analyzed"""
+        now = time.time()
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO leads VALUES (?, ?, ?)",
+            [(lead_key(row), _text(row['website']), now) for row in rows]
+        )
+        self._conn.commit()
+    
+    def close(self):
+        self._conn.close()
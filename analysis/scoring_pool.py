@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Process-pool scoring stage for website analysis
+Feature extraction is CPU-bound and holds the GIL, so pages are scored
+in batches on worker processes while threads keep fetching
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from analysis.feature_extractor import extract_features, score_features
+
+def score_batch(pages):
+    """Worker: score a batch of (url, html) pairs, returns one record per page"""
+    records = []
+    for url, html in pages:
+        features = extract_features(html)
+        score, details = score_features(url, features)
+        records.append({'features': features, 'score': score, 'details': details})
+    return records
+
+class ScoringPool:
+    def __init__(self, workers: int = None, batch_size: int = 16):
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.executor = ProcessPoolExecutor(max_workers=self.workers)
+    
+    def submit(self, pages):
+        """Score one batch of (url, html) pairs in the background, returns a Future"""
+        return self.executor.submit(score_batch, pages)
+    
+    def score(self, pages):
+        """Score (url, html) pairs across all workers, returns records in input order"""
+        pages = list(pages)
+        batches = [pages[i:i + self.batch_size] for i in range(0, len(pages), self.batch_size)]
+        records = []
+        for batch_records in self.executor.map(score_batch, batches):
+            records.extend(batch_records)
+        return records
+    
+    def close(self):
+        self.executor.shutdown()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Reachability and redirect triage for business websites
+A cheap first pass over a batch before any page is downloaded: one HEAD
+(or a one-byte ranged GET for servers that reject HEAD) per site, run
+concurrently with a short timeout. Redirects are followed by hand so the
+chain, the final URL, the TLS outcome and the content type are known up
+front. Sites that turn out to be a Facebook page, a PDF menu or a broken
+certificate are classified without downloading their body; the rest are
+fetched at their final URL, which is also what HTTPS points are scored on.
+Every request waits its turn on the batch's HostThrottle, like the fetches.
+"""
+
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Optional
+from urllib.parse import urljoin
+
+import requests
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.http_client import get_client
+from utils.metrics import METRICS
+from analysis.dead_hosts import classify_error, dead_host_result, hostname
+
+TRIAGE_TIMEOUT = 3
+TRIAGE_CONCURRENCY = 32
+MAX_REDIRECTS = 5
+
+# A "website" that is (or redirects to) one of these is a social profile, not a site
+SOCIAL_HOSTS = ['facebook.com', 'fb.com', 'instagram.com', 'twitter.com', 'x.com',
+                'linkedin.com', 'tiktok.com', 'youtube.com', 'linktr.ee']
+
+HTML_TYPES = ['text/html', 'application/xhtml+xml']
+
+def social_host(url: str) -> Optional[str]:
+    """The social network a URL points at, or None"""
+    host = (hostname(url) or '').lower()
+    for social in SOCIAL_HOSTS:
+        if host == social or host.endswith('.' + social):
+            return social
+    return None
+
+def probe(url: str, timeout: float, throttle=None) -> requests.Response:
+    """HEAD without following redirects, falling back to a ranged GET whose body is never read"""
+    client = get_client('websites')
+    if throttle:
+        throttle.wait(url)
+    response = client.head(url, timeout=timeout, allow_redirects=False)
+    response.close()
+    if response.status_code >= 400 or (not response.is_redirect and not response.headers.get('Content-Type')):
+        # Plenty of servers answer HEAD with 403/405 or bare headers
+        if throttle:
+            throttle.wait(url)
+        response = client.get(url, timeout=timeout, allow_redirects=False, stream=True,
+                              headers={'Range': 'bytes=0-0'})
+        response.close()
+    return response
+
+def triage_url(url: str, timeout: float = TRIAGE_TIMEOUT, dead_hosts=None, throttle=None) -> Dict:
+    """
+    Triage one website, returns a record with final_url, chain, status,
+    tls ('ok', 'none' for plain HTTP, 'invalid'), content_type and kind:
+    'html', 'non_html', 'social', 'tls_error', 'dead', or 'unknown' when
+    triage couldn't tell and the full fetch should decide
+    """
+    record = {'url': url, 'final_url': url, 'chain': [url], 'status': None,
+              'tls': None, 'content_type': '', 'kind': 'unknown'}
+    current = url
+    
+    try:
+        for _ in range(MAX_REDIRECTS + 1):
+            social = social_host(current)
+            if social:
+                # Never worth a request: a profile page is not the business's own site
+                record.update(final_url=current, kind='social', social=social)
+                return record
+            
+            response = probe(current, timeout, throttle)
+            if not response.is_redirect:
+                break
+            current = urljoin(current, response.headers['Location'])
+            record['chain'].append(current)
+        else:
+            return record  # Redirect loop; the full fetch reports it
+    
+    except requests.exceptions.SSLError:
+        record.update(final_url=current, tls='invalid', kind='tls_error')
+        return record
+    except requests.exceptions.ConnectTimeout:
+        return record  # Too short a timeout to call the host dead; the full fetch decides
+    except requests.exceptions.RequestException as e:
+        reason = dead_hosts.record_error(current, e) if dead_hosts else classify_error(e)
+        if reason:
+            record.update(final_url=current, kind='dead', reason=reason)
+        return record  # Read timeouts and the like: the full fetch tries again with its longer timeout
+    
+    content_type = response.headers.get('Content-Type', '').split(';')[0].strip().lower()
+    record.update(final_url=current, status=response.status_code, content_type=content_type,
+                  tls='ok' if current.startswith('https://') else 'none')
+    
+    if response.status_code >= 400:
+        record['kind'] = 'unknown'  # The full fetch reports the HTTP error as before
+    elif content_type and content_type not in HTML_TYPES:
+        record['kind'] = 'non_html'
+    else:
+        record['kind'] = 'html'
+    return record
+
+def triage_batch(urls: Iterable[str], concurrency: int = TRIAGE_CONCURRENCY, timeout: float = TRIAGE_TIMEOUT,
+                 dead_hosts=None, throttle=None) -> Dict[str, Dict]:
+    """
+    Triage distinct URLs concurrently, returns {url: record}
+    Pass the HostThrottle the fetches use, so sites sharing a host are
+    probed (and later fetched) per_host_delay apart
+    """
+    urls = list(dict.fromkeys(urls))
+    if not urls:
+        return {}
+    
+    def run(url):
+        with METRICS.timer('website_triage_seconds'):
+            record = triage_url(url, timeout, dead_hosts, throttle)
+        METRICS.inc('website_triage_total', kind=record['kind'])
+        return record
+    
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(urls)))) as executor:
+        records = dict(zip(urls, executor.map(run, urls)))
+    
+    kinds = {}
+    for record in records.values():
+        kinds[record['kind']] = kinds.get(record['kind'], 0) + 1
+    upgraded = sum(1 for record in records.values()
+                   if record['url'].startswith('http://') and record['final_url'].startswith('https://'))
+    summary = ', '.join(f"{count} {kind}" for kind, count in sorted(kinds.items()))
+    print(f"🔎 Triage: {len(urls)} sites in {time.perf_counter() - start:.1f}s ({summary}; "
+          f"{upgraded} redirect to HTTPS)")
+    return records
+
+def triage_result(record: Dict) -> Optional[Dict]:
+    """Finished analysis result for a site triage already classified, None if it needs a full fetch"""
+    url, kind = record['url'], record['kind']
+    if kind == 'dead':
+        return dead_host_result(url, record['reason'])
+    
+    details = {
+        'social': f"Social media page only ({record.get('social')})",
+        'non_html': f"Not a web page ({record['content_type']})",
+        'tls_error': 'Broken HTTPS certificate',
+    }.get(kind)
+    if details is None:
+        return None
+    return {
+        'score': 0,
+        'has_website': False,
+        'details': details,
+        'needs_website': True,
+        'url': url,
+        'triage': kind
+    }
+
+def triage_fields(record: Optional[Dict]) -> Dict:
+    """Output columns recording what triage saw for a site"""
+    if not record:
+        return {'redirect_chain': '', 'tls': '', 'content_type': ''}
+    return {
+        'redirect_chain': ' > '.join(record['chain']) if len(record['chain']) > 1 else '',
+        'tls': record['tls'] or '',
+        'content_type': record['content_type'],
+    }
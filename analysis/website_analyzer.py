@@ -4,197 +4,605 @@ Website Analyzer for Lead Scout
 Scores websites 0-30 to identify businesses needing Evolution Media
 """
 
+import codecs
 import requests
-import re
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.parse import urlparse
-from datetime import datetime
+import os
+import sys
 
-HEADERS = {
-    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-}
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.http_client import get_client
+from utils.rate_limit import HostThrottle
+from utils.metrics import METRICS
+from utils.lead_store import (BUSINESS_SCHEMA, ANALYSIS_SCHEMA, TableWriter, apply_schema, iter_table,
+                              load_table, save_table, to_records)
+from analysis.lead_state import lead_key
+from analysis.feature_extractor import FeatureScanner, score_features
+from analysis.scoring_pool import ScoringPool
+from analysis.dead_hosts import DeadHostCache, dead_host_result, find_dead_hosts, hostname
+from analysis.triage import social_host, triage_batch, triage_fields, triage_result
 
-def analyze_website(url, timeout=10):
+# Stop downloading a page after this many bytes
+MAX_PAGE_BYTES = 5_000_000
+CHUNK_SIZE = 64 * 1024
+
+def incremental_decoder(encoding):
+    """Decoder for a response charset; utf-8 when it's missing or not a text encoding Python knows"""
+    try:
+        if encoding and getattr(codecs.lookup(encoding), '_is_text_encoding', True):
+            return codecs.getincrementaldecoder(encoding)(errors='replace')
+    except LookupError:
+        pass  # Bogus charset header
+    return codecs.getincrementaldecoder('utf-8')(errors='replace')
+
+def stream_body(response, consume, max_bytes=MAX_PAGE_BYTES):
     """
-    Analyze a website and return score 0-30
-    Higher score = better website (less need for Evolution Media)
+    Decode a streamed response body incrementally, passing text to consume()
+    Returns (bytes_read, truncated); reading stops at max_bytes.
     """
-    if not url or url == "NO_WEBSITE" or "http://" not in url and "https://" not in url:
-        return {
-            'score': 0,
-            'has_website': False,
-            'details': 'No website found',
-            'needs_website': True
-        }
+    decoder = incremental_decoder(response.encoding)
+    bytes_read = 0
+    truncated = False
     
     try:
-        print(f"Analyzing: {url}")
-        response = requests.get(url, headers=HEADERS, timeout=timeout)
-        response.raise_for_status()
-        html = response.text
-        
-        score = 0
-        details = []
-        
-        # 1. HTTPS/SSL (2 points)
-        if url.startswith('https://'):
-            score += 2
-            details.append('HTTPS/SSL: +2')
+        for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+            if max_bytes and bytes_read + len(chunk) > max_bytes:
+                chunk = chunk[:max_bytes - bytes_read]
+                truncated = True
+            bytes_read += len(chunk)
+            consume(decoder.decode(chunk))
+            
+            if truncated:
+                break
         
-        # 2. Mobile friendly check (3 points)
-        if 'viewport' in html.lower():
-            score += 3
-            details.append('Mobile viewport: +3')
-        
-        # 3. Modern framework detection (3 points)
-        modern_frameworks = ['react', 'vue', 'angular', 'next.js', 'nuxt.js', 'svelte']
-        if any(framework in html.lower() for framework in modern_frameworks):
-            score += 3
-            details.append('Modern framework: +3')
-        
-        # 4. Old tech detection (negative indicators)
-        old_tech = ['jquery', 'flash', 'marquee', '<table> for layout', 'frameset']
-        old_tech_found = []
-        for tech in old_tech:
-            if tech in html.lower():
-                old_tech_found.append(tech)
-        
-        if old_tech_found:
-            details.append(f'Old tech found: {", ".join(old_tech_found)}')
-            # Don't subtract, just don't add points
-        
-        # 5. Copyright year check (3 points if recent)
-        current_year = datetime.now().year
-        copyright_pattern = r'copyright.*?(\d{4})'
-        match = re.search(copyright_pattern, html.lower())
-        if match:
-            year = int(match.group(1))
-            if year >= current_year - 2:  # Updated in last 2 years
-                score += 3
-                details.append(f'Recent copyright ({year}): +3')
-        
-        # 6. Image optimization check (2 points)
-        img_tags = len(re.findall(r'<img', html.lower()))
-        if img_tags > 0:
-            # Check for alt attributes (accessibility)
-            alt_imgs = len(re.findall(r'alt=', html.lower()))
-            if alt_imgs / max(img_tags, 1) > 0.5:  # More than 50% have alt
-                score += 2
-                details.append('Good image alt text: +2')
+        consume(decoder.decode(b'', final=True))
+    finally:
+        response.close()
+    
+    return bytes_read, truncated
+
+def fetch_features(response, max_bytes=MAX_PAGE_BYTES, stop_early=False):
+    """
+    Stream a response body into a FeatureScanner
+    Returns (scanner, bytes_read, truncated). With stop_early, keyword
+    scanning stops once every presence signal is decided; the rest of the
+    page is still read so the image alt-text ratio is judged on all of it.
+    """
+    scanner = FeatureScanner(skip_when_decided=stop_early)
+    bytes_read, truncated = stream_body(response, scanner.feed, max_bytes)
+    scanner.close()
+    return scanner, bytes_read, truncated
+
+def read_text(response, max_bytes=MAX_PAGE_BYTES):
+    """Stream a response body into a string, returns (html, bytes_read, truncated)"""
+    parts = []
+    bytes_read, truncated = stream_body(response, parts.append, max_bytes)
+    return ''.join(parts), bytes_read, truncated
+
+def has_website_url(url):
+    return bool(url) and url != "NO_WEBSITE" and ("http://" in url or "https://" in url)
+
+def no_website_result():
+    return {
+        'score': 0,
+        'has_website': False,
+        'details': 'No website found',
+        'needs_website': True
+    }
+
+def error_result(url, e):
+    if isinstance(e, requests.exceptions.RequestException):
+        print(f"  Error analyzing {url}: {e}")
+        details = f'Error: {str(e)[:50]}'
+    else:
+        print(f"  Unexpected error analyzing {url}: {e}")
+        details = 'Unexpected error'
+    
+    return {
+        'score': 0,
+        'has_website': False,
+        'details': details,
+        'needs_website': True,
+        'url': url
+    }
+
+def website_result(url, score, details, bytes_read, truncated, revalidated, final_url=None):
+    # Determine if needs website
+    needs_website = score < 15  # Threshold
+    
+    return {
+        'score': score,
+        'has_website': True,
+        'details': ' | '.join(details),
+        'needs_website': needs_website,
+        'url': url,
+        'bytes_read': bytes_read,
+        'truncated': truncated,
+        'revalidated': revalidated,
+        'final_url': final_url or url
+    }
+
+def request_page(url, timeout=10, cache=None, cache_key=None):
+    """
+    Send the GET for a website, conditional if the cache knows the URL
+    Returns (response, cache entry); a 304 means the entry is still valid
+    cache_key (default url) is the business's own website URL, so entries
+    are the same whether or not triage sent the request to a final URL
+    """
+    cache_key = cache_key or url
+    entry = cache.lookup(cache_key) if cache else None
+    headers = cache.conditional_headers(entry) if entry else {}
+    
+    response = get_client('websites').get(url, timeout=timeout, stream=True, headers=headers)
+    if not response.ok:
+        response.close()  # Release the pooled connection before raising
+    response.raise_for_status()
+    
+    if entry is not None and response.status_code == 304:
+        # Unchanged since last run - the stored features can be reused
+        response.close()
+        cache.record_revalidated(cache_key, entry)
+        METRICS.inc('cache_requests_total', cache='analysis', result='hit')
+        return response, entry
+    if cache:
+        METRICS.inc('cache_requests_total', cache='analysis', result='miss')
+    return response, None
+
+def fetch_target(url, triage=None):
+    """URL to download: triage's final URL when it found an HTML page there, saving the redirect hops"""
+    return triage['final_url'] if triage and triage['kind'] == 'html' else url
+
+def analyze_website(url, timeout=10, max_bytes=MAX_PAGE_BYTES, stop_early=False, cache=None, dead_hosts=None,
+                    triage=None):
+    """
+    Analyze a website and return score 0-30
+    Higher score = better website (less need for Evolution Media)
+    The page is streamed and capped at max_bytes; stop_early skips keyword
+    scanning once only the image counts can still change the score.
+    With an AnalysisCache (analysis/http_cache.py) the request is
+    conditional and an unchanged page reuses its stored features.
+    With a DeadHostCache (analysis/dead_hosts.py) refused, unresolvable
+    and timed-out hosts are recorded so later runs skip them.
+    HTTPS points go by the URL the page was served from, not the one given;
+    a triage record (analysis/triage.py) supplies it without redirect hops.
+    """
+    if not has_website_url(url):
+        return no_website_result()
+    
+    with METRICS.timer('website_analysis_seconds'):
+        try:
+            print(f"Analyzing: {url}")
+            target = fetch_target(url, triage)
+            response, entry = request_page(target, timeout, cache, cache_key=url)
+            
+            if entry:
+                features, bytes_read, truncated = entry['features'], 0, entry['truncated']
+            else:
+                # Scan the body chunk by chunk so memory stays bounded per page
+                scanner, bytes_read, truncated = fetch_features(response, max_bytes, stop_early)
+                features = scanner.features()
+                if cache:
+                    cache.store(url, response.headers, features, bytes_read, truncated)
+            
+            score, details = score_features(response.url, features)
+            return website_result(url, score, details, bytes_read, truncated, revalidated=entry is not None,
+                                  final_url=response.url)
         
-        # 7. Contact info detection (2 points)
-        contact_patterns = [
-            r'contact.*?form', r'@.*?\.(com|ie|eu)', r'phone', r'tel:', r'email'
-        ]
-        contact_found = sum(1 for pattern in contact_patterns if re.search(pattern, html.lower()))
-        if contact_found >= 2:
-            score += 2
-            details.append('Contact info present: +2')
+        except Exception as e:
+            if dead_hosts:
+                dead_hosts.record_error(target, e)
+            return error_result(url, e)
+
+def fetch_page(url, timeout=10, max_bytes=MAX_PAGE_BYTES, cache=None, dead_hosts=None, triage=None):
+    """
+    Fetch stage of the split analyzer: download a page without scoring it
+    Returns a page dict holding 'html' to score, cached 'features', or a
+    finished 'result' when there is no website or the fetch failed
+    """
+    if not has_website_url(url):
+        return {'url': url, 'result': no_website_result()}
+    
+    with METRICS.timer('website_fetch_seconds'):
+        try:
+            print(f"Fetching: {url}")
+            target = fetch_target(url, triage)
+            response, entry = request_page(target, timeout, cache, cache_key=url)
+            if entry:
+                return {'url': url, 'final_url': response.url, 'features': entry['features'],
+                        'bytes_read': 0, 'truncated': entry['truncated'], 'revalidated': True}
+            
+            html, bytes_read, truncated = read_text(response, max_bytes)
+            return {'url': url, 'final_url': response.url, 'html': html, 'bytes_read': bytes_read,
+                    'truncated': truncated, 'revalidated': False, 'headers': response.headers}
         
-        # 8. Social media links (2 points)
-        social_patterns = ['facebook.com', 'twitter.com', 'instagram.com', 'linkedin.com']
-        social_found = sum(1 for pattern in social_patterns if pattern in html.lower())
-        if social_found >= 1:
-            score += 2
-            details.append(f'Social media links: +2')
+        except Exception as e:
+            if dead_hosts:
+                dead_hosts.record_error(target, e)
+            return {'url': url, 'result': error_result(url, e)}
+
+def record_outcome(analysis):
+    """Count one analyzed website in METRICS by outcome, with the bytes downloaded for it"""
+    if analysis.get('has_website'):
+        outcome = 'revalidated' if analysis.get('revalidated') else 'scored'
+    elif analysis.get('dead_host'):
+        outcome = 'dead_host'
+    elif analysis.get('triage'):
+        outcome = analysis['triage']
+    else:
+        outcome = 'error' if 'url' in analysis else 'no_website'
+    METRICS.inc('websites_analyzed_total', outcome=outcome)
+    METRICS.inc('website_bytes_total', analysis.get('bytes_read', 0))
+    if analysis.get('truncated'):
+        METRICS.inc('websites_truncated_total')
+
+def build_result(row, analysis, triage=None):
+    """Output CSV record for one business, with what triage saw of its website"""
+    # Every analyzed row passes through here, whichever strategy ran it
+    record_outcome(analysis)
+    record = {
+        'name': row['name'],
+        'address': row['address'],
+        'original_website': row['website'],
+        'phone': row['phone'],
+        'category': row['category'],
+        'location': row['location'],
+        'score': analysis['score'],
+        'has_website': analysis['has_website'],
+        'analysis_details': analysis['details'],
+        'needs_website': analysis['needs_website'],
+        'categories': row.get('categories') or '',
+        'final_url': analysis.get('final_url', ''),
+        **triage_fields(triage)
+    }
+    if triage and not record['final_url']:
+        record['final_url'] = triage['final_url']
+    return record
+
+def analyze_rows(rows, concurrency=8, per_host_delay=0.5, progress_every=25, cache=None, dead_hosts=None,
+                 triaged=None, throttle=None):
+    """
+    Analyze business rows with a worker pool, returns results in input order
+    Requests to the same host are spaced by per_host_delay (or by a shared
+    throttle); different hosts run in parallel. triaged maps websites to
+    their triage records.
+    """
+    throttle = throttle or HostThrottle(per_host_delay)
+    triaged = triaged or {}
+    
+    def analyze_row(row):
+        throttle.wait(row['website'])
+        triage = triaged.get(row['website'])
+        return build_result(row, analyze_website(row['website'], cache=cache, dead_hosts=dead_hosts, triage=triage),
+                            triage)
+    
+    results = [None] * len(rows)
+    start = time.time()
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        futures = {executor.submit(analyze_row, row): i for i, row in enumerate(rows)}
+        for done, future in enumerate(as_completed(futures), 1):
+            results[futures[future]] = future.result()
+            if done % progress_every == 0 or done == len(rows):
+                elapsed = time.time() - start
+                print(f"📊 Progress: {done}/{len(rows)} analyzed ({done/elapsed:.1f}/s)")
+    
+    return results
+
+def analyze_rows_split(rows, concurrency=8, per_host_delay=0.5, scoring_workers=None,
+                       batch_size=16, progress_every=25, cache=None, dead_hosts=None, triaged=None, throttle=None):
+    """
+    Analyze business rows with fetching and scoring split into two stages
+    Threads download pages; a ScoringPool scores them in batches on worker
+    processes so regex scoring scales past the GIL. Results in input order.
+    """
+    throttle = throttle or HostThrottle(per_host_delay)
+    triaged = triaged or {}
+    
+    def fetch_row(row):
+        throttle.wait(row['website'])
+        return fetch_page(row['website'], cache=cache, dead_hosts=dead_hosts, triage=triaged.get(row['website']))
+    
+    def finish(index, page, record):
+        if cache:
+            cache.store(page['url'], page['headers'], record['features'], page['bytes_read'], page['truncated'])
+        analysis = website_result(page['url'], record['score'], record['details'],
+                                  page['bytes_read'], page['truncated'], revalidated=False, final_url=page['final_url'])
+        results[index] = build_result(rows[index], analysis, triaged.get(rows[index]['website']))
+    
+    results = [None] * len(rows)
+    batch = []
+    scoring = []  # (batch of (index, page), Future)
+    start = time.time()
+    
+    with ScoringPool(scoring_workers, batch_size) as pool, \
+            ThreadPoolExecutor(max_workers=max(1, concurrency)) as fetchers:
+        futures = {fetchers.submit(fetch_row, row): i for i, row in enumerate(rows)}
+        for done, future in enumerate(as_completed(futures), 1):
+            index = futures[future]
+            page = future.result()
+            
+            triage = triaged.get(rows[index]['website'])
+            if 'result' in page:
+                results[index] = build_result(rows[index], page['result'], triage)
+            elif 'features' in page:
+                score, details = score_features(page['final_url'], page['features'])
+                analysis = website_result(page['url'], score, details, 0, page['truncated'], revalidated=True,
+                                          final_url=page['final_url'])
+                results[index] = build_result(rows[index], analysis, triage)
+            else:
+                batch.append((index, page))
+            
+            # Hand full batches to the scoring processes, drop the HTML here
+            if len(batch) >= batch_size or (batch and done == len(rows)):
+                scoring.append((batch, pool.submit([(page['final_url'], page.pop('html')) for _, page in batch])))
+                batch = []
+            
+            # Collect finished batches as we go so pages don't pile up
+            while scoring and scoring[0][1].done():
+                scored, batch_future = scoring.pop(0)
+                for (i, page), record in zip(scored, batch_future.result()):
+                    finish(i, page, record)
+            
+            if done % progress_every == 0 or done == len(rows):
+                elapsed = time.time() - start
+                print(f"📊 Progress: {done}/{len(rows)} fetched ({done/elapsed:.1f}/s)")
         
-        # 9. Professional design indicators (3 points)
-        # Check for CSS frameworks, good structure
-        css_indicators = ['bootstrap', 'tailwind', 'material', 'font-awesome', 'google-fonts']
-        if any(indicator in html.lower() for indicator in css_indicators):
-            score += 3
-            details.append('CSS framework: +3')
+        for scored, batch_future in scoring:
+            for (i, page), record in zip(scored, batch_future.result()):
+                finish(i, page, record)
+    
+    return results
+
+def scored_rows(rows, results):
+    """
+    The rows whose result is a real score (or that have no website at all)
+    Failed fetches, dead hosts and triage answers are left unmarked in the
+    lead state so the next incremental run tries them again
+    """
+    scored = {lead_key(result) for result in results
+              if result['has_website'] or not has_website_url(result['original_website'])}
+    return [row for row in rows if lead_key(row) in scored]
+
+def without_pending_details(rows):
+    """Drop lightweight Places records: their empty website means 'not fetched yet', not 'no website'"""
+    ready = [row for row in rows if not row.get('needs_details')]
+    if len(ready) < len(rows):
+        print(f"⏭️  Skipping {len(rows) - len(ready)} businesses without Place Details (run scrapers/hydrate.py)")
+    return ready
+
+def analyze_batch(rows, concurrency=8, per_host_delay=0.5, cache=None, scoring_workers=0,
+                  dead_hosts=None, resolve_dns=True, triage=True):
+    """
+    Analyze business rows with the configured strategy, results in input order
+    Hosts found dead by the DNS pre-check (or already in dead_hosts) are
+    answered without a fetch. With triage, the remaining sites get a HEAD
+    first (analysis/triage.py); social-only, non-HTML and broken-TLS sites
+    are answered from it and the rest are fetched at their final URL.
+    Triage probes and fetches share one HostThrottle.
+    """
+    throttle = HostThrottle(per_host_delay)
+    with METRICS.stage('analysis') as stage:
+        stage.add(len(rows))
+        # Social profile links are classified by triage without any lookup
+        websites = [row['website'] for row in rows if has_website_url(row['website']) and not social_host(row['website'])]
+        dead = find_dead_hosts(websites, dead_hosts, resolve_dns) if (resolve_dns or dead_hosts) else {}
         
-        # Cap score at 30
-        score = min(score, 30)
+        results = [None] * len(rows)
+        live = []
+        for i, row in enumerate(rows):
+            reason = dead.get(hostname(row['website'])) if has_website_url(row['website']) else None
+            if reason:
+                results[i] = build_result(row, dead_host_result(row['website'], reason))
+            else:
+                live.append(i)
+        if dead:
+            print(f"💀 Skipping {len(rows) - len(live)} websites on dead hosts")
         
-        # Determine if needs website
-        needs_website = score < 15  # Threshold
+        triaged = {}
+        if triage:
+            triaged = triage_batch([rows[i]['website'] for i in live if has_website_url(rows[i]['website'])],
+                                   dead_hosts=dead_hosts, throttle=throttle)
+            to_fetch = []
+            for i in live:
+                record = triaged.get(rows[i]['website'])
+                answered = triage_result(record) if record else None
+                if answered:
+                    results[i] = build_result(rows[i], answered, record)
+                else:
+                    to_fetch.append(i)
+            live = to_fetch
         
-        return {
-            'score': score,
-            'has_website': True,
-            'details': ' | '.join(details),
-            'needs_website': needs_website,
-            'url': url
-        }
+        analyzed = run_strategy([rows[i] for i in live], concurrency, per_host_delay, cache, scoring_workers, dead_hosts,
+                                triaged, throttle)
+        for i, result in zip(live, analyzed):
+            results[i] = result
+        return results
+
+def run_strategy(rows, concurrency, per_host_delay, cache, scoring_workers, dead_hosts=None, triaged=None,
+                 throttle=None):
+    if scoring_workers:
+        print(f"Analyzing {len(rows)} websites with {concurrency} fetchers and {scoring_workers} scoring processes...")
+        return analyze_rows_split(rows, concurrency, per_host_delay, scoring_workers, cache=cache, dead_hosts=dead_hosts,
+                                  triaged=triaged, throttle=throttle)
+    
+    if concurrency > 1:
+        print(f"Analyzing {len(rows)} websites with {concurrency} workers...")
+        return analyze_rows(rows, concurrency, per_host_delay, cache=cache, dead_hosts=dead_hosts, triaged=triaged,
+                            throttle=throttle)
+    
+    triaged = triaged or {}
+    throttle = throttle or HostThrottle(per_host_delay)
+    analyzed = []
+    for idx, row in enumerate(rows):
+        print(f"\n{idx+1}/{len(rows)}: {row['name']}")
         
-    except requests.exceptions.RequestException as e:
-        print(f"  Error analyzing {url}: {e}")
-        return {
-            'score': 0,
-            'has_website': False,
-            'details': f'Error: {str(e)[:50]}',
-            'needs_website': True,
-            'url': url
-        }
-    except Exception as e:
-        print(f"  Unexpected error analyzing {url}: {e}")
-        return {
-            'score': 0,
-            'has_website': False,
-            'details': f'Unexpected error',
-            'needs_website': True,
-            'url': url
-        }
-
-def analyze_businesses_from_csv(csv_file, output_file=None):
-    """Analyze businesses from CSV file"""
+        # Be polite to servers
+        throttle.wait(row['website'])
+        triage = triaged.get(row['website'])
+        analysis = analyze_website(row['website'], cache=cache, dead_hosts=dead_hosts, triage=triage)
+        analyzed.append(build_result(row, analysis, triage))
+    return analyzed
+
+def print_analysis_summary(total, with_website, needs_website, candidates, cache=None, dead_hosts=None):
+    """Totals plus the worst-scoring websites (candidates: a small DataFrame)"""
+    print(f"\n=== ANALYSIS SUMMARY ===")
+    print(f"Total businesses: {total}")
+    print(f"With website: {with_website}")
+    print(f"Need website (score < 15): {needs_website}")
+    if cache:
+        cache.report()
+    if dead_hosts:
+        dead_hosts.report()
+    
+    # Show worst websites
+    print(f"\n=== TOP CANDIDATES FOR EVOLUTION MEDIA ===")
+    for row in candidates.to_dict('records'):
+        print(f"{row['name']} - Score: {row['score']}/30")
+        print(f"  {row['analysis_details'][:100]}...")
+        print(f"  Website: {row['original_website']}")
+        print()
+
+def analyze_businesses_from_csv(csv_file, output_file=None, concurrency=8, per_host_delay=0.5,
+                                cache=None, state=None, scoring_workers=0, chunk_size=None,
+                                dead_hosts=None, resolve_dns=True, triage=True):
+    """
+    Analyze businesses from CSV file
+    With a LeadStateStore (analysis/lead_state.py) only new or changed
+    businesses are analyzed; the rest are kept from the existing output_file
+    scoring_workers > 0 scores pages on that many processes (see analyze_rows_split)
+    chunk_size streams the input instead (see analyze_businesses_streaming;
+    it always writes a file, default_output_path when output_file is None)
+    Hostnames are resolved up front (resolve_dns) and, with a DeadHostCache
+    (analysis/dead_hosts.py), dead hosts are remembered and skipped next time
+    triage=False skips the HEAD pass and fetches every site directly
+    """
     import pandas as pd
     
+    if chunk_size:
+        return analyze_businesses_streaming(csv_file, output_file, chunk_size, concurrency, per_host_delay,
+                                            cache, state, scoring_workers, dead_hosts, resolve_dns, triage)
+    
     print(f"=== ANALYZING BUSINESSES FROM {csv_file} ===")
     
-    # Read CSV
-    df = pd.read_csv(csv_file)
+    # Read CSV (or its typed Parquet copy)
+    rows = without_pending_details(to_records(load_table(csv_file, BUSINESS_SCHEMA)))
     
-    results = []
-    for idx, row in df.iterrows():
-        print(f"\n{idx+1}/{len(df)}: {row['name']}")
-        
-        analysis = analyze_website(row['website'])
-        
-        result = {
-            'name': row['name'],
-            'address': row['address'],
-            'original_website': row['website'],
-            'phone': row['phone'],
-            'category': row['category'],
-            'location': row['location'],
-            'score': analysis['score'],
-            'has_website': analysis['has_website'],
-            'analysis_details': analysis['details'],
-            'needs_website': analysis['needs_website']
-        }
-        results.append(result)
+    # Incremental mode: reuse fresh results already in the output file
+    previous = {}
+    if state and output_file and os.path.exists(output_file):
+        for record in to_records(load_table(output_file, ANALYSIS_SCHEMA)):
+            previous[lead_key(record)] = record
+    
+    if state:
+        to_analyze = [row for row in rows if not (lead_key(row) in previous and state.is_fresh(row))]
+        print(f"Incremental: {len(to_analyze)} new or changed, {len(rows) - len(to_analyze)} still fresh")
+    else:
+        to_analyze = rows
+    
+    analyzed = analyze_batch(to_analyze, concurrency, per_host_delay, cache, scoring_workers, dead_hosts, resolve_dns,
+                             triage)
+    
+    if state:
+        state.mark_analyzed(scored_rows(to_analyze, analyzed))
         
-        # Be polite to servers
-        time.sleep(0.5)
+        # Merge: input order first, then earlier results no longer in the input
+        fresh = {lead_key(result): result for result in analyzed}
+        results = [fresh.get(lead_key(row)) or previous[lead_key(row)] for row in rows]
+        input_keys = {lead_key(row) for row in rows}
+        results.extend(record for key, record in previous.items() if key not in input_keys)
+    else:
+        results = analyzed
     
     # Create results DataFrame
-    results_df = pd.DataFrame(results)
+    results_df = apply_schema(pd.DataFrame(results), ANALYSIS_SCHEMA)
     
     # Save if output file specified
     if output_file:
-        results_df.to_csv(output_file, index=False)
+        save_table(results_df, output_file, ANALYSIS_SCHEMA)
         print(f"\n✅ Saved analysis to {output_file}")
     
-    # Print summary
-    print(f"\n=== ANALYSIS SUMMARY ===")
-    print(f"Total businesses: {len(results_df)}")
-    print(f"With website: {results_df['has_website'].sum()}")
-    print(f"Need website (score < 15): {results_df['needs_website'].sum()}")
-    
-    # Show worst websites
-    print(f"\n=== TOP CANDIDATES FOR EVOLUTION MEDIA ===")
     candidates = results_df[results_df['needs_website']].sort_values('score').head(5)
-    for idx, row in candidates.iterrows():
-        print(f"{row['name']} - Score: {row['score']}/30")
-        print(f"  {row['analysis_details'][:100]}...")
-        print(f"  Website: {row['original_website']}")
-        print()
+    print_analysis_summary(len(results_df), results_df['has_website'].sum(), results_df['needs_website'].sum(),
+                           candidates, cache, dead_hosts)
     
     return results_df
 
+def add_to_totals(totals, candidates, written):
+    """Fold one written chunk into the running summary, returns the new worst-5 candidates"""
+    import pandas as pd
+    
+    totals['total'] += len(written)
+    totals['with_website'] += int(written['has_website'].sum())
+    totals['needs_website'] += int(written['needs_website'].sum())
+    worst = written[written['needs_website']].nsmallest(5, 'score')
+    return pd.concat([candidates, worst]).nsmallest(5, 'score') if len(candidates) else worst
+
+def default_output_path(csv_file):
+    """Where a streamed analysis goes when no output file is given: '<input>_analyzed.csv' beside the input"""
+    return f"{os.path.splitext(csv_file)[0]}_analyzed.csv"
+
+def analyze_businesses_streaming(csv_file, output_file=None, chunk_size=5000, concurrency=8, per_host_delay=0.5,
+                                 cache=None, state=None, scoring_workers=0, dead_hosts=None, resolve_dns=True,
+                                 triage=True):
+    """
+    Analyze a large CSV chunk_size rows at a time
+    Each chunk is analyzed and appended to output_file as soon as it is done
+    (via '<output_file>.partial', usable if the run is interrupted), so
+    memory stays flat whatever the input size. In incremental mode the
+    previous output is held as a lookup, so memory grows with that file.
+    Results never stay in memory, so without an output_file they go to
+    default_output_path(csv_file). Returns the summary totals.
+    """
+    import pandas as pd
+    
+    print(f"=== ANALYZING BUSINESSES FROM {csv_file} (streaming, {chunk_size} rows per chunk) ===")
+    if not output_file:
+        output_file = default_output_path(csv_file)
+        print(f"No output file given - writing to {output_file}")
+    
+    previous = {}
+    if state and os.path.exists(output_file):
+        for chunk in iter_table(output_file, ANALYSIS_SCHEMA, chunk_size):
+            for record in to_records(chunk):
+                previous[lead_key(record)] = record
+    
+    totals = {'total': 0, 'with_website': 0, 'needs_website': 0}
+    candidates = pd.DataFrame()
+    
+    with TableWriter(output_file, ANALYSIS_SCHEMA) as writer:
+        for number, chunk in enumerate(iter_table(csv_file, BUSINESS_SCHEMA, chunk_size), 1):
+            rows = without_pending_details(to_records(chunk))
+            
+            if state:
+                # Take this chunk's earlier results out of the lookup; whatever is
+                # left at the end belongs to businesses no longer in the input
+                reused = {lead_key(row): previous.pop(lead_key(row)) for row in rows if lead_key(row) in previous}
+                to_analyze = [row for row in rows if not (lead_key(row) in reused and state.is_fresh(row))]
+                analyzed = analyze_batch(to_analyze, concurrency, per_host_delay, cache, scoring_workers,
+                                         dead_hosts, resolve_dns, triage)
+                state.mark_analyzed(scored_rows(to_analyze, analyzed))
+                fresh = {lead_key(result): result for result in analyzed}
+                results = [fresh.get(lead_key(row)) or reused[lead_key(row)] for row in rows]
+            else:
+                results = analyze_batch(rows, concurrency, per_host_delay, cache, scoring_workers, dead_hosts, resolve_dns,
+                                        triage)
+            
+            candidates = add_to_totals(totals, candidates, writer.write(results))
+            print(f"💾 Chunk {number}: {writer.rows} rows written to {writer.partial_path}")
+        
+        if previous:
+            candidates = add_to_totals(totals, candidates, writer.write(list(previous.values())))
+    
+    print(f"\n✅ Saved analysis to {output_file}")
+    print_analysis_summary(totals['total'], totals['with_website'], totals['needs_website'], candidates, cache,
+                           dead_hosts)
+    return totals
+
 if __name__ == "__main__":
     # Test with mock data
-    analyze_businesses_from_csv('data/mock_leads.csv', 'data/analyzed_leads.csv')
\ No newline at end of file
+    dead_hosts = DeadHostCache()
+    analyze_businesses_from_csv('data/mock_leads.csv', 'data/analyzed_leads.csv', dead_hosts=dead_hosts)
+    dead_hosts.close()
+    METRICS.write('website_analysis')
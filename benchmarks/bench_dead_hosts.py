@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Benchmark: analysis batch with dead business websites, with and without the
+DNS pre-check and dead-host cache
+A fake resolver (socket.getaddrinfo patched for the run) serves live hosts,
+NXDOMAIN names and names whose lookup hangs; refused and blackholed hosts
+are real local sockets
+"""
+
+import contextlib
+import io
+import os
+import socket
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from analysis.website_analyzer import analyze_businesses_from_csv
+from analysis.dead_hosts import CANARY_HOSTS, DeadHostCache
+from benchmarks.fake_websites_server import start_fake_websites_server
+
+DNS_LATENCY = 0.02
+DNS_HANG = 5.0       # A resolver that gives up after its retries
+BLACKHOLE_IP = '127.0.0.200'
+
+def fake_resolver(addresses):
+    """getaddrinfo stand-in: addresses maps name -> IP, 'nxdomain' or 'hang'"""
+    real = socket.getaddrinfo
+
+    def getaddrinfo(host, port, *args, **kwargs):
+        answer = addresses.get(host)
+        if answer is None:
+            return real(host, port, *args, **kwargs)
+        if answer == 'hang':
+            time.sleep(DNS_HANG)
+            raise socket.gaierror(socket.EAI_AGAIN, 'Temporary failure in name resolution')
+        time.sleep(DNS_LATENCY)
+        if answer == 'nxdomain':
+            raise socket.gaierror(socket.EAI_NONAME, 'Name or service not known')
+        return real(answer, port, *args, **kwargs)
+    return getaddrinfo
+
+def blackhole_port():
+    """A listener whose backlog is full and never accepts: connects hang until they time out"""
+    listener = socket.socket()
+    listener.bind((BLACKHOLE_IP, 0))
+    listener.listen(0)
+    port = listener.getsockname()[1]
+    fillers = []
+    for _ in range(3):
+        filler = socket.socket()
+        filler.setblocking(False)
+        filler.connect_ex((BLACKHOLE_IP, port))
+        fillers.append(filler)
+    return port, (listener, fillers)
+
+def closed_port():
+    probe = socket.socket()
+    probe.bind(('127.0.0.1', 0))
+    port = probe.getsockname()[1]
+    probe.close()
+    return port
+
+def build_rows(web_port):
+    """60 live sites plus 20 dead ones of four kinds, returns (rows, fake DNS table, sockets to keep open)"""
+    silent_port, keep_open = blackhole_port()
+    refused_port = closed_port()
+    addresses = {canary: '127.0.0.1' for canary in CANARY_HOSTS}  # The resolver itself works
+    websites = []
+
+    for i in range(60):
+        name = f'live-{i}.test'
+        addresses[name] = f'127.0.0.{1 + i % 50}'
+        websites.append(f'http://{name}:{web_port}/modern_dental.html')
+    for i in range(5):
+        addresses[f'gone-{i}.test'] = 'nxdomain'
+        websites.append(f'http://gone-{i}.test/')
+        addresses[f'hang-{i}.test'] = 'hang'
+        websites.append(f'http://hang-{i}.test/')
+        addresses[f'closed-{i}.test'] = '127.0.0.1'
+        websites.append(f'http://closed-{i}.test:{refused_port}/')
+        addresses[f'silent-{i}.test'] = BLACKHOLE_IP
+        websites.append(f'http://silent-{i}.test:{silent_port}/')
+
+    rows = [{'name': f'Business {i}', 'address': f'{i} Fake Street, Dublin 2', 'website': website,
+             'phone': '(01) 555 0100', 'category': 'restaurant', 'location': 'Dublin, Ireland'}
+            for i, website in enumerate(websites)]
+    return rows, addresses, keep_open
+
+def run(input_file, output_file, **kwargs):
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        # Triage (bench_triage.py) would also catch the blackholed hosts; leave it out to measure this stage alone
+        df = analyze_businesses_from_csv(input_file, output_file, concurrency=8, triage=False, **kwargs)
+    elapsed = time.perf_counter() - start
+    dead = df['analysis_details'].str.startswith('Dead website').sum()
+    return elapsed, df, dead
+
+def main():
+    server, web_port = start_fake_websites_server(latency=0.05)
+    rows, addresses, keep_open = build_rows(web_port)
+    socket.getaddrinfo = fake_resolver(addresses)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        input_file = os.path.join(tmp, 'businesses.csv')
+        pd.DataFrame(rows).to_csv(input_file, index=False)
+
+        print(f"=== DEAD HOST BENCHMARK ({len(rows)} websites: 60 live, 5 each NXDOMAIN / DNS hang / "
+              f"refused / blackholed) ===")
+        before, reference, _ = run(input_file, os.path.join(tmp, 'before.csv'), resolve_dns=False)
+        print(f"   No pre-check:            {before:5.1f}s")
+
+        cache = DeadHostCache(os.path.join(tmp, 'dead_hosts.db'))
+        first, first_df, first_dead = run(input_file, os.path.join(tmp, 'first.csv'), dead_hosts=cache)
+        print(f"   Pre-check, first run:    {first:5.1f}s ({first_dead} answered as dead, {before/first:.1f}x)")
+
+        second, second_df, second_dead = run(input_file, os.path.join(tmp, 'second.csv'), dead_hosts=cache)
+        print(f"   Pre-check, cached run:   {second:5.1f}s ({second_dead} skipped from cache, {before/second:.1f}x)")
+        print(f"   Cache: {cache.stats()['dead']}")
+
+        # Live sites score the same whichever way the batch ran
+        live = reference['original_website'].str.contains('live-')
+        assert (reference[live]['score'].tolist() == first_df[live]['score'].tolist()
+                == second_df[live]['score'].tolist()), "live site scores differ"
+        cache.close()
+
+    server.shutdown()
+
+if __name__ == "__main__":
+    main()
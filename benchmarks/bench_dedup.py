@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark: cross-source deduplication at scale
+Synthetic businesses listed by up to three sources with each source's own
+phone, name and address formatting; checks that the duplicates are found
+and reports time and peak memory against the budget below
+"""
+
+import os
+import random
+import resource
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scrapers.dedup import Deduplicator
+
+# Peak RSS allowed for 1M input records (indexes plus the benchmark's own
+# records, which are regenerated for the merge pass rather than kept)
+MEMORY_BUDGET_MB = 512
+
+WORDS = ['oak', 'harbour', 'liffey', 'temple', 'green', 'castle', 'bridge', 'market', 'royal', 'phoenix',
+         'granary', 'anchor', 'willow', 'copper', 'lantern', 'silver', 'meadow', 'northside', 'quay', 'abbey']
+TRADES = ['kitchen', 'dental', 'plumbing', 'cafe', 'hotel', 'electrical', 'solicitors', 'accountants', 'salon', 'builders']
+STREETS = ['main', 'high', 'church', 'abbey', 'dame', 'grafton', 'camden', 'parnell', 'capel', 'thomas']
+
+def business(i):
+    """Canonical fields for synthetic business i (phone and address unique up to 2.4M businesses)"""
+    rng = random.Random(i)
+    trade = rng.choice(TRADES)
+    street = i // 12000
+    return {
+        'name': f"{rng.choice(WORDS).title()} {rng.choice(WORDS).title()} {trade.title()}",
+        'number': (i // 24) % 500 + 1,
+        'street': WORDS[street % 20] + STREETS[street // 20 % 10],  # e.g. 'oakmain', one word
+        'district': i % 24 + 1,
+        'phone': f"{rng.choice(['1', '86', '87', '85'])}{1000000 + i}",
+        'category': trade,
+        'website': f"https://{trade}{i}.ie" if rng.random() < 0.6 else '',
+    }
+
+def listing(i, source):
+    """One source's version of business i"""
+    b = business(i)
+    local_phone = '0' + b['phone']
+    if source == 'google_places_api':
+        return {'name': b['name'], 'address': f"{b['number']} {b['street'].title()} Street, Dublin {b['district']}, Ireland",
+                'website': b['website'], 'phone': f"+353 {b['phone'][:-7]} {b['phone'][-7:-4]} {b['phone'][-4:]}",
+                'category': b['category'], 'location': 'Dublin, Ireland', 'rating': 4.2, 'reviews': 31,
+                'place_id': f"place_{i}", 'source': source}
+    if source == 'goldenpages.ie':
+        return {'name': f"The {b['name']} Ltd", 'address': f"{b['number']} {b['street'].title()} St., D{b['district']:02d}",
+                'website': '', 'phone': f"({local_phone[:-7]}) {local_phone[-7:]}", 'category': b['category'] + 's',
+                'location': 'Dublin', 'rating': None, 'reviews': None, 'place_id': '', 'source': source}
+    return {'name': b['name'].upper(), 'address': f"{b['number']} {b['street'].title()} St, Dublin {b['district']}",
+            'website': b['website'], 'phone': '', 'category': b['category'], 'location': 'Dublin',
+            'rating': None, 'reviews': None, 'place_id': '', 'source': source}
+
+def records(count):
+    """About count listings: every business on Places, ~half also on Golden Pages, ~third on Yell"""
+    i = 0
+    produced = 0
+    while produced < count:
+        yield listing(i, 'google_places_api')
+        produced += 1
+        if i % 2 == 0 and produced < count:
+            yield listing(i, 'goldenpages.ie')
+            produced += 1
+        if i % 3 == 0 and produced < count:
+            yield listing(i, 'yell.ie')
+            produced += 1
+        i += 1
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print("=== DEDUP BENCHMARK ===")
+    
+    deduplicator = Deduplicator()
+    start = time.perf_counter()
+    for record in records(count):
+        deduplicator.add(record)
+    indexed = time.perf_counter()
+    deduplicator.resolve()
+    resolved = time.perf_counter()
+    merged = sum(1 for _ in deduplicator.merge(records(count)))
+    finished = time.perf_counter()
+    
+    businesses = sum(1 for record in records(count) if record['source'] == 'google_places_api')
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    
+    print(f"   {count:,} records -> {merged:,} merged ({businesses:,} distinct businesses)")
+    print(f"   index {indexed - start:.1f}s, resolve {resolved - indexed:.1f}s, merge {finished - resolved:.1f}s "
+          f"({count / (finished - start):,.0f} records/s)")
+    print(f"   peak RSS {peak_mb:.0f} MB (budget {MEMORY_BUDGET_MB * count / 1_000_000:.0f} MB)")
+    
+    assert merged == businesses, "duplicates missed or over-merged"
+    assert peak_mb <= max(MEMORY_BUDGET_MB * count / 1_000_000, 100), "over memory budget"
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Benchmark: repeat website analysis with the conditional-revalidation cache
+First run downloads every page, second run should get 304s for all of them
+"""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from analysis.website_analyzer import analyze_businesses_from_csv
+from analysis.http_cache import AnalysisCache
+from benchmarks.fake_websites_server import start_fake_websites_server, fake_businesses
+
+def main():
+    count = 100
+    server, port = start_fake_websites_server(latency=0.05)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        input_file = os.path.join(tmp, 'businesses.csv')
+        pd.DataFrame(fake_businesses(port, count)).to_csv(input_file, index=False)
+        cache = AnalysisCache(os.path.join(tmp, 'analysis_cache.db'))
+        
+        print(f"=== HTTP CACHE BENCHMARK ({count} businesses) ===")
+        outputs = []
+        for run in ('Cold', 'Warm'):
+            output = os.path.join(tmp, f'{run}.csv')
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                analyze_businesses_from_csv(input_file, output, cache=cache)
+            elapsed = time.perf_counter() - start
+            with open(output) as f:
+                outputs.append(f.read())
+            stats = cache.stats()
+            print(f"   {run}: {elapsed:.2f}s, {stats['revalidated']} revalidated, "
+                  f"{stats['bytes_saved']} bytes saved so far")
+        
+        assert outputs[0] == outputs[1], "Cached analysis differs from fresh analysis"
+        print(f"   Server 304 responses: {server.not_modified}")
+        cache.close()
+    
+    server.shutdown()
+
+if __name__ == "__main__":
+    main()
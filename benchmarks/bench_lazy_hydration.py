@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Place Details calls and latency with lazy hydration
+Full mode fetches Details for every Text Search hit; lazy mode only for hits
+passing a filter; search-only mode fetches none
+"""
+
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scrapers.google_maps_api import GoogleMapsPlacesScraper
+from scrapers.hydrate import min_rating
+from benchmarks.fake_places_server import start_fake_places_server, point_scraper_at
+
+def main():
+    latency = 0.05
+    server, base_url = start_fake_places_server(place_count=60, latency=latency)
+    
+    print(f"=== LAZY HYDRATION BENCHMARK (60 results, {latency*1000:.0f}ms per request) ===")
+    modes = [
+        ('full (every hit)', {}),
+        ('lazy, rating >= 4.5', {'where': min_rating(4.5)}),
+        ('search only', {'hydrate': False}),
+    ]
+    for label, options in modes:
+        scraper = point_scraper_at(GoogleMapsPlacesScraper('fake_key', details_concurrency=4), base_url)
+        scraper.PAGE_TOKEN_DELAY = 0  # The fake server's tokens are valid immediately
+        server.request_counts.clear()
+        
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            businesses = scraper.search_businesses('restaurants', max_results=60, **options)
+        elapsed = time.perf_counter() - start
+        
+        details_calls = sum(count for path, count in server.request_counts.items() if path.endswith('/details/json'))
+        hydrated = sum(1 for business in businesses if not business['needs_details'])
+        print(f"   {label:<20}: {len(businesses)} records ({hydrated} with website/phone), "
+              f"{details_calls} Details calls, {elapsed:.2f}s")
+    
+    server.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Benchmark: directory listing parsing, full html.parser vs lxml + SoupStrainer
+Parses saved Golden Pages and Yell results pages
+"""
+
+import contextlib
+import io
+import os
+import sys
+import time
+
+from bs4 import BeautifulSoup
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scrapers.golden_pages_scraper import parse_golden_pages, extract_golden_pages_info
+from scrapers.yell_scraper import parse_yell, extract_yell_info
+
+LISTINGS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'listings')
+
+def legacy_golden_pages(html, query, max_results=20):
+    """The original search_golden_pages parsing, kept as the reference"""
+    soup = BeautifulSoup(html, 'html.parser')
+    listings = soup.find_all('div', {'class': ['listing', 'result']})
+    if not listings:
+        listings = soup.find_all('article', {'class': 'listing'})
+    return [b for b in (extract_golden_pages_info(l, query) for l in listings[:max_results]) if b]
+
+def legacy_yell(html, query, max_results=10):
+    """The original search_yell parsing, kept as the reference"""
+    soup = BeautifulSoup(html, 'html.parser')
+    listings = soup.find_all('div', {'class': 'businessCapsule'})
+    return [b for b in (extract_yell_info(l, query) for l in listings[:max_results]) if b]
+
+def time_parser(parser, html, rounds):
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(rounds):
+            parser(html, 'test', 50)
+    return (time.perf_counter() - start) / rounds
+
+def main():
+    cases = [
+        ('Golden Pages', 'golden_pages_restaurants.html', legacy_golden_pages, parse_golden_pages),
+        ('Yell', 'yell_dentists.html', legacy_yell, parse_yell),
+    ]
+    rounds = 50
+    
+    print("=== LISTING PARSE BENCHMARK ===")
+    for label, filename, legacy, fast in cases:
+        with open(os.path.join(LISTINGS, filename), encoding='utf-8') as f:
+            html = f.read()
+        
+        with contextlib.redirect_stdout(io.StringIO()):
+            expected = legacy(html, 'test', 50)
+            got = fast(html, 'test', 50)
+        assert got == expected, f"{label}: fields differ from html.parser output"
+        
+        legacy_time = time_parser(legacy, html, rounds)
+        fast_time = time_parser(fast, html, rounds)
+        print(f"   {label} ({len(expected)} listings): html.parser {legacy_time*1000:.1f} ms, "
+              f"lxml+strainer {fast_time*1000:.1f} ms ({legacy_time/fast_time:.1f}x)")
+
+if __name__ == "__main__":
+    main()
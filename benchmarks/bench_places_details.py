@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Benchmark: serial vs concurrent Place Details fetching
+Runs against a local fake Places endpoint - no API key or network needed
+"""
+
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scrapers.google_maps_api import GoogleMapsPlacesScraper
+from benchmarks.fake_places_server import start_fake_places_server, point_scraper_at
+from utils.http_client import print_connection_stats
+
+def run(concurrency, base_url, max_results):
+    scraper = point_scraper_at(GoogleMapsPlacesScraper('fake_key', details_concurrency=concurrency), base_url)
+    start = time.perf_counter()
+    businesses = scraper.search_businesses('restaurants', max_results=max_results)
+    elapsed = time.perf_counter() - start
+    return businesses, elapsed
+
+def main():
+    latency = 0.1
+    max_results = 20
+    server, base_url = start_fake_places_server(place_count=max_results, latency=latency)
+    
+    print(f"=== PLACE DETAILS BENCHMARK ({max_results} results, {latency*1000:.0f}ms per request) ===")
+    baseline = None
+    for concurrency in (1, 4, 8, 20):
+        businesses, elapsed = run(concurrency, base_url, max_results)
+        names = [b['name'] for b in businesses]
+        if baseline is None:
+            baseline = (names, elapsed)
+        assert names == baseline[0], "Concurrent results out of order"
+        print(f"   concurrency={concurrency:>2}: {elapsed:.2f}s ({baseline[1]/elapsed:.1f}x)")
+    
+    print_connection_stats()
+    server.shutdown()
+
+if __name__ == "__main__":
+    main()
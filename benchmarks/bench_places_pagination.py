@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Places pagination with a 60-result query
+Page token waits overlap with Place Details fetching
+"""
+
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scrapers.google_maps_api import GoogleMapsPlacesScraper
+from benchmarks.fake_places_server import start_fake_places_server, point_scraper_at
+
+def main():
+    latency = 0.1
+    token_delay = 2.0
+    server, base_url = start_fake_places_server(place_count=60, latency=latency, token_delay=token_delay)
+    
+    # Serial details with no token overlap would cost about:
+    # 3 search pages + 60 details calls + 2 full token waits
+    serial_estimate = (3 + 60) * latency + 2 * token_delay
+    
+    scraper = point_scraper_at(GoogleMapsPlacesScraper('fake_key', details_concurrency=8), base_url)
+    start = time.perf_counter()
+    businesses = scraper.search_businesses('restaurants', max_results=60)
+    elapsed = time.perf_counter() - start
+    
+    print(f"=== PAGINATION BENCHMARK (60 results, {latency*1000:.0f}ms per request, {token_delay:.0f}s token delay) ===")
+    print(f"   Businesses: {len(businesses)}")
+    print(f"   Search requests: {server.request_counts.get('/maps/api/place/textsearch/json', 0)}")
+    print(f"   Serial estimate: {serial_estimate:.2f}s")
+    print(f"   Pipelined: {elapsed:.2f}s")
+    
+    server.shutdown()
+
+if __name__ == "__main__":
+    main()
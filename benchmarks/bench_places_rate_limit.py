@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Benchmark: shared adaptive rate limiting against a quota-enforcing fake Places API
+Several worker processes fetch Place Details through one SharedTokenBucket
+file; the fake server allows QPS_LIMIT requests per second and answers the
+rest with OVER_QUERY_LIMIT
+"""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scrapers.google_maps_api import GoogleMapsPlacesScraper
+from benchmarks.fake_places_server import start_fake_places_server, point_scraper_at
+from utils.rate_limit import SharedTokenBucket
+
+QPS_LIMIT = 40
+WORKERS = 3
+PLACES_PER_WORKER = 200
+
+def worker(base_url, limiter_path, start_rate, max_rate, min_rate):
+    """One scraper process; returns how many details it got"""
+    limiter = SharedTokenBucket(limiter_path, rate=start_rate, max_rate=max_rate, min_rate=min_rate)
+    scraper = point_scraper_at(GoogleMapsPlacesScraper('fake_key', details_concurrency=8), base_url, limiter)
+    place_ids = [f'fake_{i}' for i in range(PLACES_PER_WORKER)]
+    with contextlib.redirect_stdout(io.StringIO()):
+        return sum(1 for details in scraper.get_places_details(place_ids) if details)
+
+def run(label, start_rate, max_rate, min_rate=0.2):
+    server, base_url = start_fake_places_server(latency=0.02, qps_limit=QPS_LIMIT)
+    limiter_path = os.path.join(tempfile.mkdtemp(prefix='bench_rate_'), 'rate.json')
+    
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=WORKERS) as pool:
+        futures = [pool.submit(worker, base_url, limiter_path, start_rate, max_rate, min_rate) for _ in range(WORKERS)]
+        fetched = sum(future.result() for future in futures)
+    elapsed = time.perf_counter() - start
+    
+    final_rate = SharedTokenBucket(limiter_path, rate=start_rate).rate()
+    print(f"   {label}: {fetched}/{WORKERS * PLACES_PER_WORKER} details in {elapsed:.1f}s "
+          f"({fetched / elapsed:.1f}/s of {QPS_LIMIT}/s quota), {server.rejected} OVER_QUERY_LIMIT, "
+          f"rate ended at {final_rate:.1f}/s")
+    server.shutdown()
+
+def main():
+    print(f"=== PLACES RATE LIMIT BENCHMARK ({WORKERS} processes, quota {QPS_LIMIT}/s) ===")
+    run("fixed 10/s (hand-tuned)", 10, 10, min_rate=10)
+    run("adaptive, up to 100/s  ", 10, 100)
+    run("no limit (retries only)", 100_000, 100_000, min_rate=100_000)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Benchmark: process-pool scoring throughput vs worker count
+Replays the saved homepage corpus (padded to 1.5 MB) through ScoringPool
+"""
+
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from analysis.scoring_pool import ScoringPool
+from analysis.feature_extractor import score_html
+from benchmarks.bench_website_scoring import load_corpus
+
+def main():
+    corpus = load_corpus()
+    pages = [('https://example.ie', html) for _, html in corpus] * 8
+    expected = [score_html(url, html) for url, html in pages[:len(corpus)]]
+    total_mb = sum(len(html) for _, html in pages) / 1_000_000
+    
+    cores = os.cpu_count() or 1
+    counts = sorted({1, 2, 4, 8, 16, cores})
+    print(f"=== SCORING POOL BENCHMARK ({len(pages)} pages, {total_mb:.0f} MB, {cores} cores) ===")
+    
+    baseline = None
+    for workers in counts:
+        with ScoringPool(workers, batch_size=4) as pool:
+            pool.score(pages[:workers])  # Warm up the worker processes
+            start = time.perf_counter()
+            records = pool.score(pages)
+            elapsed = time.perf_counter() - start
+        
+        got = [(r['score'], r['details']) for r in records[:len(corpus)]]
+        assert got == expected, "Pool scores differ from in-process scoring"
+        
+        rate = len(pages) / elapsed
+        baseline = baseline or rate
+        print(f"   workers={workers:>2}: {rate:.1f} pages/s ({total_mb/elapsed:.0f} MB/s, {rate/baseline:.1f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Benchmark: tiled Text Search coverage vs. API calls
+The fake Places server holds more businesses than one 60-result search can
+return; each row lets the planner subdivide capped tiles one level deeper
+"""
+
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scrapers.google_maps_api import GoogleMapsPlacesScraper
+from scrapers.tile_planner import TilePlanner
+from benchmarks.fake_places_server import start_fake_places_server, point_scraper_at
+
+PLACE_COUNT = 3000
+
+def main():
+    server, base_url = start_fake_places_server(place_count=PLACE_COUNT, latency=0.01)
+    scraper = point_scraper_at(GoogleMapsPlacesScraper('fake_key'), base_url)
+    scraper.PAGE_TOKEN_DELAY = 0  # The fake server's tokens are valid immediately
+    
+    print(f"=== TILE PLANNER BENCHMARK ({PLACE_COUNT} places in County Dublin) ===")
+    with contextlib.redirect_stdout(io.StringIO()):
+        results, pages = scraper.text_search('plumbers')
+    print(f"   single search:  {pages:>4} search calls, {len(results):>4} places ({len(results)/PLACE_COUNT*100:5.1f}%)")
+    
+    for max_depth in range(0, 5):
+        planner = TilePlanner(scraper, 'plumbers', tile_km=5.0, max_depth=max_depth, concurrency=8)
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            places = planner.run()
+        elapsed = time.perf_counter() - start
+        last = planner.levels[-1]
+        print(f"   max depth {max_depth}:    {last['search_calls']:>4} search calls, {len(places):>4} places "
+              f"({len(places)/PLACE_COUNT*100:5.1f}%), {last['capped_tiles'] if max_depth == last['depth'] else 0} tiles still capped, {elapsed:.1f}s")
+    
+    server.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark: website analysis with and without the HEAD triage pass
+80 sites on the fake server: plain homepages, sites that redirect to another
+homepage, 3MB PDF menus, and "websites" that are (or redirect to) a Facebook
+page, which the fake server also serves
+"""
+
+import contextlib
+import io
+import os
+import shutil
+import socket
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from analysis.website_analyzer import analyze_businesses_from_csv
+from benchmarks.fake_websites_server import HOMEPAGES, start_fake_websites_server
+from utils.metrics import METRICS
+
+PDF_BYTES = 3_000_000
+
+def build_rows(port):
+    websites = []
+    for i in range(40):
+        websites.append(f'http://127.0.0.{1 + i}:{port}/modern_dental.html')
+    for i in range(10):
+        moved_to = f'http://127.0.0.{41 + i}:{port}/wordpress_restaurant.html'
+        websites.append(f'http://127.0.0.{1 + i}:{port}/redirect?to={moved_to}')
+    for i in range(15):
+        websites.append(f'http://127.0.0.{11 + i}:{port}/menu.pdf')
+    for i in range(10):
+        websites.append(f'http://127.0.0.{26 + i}:{port}/redirect?to=http://www.facebook.com:{port}/large_hotel.html')
+    for i in range(5):
+        websites.append(f'http://www.facebook.com:{port}/large_hotel.html')
+
+    return [{'name': f'Business {i}', 'address': f'{i} Fake Street, Dublin 2', 'website': website,
+             'phone': '(01) 555 0100', 'category': 'restaurant', 'location': 'Dublin, Ireland'}
+            for i, website in enumerate(websites)]
+
+def fake_facebook_dns():
+    """Point www.facebook.com at the fake server so the untriaged run can fetch it"""
+    real = socket.getaddrinfo
+
+    def getaddrinfo(host, *args, **kwargs):
+        return real('127.0.0.1' if host == 'www.facebook.com' else host, *args, **kwargs)
+    socket.getaddrinfo = getaddrinfo
+
+def run(server, input_file, output_file, triage):
+    requests_before = server.request_count
+    bytes_before = METRICS.total('website_bytes_total')
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        df = analyze_businesses_from_csv(input_file, output_file, concurrency=8, resolve_dns=False, triage=triage)
+    elapsed = time.perf_counter() - start
+    downloaded = METRICS.total('website_bytes_total') - bytes_before
+    return elapsed, server.request_count - requests_before, downloaded, df
+
+def main():
+    fake_facebook_dns()
+    with tempfile.TemporaryDirectory() as tmp:
+        site_dir = os.path.join(tmp, 'sites')
+        shutil.copytree(HOMEPAGES, site_dir)
+        with open(os.path.join(site_dir, 'menu.pdf'), 'wb') as f:
+            f.write(b'%PDF-1.4\n' + b'0' * PDF_BYTES)
+        server, port = start_fake_websites_server(latency=0.05, directory=site_dir)
+
+        rows = build_rows(port)
+        input_file = os.path.join(tmp, 'businesses.csv')
+        pd.DataFrame(rows).to_csv(input_file, index=False)
+
+        print(f"=== TRIAGE BENCHMARK ({len(rows)} sites: 40 homepages, 10 redirected, "
+              f"15 PDF menus, 15 Facebook pages) ===")
+        results = {}
+        for label, triage in (('No triage', False), ('Triage', True)):
+            elapsed, requests_sent, downloaded, df = run(server, input_file, os.path.join(tmp, f'{triage}.csv'), triage)
+            results[triage] = df
+            print(f"   {label:10s} {elapsed:5.2f}s, {requests_sent:3d} requests, {downloaded/1e6:5.1f} MB downloaded, "
+                  f"{int(df['has_website'].sum())} counted as websites")
+
+        triaged = results[True]
+        print(f"   Classified by triage: "
+              f"{triaged['analysis_details'].str.startswith('Social media').sum()} social-only, "
+              f"{triaged['analysis_details'].str.startswith('Not a web page').sum()} non-HTML, "
+              f"{(triaged['redirect_chain'] != '').sum()} redirect chains recorded")
+
+        # Plain homepages score the same either way
+        plain = triaged['original_website'].str.endswith('modern_dental.html')
+        assert results[False][plain]['score'].tolist() == triaged[plain]['score'].tolist(), "homepage scores differ"
+        server.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Benchmark: serial vs concurrent analyze_businesses_from_csv
+Fetches saved homepages from a local fake server spread over loopback hosts
+"""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from analysis.website_analyzer import analyze_businesses_from_csv
+from benchmarks.fake_websites_server import start_fake_websites_server, fake_businesses
+
+def run(input_file, output_file, **kwargs):
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        analyze_businesses_from_csv(input_file, output_file, **kwargs)
+    return time.perf_counter() - start
+
+def main():
+    latency = 0.2
+    count = 100
+    server, port = start_fake_websites_server(latency=latency)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        input_file = os.path.join(tmp, 'businesses.csv')
+        pd.DataFrame(fake_businesses(port, count)).to_csv(input_file, index=False)
+        
+        print(f"=== WEBSITE ANALYSIS BENCHMARK ({count} businesses, {latency*1000:.0f}ms per page) ===")
+        serial_output = os.path.join(tmp, 'serial.csv')
+        serial = run(input_file, serial_output, concurrency=1)
+        print(f"   Serial:         {serial:.2f}s")
+        
+        for concurrency in (8, 32):
+            output = os.path.join(tmp, f'concurrent_{concurrency}.csv')
+            elapsed = run(input_file, output, concurrency=concurrency)
+            with open(serial_output) as a, open(output) as b:
+                assert a.read() == b.read(), "Concurrent output differs from serial"
+            print(f"   concurrency={concurrency:>2}: {elapsed:.2f}s ({serial/elapsed:.1f}x)")
+        
+        # Fetch threads + process-pool scoring must give the same output
+        output = os.path.join(tmp, 'split.csv')
+        elapsed = run(input_file, output, concurrency=32, scoring_workers=2)
+        with open(serial_output) as a, open(output) as b:
+            assert a.read() == b.read(), "Split fetch/score output differs from serial"
+        print(f"   split (32 fetchers, 2 scorers): {elapsed:.2f}s ({serial/elapsed:.1f}x)")
+    
+    server.shutdown()
+
+if __name__ == "__main__":
+    main()
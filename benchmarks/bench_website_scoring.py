@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Benchmark: website scoring, legacy per-signal lowercasing vs feature extractor
+Scores saved homepages at their own size and padded to 1-2 MB
+"""
+
+import glob
+import os
+import re
+import sys
+import time
+from datetime import datetime
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from analysis.feature_extractor import score_html
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'homepages')
+
+def legacy_score(url, html):
+    """The original analyze_website scoring, kept as the reference"""
+    score = 0
+    details = []
+
+    # 1. HTTPS/SSL (2 points)
+    if url.startswith('https://'):
+        score += 2
+        details.append('HTTPS/SSL: +2')
+
+    # 2. Mobile friendly check (3 points)
+    if 'viewport' in html.lower():
+        score += 3
+        details.append('Mobile viewport: +3')
+
+    # 3. Modern framework detection (3 points)
+    modern_frameworks = ['react', 'vue', 'angular', 'next.js', 'nuxt.js', 'svelte']
+    if any(framework in html.lower() for framework in modern_frameworks):
+        score += 3
+        details.append('Modern framework: +3')
+
+    # 4. Old tech detection (negative indicators)
+    old_tech = ['jquery', 'flash', 'marquee', '<table> for layout', 'frameset']
+    old_tech_found = []
+    for tech in old_tech:
+        if tech in html.lower():
+            old_tech_found.append(tech)
+
+    if old_tech_found:
+        details.append(f'Old tech found: {", ".join(old_tech_found)}')
+        # Don't subtract, just don't add points
+
+    # 5. Copyright year check (3 points if recent)
+    current_year = datetime.now().year
+    copyright_pattern = r'copyright.*?(\d{4})'
+    match = re.search(copyright_pattern, html.lower())
+    if match:
+        year = int(match.group(1))
+        if year >= current_year - 2:  # Updated in last 2 years
+            score += 3
+            details.append(f'Recent copyright ({year}): +3')
+
+    # 6. Image optimization check (2 points)
+    img_tags = len(re.findall(r'<img', html.lower()))
+    if img_tags > 0:
+        # Check for alt attributes (accessibility)
+        alt_imgs = len(re.findall(r'alt=', html.lower()))
+        if alt_imgs / max(img_tags, 1) > 0.5:  # More than 50% have alt
+            score += 2
+            details.append('Good image alt text: +2')
+
+    # 7. Contact info detection (2 points)
+    contact_patterns = [
+        r'contact.*?form', r'@.*?\.(com|ie|eu)', r'phone', r'tel:', r'email'
+    ]
+    contact_found = sum(1 for pattern in contact_patterns if re.search(pattern, html.lower()))
+    if contact_found >= 2:
+        score += 2
+        details.append('Contact info present: +2')
+
+    # 8. Social media links (2 points)
+    social_patterns = ['facebook.com', 'twitter.com', 'instagram.com', 'linkedin.com']
+    social_found = sum(1 for pattern in social_patterns if pattern in html.lower())
+    if social_found >= 1:
+        score += 2
+        details.append(f'Social media links: +2')
+
+    # 9. Professional design indicators (3 points)
+    # Check for CSS frameworks, good structure
+    css_indicators = ['bootstrap', 'tailwind', 'material', 'font-awesome', 'google-fonts']
+    if any(indicator in html.lower() for indicator in css_indicators):
+        score += 3
+        details.append('CSS framework: +3')
+
+    # Cap score at 30
+    score = min(score, 30)
+    
+    return score, details
+
+def load_corpus(pad_to_bytes=1_500_000):
+    """Load saved pages plus large versions padded with repeated body text"""
+    corpus = []
+    for path in sorted(glob.glob(os.path.join(FIXTURES, '*.html'))):
+        with open(path, encoding='utf-8') as f:
+            html = f.read()
+        name = os.path.basename(path)
+        corpus.append((name, html))
+        
+        # Pad in the middle so header and footer signals stay where they were
+        middle = html.find('<body')
+        filler = '<div class="row"><p>Lorem ipsum dolor sit amet, Dublin services.</p></div>\n'
+        padding = filler * (pad_to_bytes // len(filler))
+        corpus.append((f'{name} (padded)', html[:middle] + padding + html[middle:]))
+    return corpus
+
+def time_scorer(scorer, corpus, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for name, html in corpus:
+            scorer('https://example.ie', html)
+    return (time.perf_counter() - start) / rounds
+
+def main():
+    corpus = load_corpus()
+    
+    # Results must be identical before timing means anything
+    for name, html in corpus:
+        for url in ('https://example.ie', 'http://example.ie'):
+            assert score_html(url, html) == legacy_score(url, html), f"Score mismatch on {name}"
+    
+    total_mb = sum(len(html) for _, html in corpus) / 1_000_000
+    rounds = 5
+    legacy = time_scorer(legacy_score, corpus, rounds)
+    extracted = time_scorer(score_html, corpus, rounds)
+    
+    print(f"=== SCORING BENCHMARK ({len(corpus)} pages, {total_mb:.1f} MB) ===")
+    print(f"   Legacy scans: {legacy*1000:.1f} ms per corpus")
+    print(f"   Extractor:    {extracted*1000:.1f} ms per corpus ({legacy/extracted:.1f}x)")
+
+if __name__ == "__main__":
+    main()
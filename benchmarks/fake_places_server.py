@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the Google Places API
+Serves Text Search and Place Details JSON with configurable latency and,
+optionally, a per-second quota answered with OVER_QUERY_LIMIT
+"""
+
+import json
+import math
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from collections import deque
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.rate_limit import SharedTokenBucket
+
+# Fake places cluster around the city centre and thin out towards the county edge
+CITY_CENTRE = (53.3498, -6.2603)
+COUNTY_BBOX = (53.20, -6.45, 53.63, -6.04)
+
+def make_places(count):
+    """Build fake place results with a location in County Dublin"""
+    rng = random.Random(42)
+    places = []
+    for i in range(count):
+        if rng.random() < 0.7:
+            lat, lng = rng.gauss(CITY_CENTRE[0], 0.03), rng.gauss(CITY_CENTRE[1], 0.05)
+        else:
+            lat, lng = rng.uniform(COUNTY_BBOX[0], COUNTY_BBOX[2]), rng.uniform(COUNTY_BBOX[1], COUNTY_BBOX[3])
+        places.append({'place_id': f'fake_{i}', 'name': f'Fake Business {i}',
+                       'formatted_address': f'{i} Fake Street, Dublin 2, Ireland',
+                       'rating': round(rng.uniform(3.0, 5.0), 1), 'user_ratings_total': rng.randint(0, 400),
+                       'types': ['restaurant', 'establishment'],
+                       'geometry': {'location': {'lat': lat, 'lng': lng}}})
+    return places
+
+def places_near(places, location, radius):
+    """Places within radius metres of 'lat,lng', nearest first (a strict version of the API's bias)"""
+    lat, lng = (float(part) for part in location.split(','))
+    metres_per_degree = 111_320
+    nearby = []
+    for place in places:
+        point = place['geometry']['location']
+        dy = (point['lat'] - lat) * metres_per_degree
+        dx = (point['lng'] - lng) * metres_per_degree * math.cos(math.radians(lat))
+        distance = math.hypot(dx, dy)
+        if distance <= radius:
+            nearby.append((distance, place))
+    return [place for _, place in sorted(nearby, key=lambda item: item[0])]
+
+class FakePlacesHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        server = self.server
+        url = urlparse(self.path)
+        params = {k: v[0] for k, v in parse_qs(url.query).items()}
+        
+        with server.lock:
+            server.request_counts[url.path] = server.request_counts.get(url.path, 0) + 1
+            over_quota = server.qps_limit and not self._within_quota(server)
+        time.sleep(server.latency)
+        
+        if over_quota:
+            data = {'status': 'OVER_QUERY_LIMIT', 'results': []}
+        elif url.path.endswith('/textsearch/json'):
+            token = params.get('pagetoken')
+            with server.lock:
+                issued = server.tokens_issued.get(token)
+            
+            if token and (issued is None or time.monotonic() - issued < server.token_delay):
+                # Like the real API, a page token is rejected until it matures
+                data = {'status': 'INVALID_REQUEST', 'results': []}
+            else:
+                # Tokens carry the page number plus the location filter they belong to
+                page = int((token or '0').split('|')[0])
+                places = server.places
+                if params.get('location'):
+                    places = places_near(places, params['location'], float(params.get('radius', 50_000)))
+                start = page * 20
+                results = places[start:start + 20]
+                data = {'status': 'OK' if results else 'ZERO_RESULTS', 'results': results}
+                # Like the real API, no more than 60 results (3 pages) per search
+                if start + 20 < min(len(places), 60):
+                    data['next_page_token'] = f"{page + 1}|{params.get('location', '')}|{params.get('radius', '')}"
+                    with server.lock:
+                        server.tokens_issued.setdefault(data['next_page_token'], time.monotonic())
+        elif url.path.endswith('/details/json'):
+            place_id = params.get('place_id', '')
+            data = {
+                'status': 'OK',
+                'result': {
+                    'name': place_id.replace('fake_', 'Fake Business '),
+                    'formatted_address': '1 Fake Street, Dublin 2, Ireland',
+                    'website': f'https://{place_id}.ie',
+                    'formatted_phone_number': '(01) 555 0100',
+                    'types': ['restaurant', 'establishment'],
+                    'rating': 4.2,
+                    'user_ratings_total': 42
+                }
+            }
+        else:
+            self.send_error(404)
+            return
+        
+        body = json.dumps(data).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    @staticmethod
+    def _within_quota(server):
+        """Sliding one-second window of accepted requests (call under server.lock)"""
+        now = time.monotonic()
+        while server.accepted and now - server.accepted[0] >= 1.0:
+            server.accepted.popleft()
+        if len(server.accepted) >= server.qps_limit:
+            server.rejected += 1
+            return False
+        server.accepted.append(now)
+        return True
+    
+    def log_message(self, format, *args):
+        pass
+
+def start_fake_places_server(place_count=60, latency=0.1, token_delay=0.0, qps_limit=None):
+    """Start the fake server in a background thread, returns (server, base_url)"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FakePlacesHandler)
+    server.daemon_threads = True
+    server.places = make_places(place_count)
+    server.latency = latency
+    server.token_delay = token_delay
+    server.tokens_issued = {}
+    server.lock = threading.Lock()
+    server.request_counts = {}
+    server.qps_limit = qps_limit
+    server.accepted = deque()
+    server.rejected = 0
+    
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/maps/api/place"
+    return server, base_url
+
+def point_scraper_at(scraper, base_url, limiter=None):
+    """Redirect a GoogleMapsPlacesScraper to the fake server, with its own limiter (unlimited by default)"""
+    scraper.base_url = f"{base_url}/textsearch/json"
+    scraper.details_url = f"{base_url}/details/json"
+    if limiter is None:
+        path = os.path.join(tempfile.mkdtemp(prefix='fake_places_'), 'rate.json')
+        limiter = SharedTokenBucket(path, rate=1_000_000, capacity=1_000_000)
+    scraper.limiter = limiter
+    return scraper
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for business websites
+Serves the saved homepages in fixtures/homepages with configurable latency.
+Binds all loopback addresses so 127.0.0.N can act as N different hosts.
+/redirect?to=<url> answers 301 to url.
+"""
+
+import functools
+import os
+import threading
+import time
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+from urllib.parse import parse_qs, urlsplit
+
+HOMEPAGES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'homepages')
+
+class FakeWebsiteHandler(SimpleHTTPRequestHandler):
+    def do_GET(self):
+        with self.server.lock:
+            self.server.request_count += 1
+        time.sleep(self.server.latency)
+        
+        # ETag from size + mtime; SimpleHTTPRequestHandler already handles If-Modified-Since
+        self.etag = None
+        path = self.translate_path(self.path)
+        if os.path.isfile(path):
+            stat = os.stat(path)
+            self.etag = f'"{stat.st_size:x}-{int(stat.st_mtime):x}"'
+            if self.headers.get('If-None-Match') == self.etag:
+                with self.server.lock:
+                    self.server.not_modified += 1
+                self.send_response(304)
+                self.end_headers()
+                return
+        super().do_GET()
+    
+    def do_HEAD(self):
+        with self.server.lock:
+            self.server.request_count += 1
+            self.server.head_count += 1
+        time.sleep(self.server.latency)
+        super().do_HEAD()
+    
+    def send_head(self):
+        # /redirect?to=<url> stands in for a site that moved (http -> https, new domain, Facebook page)
+        parts = urlsplit(self.path)
+        if parts.path == '/redirect':
+            self.send_response(301)
+            self.send_header('Location', parse_qs(parts.query)['to'][0])
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return None
+        return super().send_head()
+    
+    def end_headers(self):
+        if getattr(self, 'etag', None):
+            self.send_header('ETag', self.etag)
+        super().end_headers()
+    
+    def log_message(self, format, *args):
+        pass
+
+def start_fake_websites_server(latency=0.1, directory=HOMEPAGES):
+    """Start the fake server in a background thread, returns (server, port)"""
+    handler = functools.partial(FakeWebsiteHandler, directory=directory)
+    server = ThreadingHTTPServer(('0.0.0.0', 0), handler)
+    server.daemon_threads = True
+    server.latency = latency
+    server.lock = threading.Lock()
+    server.request_count = 0
+    server.not_modified = 0
+    server.head_count = 0
+    
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, server.server_address[1]
+
+def fake_businesses(port, count, hosts=50):
+    """Business rows whose websites point at the fake server, spread over loopback hosts"""
+    pages = sorted(name for name in os.listdir(HOMEPAGES) if name.endswith('.html'))
+    rows = []
+    for i in range(count):
+        website = f"http://127.0.0.{1 + i % hosts}:{port}/{pages[i % len(pages)]}"
+        if i % 7 == 0:
+            website = 'NO_WEBSITE'
+        rows.append({
+            'name': f'Fake Business {i}',
+            'address': f'{i} Fake Street, Dublin 2',
+            'website': website,
+            'phone': '(01) 555 0100',
+            'category': 'restaurant',
+            'location': 'Dublin, Ireland'
+        })
+    return rows
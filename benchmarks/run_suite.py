@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+"""
+Offline micro-benchmark suite for the parsing, scoring and persistence hot paths
+Runs on the checked-in corpora in benchmarks/fixtures (Places JSON, Golden
+Pages and Yell listing pages, homepages of varied size) with no network,
+and compares each throughput against benchmarks/baseline.json:
+
+    python3 benchmarks/run_suite.py                  # compare, exit 1 on a regression
+    python3 benchmarks/run_suite.py --save-baseline  # record this machine's numbers
+    python3 benchmarks/run_suite.py --only scoring --tolerance 0.15
+
+Baselines are per setup - hardware, Python, pyarrow on or off and library
+versions (see machine()) - and one file holds any number of them. A run
+with no baseline for its setup compares nothing and exits 2; record one
+with --save-baseline on the box that runs the nightly jobs.
+"""
+
+import argparse
+import contextlib
+import gc
+import glob
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from importlib.metadata import PackageNotFoundError, version
+
+import pandas as pd
+from bs4 import BeautifulSoup
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from analysis.website_analyzer import fetch_features, CHUNK_SIZE
+from analysis.feature_extractor import score_features
+from scrapers import golden_pages_scraper, yell_scraper, sources
+from scrapers.google_maps_api import GoogleMapsPlacesScraper
+from utils.html_parsing import HTML_PARSER
+from utils.lead_store import BUSINESS_SCHEMA, COLUMNAR, TableWriter, load_table, save_table
+from utils.rate_limit import SharedTokenBucket
+
+BENCHMARKS = os.path.dirname(os.path.abspath(__file__))
+FIXTURES = os.path.join(BENCHMARKS, 'fixtures')
+BASELINE_FILE = os.path.join(BENCHMARKS, 'baseline.json')
+
+# Slower than baseline by more than this fraction counts as a regression
+TOLERANCE = 0.25
+
+# Rows written and read back by the persistence cases
+PERSISTENCE_ROWS = 20_000
+
+# Libraries whose versions change what the cases run (a baseline is only valid for these)
+BASELINE_LIBRARIES = ['pandas', 'numpy', 'pyarrow', 'beautifulsoup4', 'lxml']
+
+# Exit code when there is no baseline for this setup
+NO_BASELINE = 2
+
+def read_fixture(*parts):
+    with open(os.path.join(FIXTURES, *parts), encoding='utf-8') as f:
+        return f.read()
+
+class FixtureResponse:
+    """Just enough of a streamed requests.Response for fetch_features()"""
+    
+    def __init__(self, body):
+        self.body = body
+        self.encoding = 'utf-8'
+    
+    def iter_content(self, chunk_size=CHUNK_SIZE):
+        for start in range(0, len(self.body), chunk_size):
+            yield self.body[start:start + chunk_size]
+    
+    def close(self):
+        pass
+
+def offline_scraper(tmp):
+    """Places client that never touches the network or the shared rate-limit file"""
+    return GoogleMapsPlacesScraper('offline', limiter=SharedTokenBucket(os.path.join(tmp, 'rate_limit.json')))
+
+def places_results():
+    return [place for page in json.loads(read_fixture('places', 'textsearch_pages.json')) for place in page['results']]
+
+def business_records(tmp, count):
+    """count unified records built from the Places Details fixtures"""
+    details = json.loads(read_fixture('places', 'details_responses.json'))
+    scraper = offline_scraper(tmp)
+    records = []
+    for i in range(count):
+        result = details[i % len(details)]['result']
+        records.append({
+            'name': f"{result['name']} {i}",
+            'address': result['formatted_address'],
+            'website': result.get('website', ''),
+            'phone': result['formatted_phone_number'],
+            'category': scraper._determine_category(result['types']),
+            'location': 'Dublin, Ireland',
+            'rating': result['rating'],
+            'reviews': result['user_ratings_total'],
+            'place_id': f"fixture_{i}",
+            'source': 'google_places_api',
+            'needs_details': False,
+        })
+    return records
+
+# Each case builds its inputs once and returns run(), which does one unit of
+# work and returns how many items (listings, records, MB ...) it processed
+
+def case_golden_pages_extract(tmp):
+    soup = BeautifulSoup(read_fixture('listings', 'golden_pages_restaurants.html'), HTML_PARSER,
+                         parse_only=golden_pages_scraper.LISTING_STRAINER)
+    listings = soup.find_all('div', {'class': ['listing', 'result']})
+    return lambda: sum(1 for listing in listings if golden_pages_scraper.extract_golden_pages_info(listing, 'restaurants'))
+
+def case_golden_pages_parse(tmp):
+    html = read_fixture('listings', 'golden_pages_restaurants.html')
+    return lambda: len(golden_pages_scraper.parse_golden_pages(html, 'restaurants', 50))
+
+def case_yell_extract(tmp):
+    soup = BeautifulSoup(read_fixture('listings', 'yell_dentists.html'), HTML_PARSER,
+                         parse_only=yell_scraper.LISTING_STRAINER)
+    listings = soup.find_all('div', {'class': 'businessCapsule'})
+    return lambda: sum(1 for listing in listings if yell_scraper.extract_yell_info(listing, 'dentists'))
+
+def case_yell_parse(tmp):
+    html = read_fixture('listings', 'yell_dentists.html')
+    return lambda: len(yell_scraper.parse_yell(html, 'dentists', 50))
+
+def case_determine_category(tmp):
+    scraper = offline_scraper(tmp)
+    types = [place['types'] for place in places_results()]
+    return lambda: len([scraper._determine_category(place_types) for place_types in types])
+
+def case_places_light_records(tmp):
+    scraper = offline_scraper(tmp)
+    places = places_results()
+    return lambda: len([scraper.light_record(place) for place in places])
+
+def scoring_case(pages):
+    """analyze_website's path minus the network: stream, scan, score; counts MB scored"""
+    bodies = [html.encode('utf-8') for html in pages]
+    megabytes = sum(len(body) for body in bodies) / 1_000_000
+    
+    def run():
+        for body in bodies:
+            scanner, _, _ = fetch_features(FixtureResponse(body))
+            score_features('https://example.ie', scanner.features())
+        return megabytes
+    return run
+
+def small_homepages():
+    paths = sorted(glob.glob(os.path.join(FIXTURES, 'homepages', '*.html')))
+    return [read_fixture('homepages', os.path.basename(path)) for path in paths
+            if os.path.getsize(path) < 50_000]
+
+def case_scoring_small(tmp):
+    return scoring_case(small_homepages())
+
+def case_scoring_large(tmp):
+    return scoring_case([read_fixture('homepages', 'large_hotel.html')])
+
+def case_scoring_padded(tmp):
+    # A ~1.5 MB page: the body padded out, header and footer signals where they were
+    html = read_fixture('homepages', 'wordpress_restaurant.html')
+    middle = html.find('<body')
+    filler = '<div class="row"><p>Lorem ipsum dolor sit amet, Dublin services.</p></div>\n'
+    return scoring_case([html[:middle] + filler * (1_500_000 // len(filler)) + html[middle:]])
+
+def case_places_save_to_csv(tmp):
+    scraper = offline_scraper(tmp)
+    records = business_records(tmp, PERSISTENCE_ROWS)
+    path = os.path.join(tmp, 'places.csv')
+    
+    def run():
+        scraper.save_to_csv(records, path)
+        return len(records)
+    return run
+
+def case_sources_save_to_csv(tmp):
+    records = business_records(tmp, PERSISTENCE_ROWS)
+    path = os.path.join(tmp, 'unified.csv')
+    
+    def run():
+        sources.save_to_csv(records, path)
+        return len(records)
+    return run
+
+def case_save_table(tmp):
+    df = pd.DataFrame(business_records(tmp, PERSISTENCE_ROWS))
+    path = os.path.join(tmp, 'table.csv')
+    return lambda: len(save_table(df, path, BUSINESS_SCHEMA))
+
+def case_table_writer(tmp):
+    records = business_records(tmp, PERSISTENCE_ROWS)
+    chunks = [records[start:start + 5000] for start in range(0, len(records), 5000)]
+    path = os.path.join(tmp, 'streamed.csv')
+    
+    def run():
+        with TableWriter(path, BUSINESS_SCHEMA) as writer:
+            for chunk in chunks:
+                writer.write(chunk)
+        return writer.rows
+    return run
+
+def case_load_table(tmp):
+    path = os.path.join(tmp, 'load.csv')
+    save_table(pd.DataFrame(business_records(tmp, PERSISTENCE_ROWS)), path, BUSINESS_SCHEMA)
+    return lambda: len(load_table(path, BUSINESS_SCHEMA))
+
+# (name, unit, case)
+CASES = [
+    ('golden_pages.extract_info', 'listings', case_golden_pages_extract),
+    ('golden_pages.parse_page', 'listings', case_golden_pages_parse),
+    ('yell.extract_info', 'listings', case_yell_extract),
+    ('yell.parse_page', 'listings', case_yell_parse),
+    ('places.determine_category', 'places', case_determine_category),
+    ('places.light_record', 'places', case_places_light_records),
+    ('scoring.small_pages', 'MB', case_scoring_small),
+    ('scoring.large_page', 'MB', case_scoring_large),
+    ('scoring.padded_page', 'MB', case_scoring_padded),
+    ('persistence.places_save_to_csv', 'rows', case_places_save_to_csv),
+    ('persistence.sources_save_to_csv', 'rows', case_sources_save_to_csv),
+    ('persistence.save_table', 'rows', case_save_table),
+    ('persistence.table_writer', 'rows', case_table_writer),
+    ('persistence.load_table', 'rows', case_load_table),
+]
+
+def measure(run, min_time=0.2, repeats=5):
+    """
+    Best throughput (items/s) over repeats, each repeat looping run() for at least min_time
+    The best repeat is the one least disturbed by the rest of the machine
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        items = run()  # Warm-up, and a check that the case does any work
+        if not items:
+            raise RuntimeError("benchmark case processed nothing - fixture or parser broken?")
+        
+        # Like timeit: collector pauses land on whichever case happens to be running
+        gc.collect()
+        gc.disable()
+        try:
+            best = 0.0
+            for _ in range(repeats):
+                items, start = 0, time.perf_counter()
+                while True:
+                    items += run()
+                    elapsed = time.perf_counter() - start
+                    if elapsed >= min_time:
+                        break
+                best = max(best, items / elapsed)
+        finally:
+            gc.enable()
+    return best
+
+def cpu_model():
+    """CPU model name from /proc/cpuinfo (Linux), else whatever platform knows"""
+    try:
+        with open('/proc/cpuinfo', encoding='utf-8') as f:
+            for line in f:
+                if line.startswith('model name'):
+                    return line.split(':', 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or platform.machine()
+
+def library_version(name):
+    try:
+        return version(name)
+    except PackageNotFoundError:
+        return None
+
+def machine():
+    """
+    The setup a baseline is valid for: hardware, Python minor version, and
+    whether pyarrow is there plus the library versions, which change what the
+    persistence and parsing cases run. Not the kernel or hostname, which change
+    under the same hardware. LEAD_SCOUT_BENCH_MACHINE names the box, for
+    cloud machines that share a CPU model but not their speed.
+    """
+    return {
+        'name': os.environ.get('LEAD_SCOUT_BENCH_MACHINE', ''),
+        'system': platform.system(),
+        'arch': platform.machine(),
+        'cpu': cpu_model(),
+        'cpus': os.cpu_count(),
+        'python': '.'.join(platform.python_version_tuple()[:2]),
+        'columnar': COLUMNAR,
+        'libraries': {name: library_version(name) for name in BASELINE_LIBRARIES},
+    }
+
+def describe(setup):
+    libraries = ', '.join(f"{name} {release}" for name, release in setup['libraries'].items() if release)
+    name = f"{setup['name']}: " if setup['name'] else ''
+    return f"{name}{setup['cpu']} x{setup['cpus']}, Python {setup['python']}, {libraries}"
+
+def load_baselines(path=BASELINE_FILE):
+    """Every recorded baseline in the file, [] if there is none"""
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding='utf-8') as f:
+        return json.load(f).get('baselines', [])
+
+def save_baseline(path, baselines, setup, cases):
+    """Store cases as setup's baseline, replacing its previous one"""
+    baselines = [entry for entry in baselines if entry['machine'] != setup]
+    baselines.append({'machine': setup, 'recorded': time.strftime('%Y-%m-%d'), 'cases': cases})
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'baselines': baselines}, f, indent=2)
+        f.write('\n')
+
+def run_suite(only=None, min_time=0.2, repeats=5, baseline=None, tolerance=TOLERANCE, confirm=2, samples=1):
+    """
+    Run every case (or those whose name contains only), returns {name: {'rate', 'unit'}}
+    samples > 1 records the median of that many measurements (used for
+    baselines, so a lucky fast moment doesn't become the bar). A case that
+    looks slower than baseline is measured up to confirm more times and
+    keeps its best rate, so a noisy moment isn't reported as a regression
+    but a real slowdown still is.
+    """
+    cases = (baseline or {}).get('cases', {})
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, unit, case in CASES:
+            if only and only not in name:
+                continue
+            run = case(tmp)
+            rate = statistics.median(measure(run, min_time, repeats) for _ in range(samples))
+            floor = cases[name]['rate'] * (1 - tolerance) if name in cases else 0
+            for _ in range(confirm):
+                if rate >= floor:
+                    break
+                rate = max(rate, measure(run, min_time, repeats))
+            results[name] = {'rate': rate, 'unit': unit}
+    return results
+
+def compare(results, baseline, tolerance=TOLERANCE):
+    """Print the results table, returns the names of cases slower than baseline by more than tolerance"""
+    cases = (baseline or {}).get('cases', {})
+    regressions = []
+    
+    print(f"{'case':<34} {'throughput':>22} {'baseline':>14} {'change':>8}")
+    for name, result in results.items():
+        rate = f"{result['rate']:,.1f} {result['unit']}/s"
+        previous = cases.get(name)
+        if not previous:
+            print(f"{name:<34} {rate:>22} {'-':>14} {'new' if cases else '-':>8}")
+            continue
+        
+        change = result['rate'] / previous['rate'] - 1
+        flag = ''
+        if change < -tolerance:
+            regressions.append(name)
+            flag = ' ❌'
+        print(f"{name:<34} {rate:>22} {previous['rate']:>12,.1f}/s {change*100:>+7.0f}%{flag}")
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Offline micro-benchmarks compared against a stored baseline")
+    parser.add_argument('--only', help="run only cases whose name contains this")
+    parser.add_argument('--baseline', default=BASELINE_FILE)
+    parser.add_argument('--save-baseline', action='store_true', help="store these results as the new baseline")
+    parser.add_argument('--tolerance', type=float, default=TOLERANCE, help="allowed slowdown, 0.25 = 25%%")
+    parser.add_argument('--min-time', type=float, default=0.2, help="seconds per timed repeat")
+    parser.add_argument('--repeats', type=int, default=5)
+    args = parser.parse_args(argv)
+    
+    setup = machine()
+    baselines = load_baselines(args.baseline)
+    baseline = next((entry for entry in baselines if entry['machine'] == setup), None)
+    print("=== OFFLINE BENCHMARK SUITE ===")
+    print(f"Setup: {describe(setup)}")
+    if baseline is None and not args.save_baseline:
+        # Rates from another setup say nothing about this one
+        print(f"⚠️  No baseline for this setup in {args.baseline} ({len(baselines)} recorded for others) - "
+              f"nothing will be compared")
+    
+    if args.save_baseline:
+        results = run_suite(args.only, args.min_time, args.repeats, samples=5)
+    else:
+        results = run_suite(args.only, args.min_time, args.repeats, baseline, args.tolerance)
+    regressions = compare(results, baseline, args.tolerance)
+    
+    if args.save_baseline:
+        cases = dict((baseline or {}).get('cases', {}))
+        cases.update(results)
+        save_baseline(args.baseline, baselines, setup, cases)
+        print(f"\n💾 Baseline saved to {args.baseline}")
+        return 0
+    
+    if baseline is None:
+        print(f"\n❌ No baseline for this setup - record one with --save-baseline")
+        return NO_BASELINE
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s) beyond {args.tolerance*100:.0f}%: {', '.join(regressions)}")
+        return 1
+    print(f"\n✅ No regressions beyond {args.tolerance*100:.0f}%")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,25 +2,103 @@
 """
 Simple Dashboard for Lead Scout
 View and filter potential leads
+
+Interactive by default; pass options for a scriptable run (e.g. from cron):
+    python3 dashboard.py --summary
+    python3 dashboard.py --category dentist --max-score 10 --no-website --export data/hot_dentists.csv
+    python3 dashboard.py --needs-website --export-by-category data/exports
 """
 
+import argparse
+import os
+import re
+import numpy as np
 import pandas as pd
 import sys
 
-def show_dashboard(csv_file='data/analyzed_leads.csv'):
-    """Display interactive dashboard"""
-    try:
-        df = pd.read_csv(csv_file)
-    except FileNotFoundError:
-        print(f"❌ File not found: {csv_file}")
-        print("Run the analyzer first: python3 analysis/website_analyzer.py")
-        return
+from utils.lead_store import ANALYSIS_SCHEMA, load_table
+from utils.metrics import METRICS
+
+SCORE_BINS = [0, 5, 10, 15, 20, 25, 30]
+SCORE_LABELS = ['0-5 (Critical)', '6-10 (Poor)', '11-15 (Needs Help)', '16-20 (Okay)', '21-25 (Good)', '26-30 (Excellent)']
+
+def category_positions(df):
+    """Category -> sorted row positions, splitting merged values like 'cafe|restaurant'"""
+    parts = {}
+    for column in ('category', 'categories'):
+        if column not in df:
+            continue
+        for value, positions in df.groupby(column, observed=True, sort=False).indices.items():
+            for category in str(value).split('|'):
+                category = category.strip()
+                if category:
+                    parts.setdefault(category, []).append(positions)
+    return {category: np.unique(np.concatenate(found)) for category, found in parts.items()}
+
+class LeadIndex:
+    """
+    Precomputed lookups over an analyzed leads table
+    Category -> row positions, rows sorted by score, and the boolean columns
+    as arrays; a query narrows the smallest candidate set first instead of
+    scanning the whole table once per filter. A deduplicated row is indexed
+    under each of its '|'-separated categories
+    """
     
-    print("\n" + "="*60)
-    print("LEAD SCOUT DASHBOARD - Evolution Media Lead Generator")
-    print("="*60)
+    def __init__(self, df):
+        self.df = df
+        self.scores = df['score'].to_numpy()
+        self.by_score = np.argsort(self.scores, kind='stable')
+        self.sorted_scores = self.scores[self.by_score]
+        self.by_category = category_positions(df)
+        self.has_website = df['has_website'].to_numpy()
+        self.needs_website = df['needs_website'].to_numpy()
+    
+    def categories(self):
+        return list(self.by_category)
+    
+    def score_range(self, min_score=None, max_score=None):
+        """Row positions with min_score <= score <= max_score (either bound optional)"""
+        lo = 0 if min_score is None else np.searchsorted(self.sorted_scores, min_score, side='left')
+        hi = len(self.sorted_scores) if max_score is None else np.searchsorted(self.sorted_scores, max_score, side='right')
+        return self.by_score[lo:hi]
     
-    # Summary stats
+    def query(self, categories=None, min_score=None, max_score=None, has_website=None, needs_website=None):
+        """Rows matching every given filter, in table order"""
+        positions = None
+        if categories:
+            # A row listed under two of the categories (or one passed twice) comes back once
+            positions = np.unique(np.concatenate([self.by_category.get(category, np.empty(0, dtype=np.intp))
+                                                  for category in categories]))
+        
+        if min_score is not None or max_score is not None:
+            if positions is None:
+                positions = self.score_range(min_score, max_score)
+            else:
+                scores = self.scores[positions]
+                keep = np.ones(len(positions), dtype=bool)
+                if min_score is not None:
+                    keep &= scores >= min_score
+                if max_score is not None:
+                    keep &= scores <= max_score
+                positions = positions[keep]
+        
+        if positions is None:
+            positions = np.arange(len(self.df))
+        if has_website is not None:
+            positions = positions[self.has_website[positions] == has_website]
+        if needs_website is not None:
+            positions = positions[self.needs_website[positions] == needs_website]
+        
+        return self.df.iloc[np.sort(positions)]
+
+def score_histogram(scores):
+    """Counts per SCORE_BINS bucket (lower bound inclusive, upper exclusive) in one pass"""
+    buckets = np.digitize(np.asarray(scores), SCORE_BINS) - 1
+    buckets = buckets[(buckets >= 0) & (buckets < len(SCORE_LABELS))]
+    return np.bincount(buckets, minlength=len(SCORE_LABELS))
+
+def print_summary(df):
+    """Totals and score distribution"""
     total = len(df)
     with_website = df['has_website'].sum()
     needs_website = df['needs_website'].sum()
@@ -34,17 +112,51 @@ def show_dashboard(csv_file='data/analyzed_leads.csv'):
     
     # Score distribution
     print(f"\n📈 SCORE DISTRIBUTION:")
-    bins = [0, 5, 10, 15, 20, 25, 30]
-    labels = ['0-5 (Critical)', '6-10 (Poor)', '11-15 (Needs Help)', '16-20 (Okay)', '21-25 (Good)', '26-30 (Excellent)']
-    
-    for i in range(len(bins)-1):
-        count = len(df[(df['score'] >= bins[i]) & (df['score'] < bins[i+1])])
+    for label, count in zip(SCORE_LABELS, score_histogram(df['score'])):
         if count > 0:
-            print(f"   {labels[i]}: {count} businesses")
+            print(f"   {label}: {count} businesses")
+
+def category_filename(category):
+    """Safe file name part for a category (merged ones look like 'cafe|restaurant')"""
+    return re.sub(r'[^a-z0-9]+', '_', str(category).lower()).strip('_') or 'uncategorized'
+
+def export_by_category(df, directory='data', prefix='leads_', categories=None):
+    """
+    Write one CSV per category (only the given ones, if any), returns {path: rows}
+    Rows are split with the same index as LeadIndex.query, so a merged
+    'cafe|restaurant' business goes to both files
+    """
+    os.makedirs(directory, exist_ok=True)
+    written = {}
+    for category, positions in category_positions(df).items():
+        if categories and category not in categories:
+            continue
+        path = os.path.join(directory, f"{prefix}{category_filename(category)}.csv")
+        df.iloc[positions].to_csv(path, index=False)
+        written[path] = len(positions)
+    return written
+
+def show_dashboard(csv_file='data/analyzed_leads.csv'):
+    """Display interactive dashboard"""
+    try:
+        # Typed load: reads the Parquet copy when there is one
+        df = load_table(csv_file, ANALYSIS_SCHEMA)
+    except FileNotFoundError:
+        print(f"❌ File not found: {csv_file}")
+        print("Run the analyzer first: python3 analysis/website_analyzer.py")
+        return
+    
+    index = LeadIndex(df)
+    
+    print("\n" + "="*60)
+    print("LEAD SCOUT DASHBOARD - Evolution Media Lead Generator")
+    print("="*60)
+    
+    print_summary(df)
     
     # Show worst offenders
     print(f"\n🔴 TOP 5 CANDIDATES (Most Need Evolution Media):")
-    candidates = df[df['needs_website']].sort_values('score').head(5)
+    candidates = index.query(needs_website=True).sort_values('score').head(5)
     
     for idx, row in candidates.iterrows():
         score_color = "🟥" if row['score'] < 5 else "🟧" if row['score'] < 10 else "🟨"
@@ -70,13 +182,13 @@ def show_dashboard(csv_file='data/analyzed_leads.csv'):
     choice = input("\nSelect option (1-5): ").strip()
     
     if choice == '1':
-        needs_df = df[df['needs_website']]
+        needs_df = index.query(needs_website=True)
         export_file = 'data/leads_needing_websites.csv'
         needs_df.to_csv(export_file, index=False)
         print(f"✅ Exported {len(needs_df)} leads to {export_file}")
-        
+    
     elif choice == '2':
-        categories = df['category'].unique()
+        categories = index.categories()
         print("\nAvailable categories:")
         for i, cat in enumerate(categories, 1):
             print(f"   {i}. {cat}")
@@ -85,8 +197,8 @@ def show_dashboard(csv_file='data/analyzed_leads.csv'):
         try:
             cat_idx = int(cat_choice) - 1
             selected_cat = categories[cat_idx]
-            cat_df = df[df['category'] == selected_cat]
-            export_file = f'data/leads_{selected_cat}.csv'
+            cat_df = index.query(categories=[selected_cat])
+            export_file = f'data/leads_{category_filename(selected_cat)}.csv'
             cat_df.to_csv(export_file, index=False)
             print(f"✅ Exported {len(cat_df)} {selected_cat} leads to {export_file}")
         except:
@@ -98,7 +210,7 @@ def show_dashboard(csv_file='data/analyzed_leads.csv'):
         try:
             min_score = int(min_score)
             max_score = int(max_score)
-            score_df = df[(df['score'] >= min_score) & (df['score'] <= max_score)]
+            score_df = index.query(min_score=min_score, max_score=max_score)
             export_file = f'data/leads_score_{min_score}_to_{max_score}.csv'
             score_df.to_csv(export_file, index=False)
             print(f"✅ Exported {len(score_df)} leads (score {min_score}-{max_score}) to {export_file}")
@@ -116,5 +228,64 @@ def show_dashboard(csv_file='data/analyzed_leads.csv'):
     print("   - Add automated outreach")
     print("   - Integrate with Evolution Media pipeline")
 
+def run_query(args):
+    """Non-interactive mode: filter, summarize and export without prompts, returns exit code"""
+    try:
+        with METRICS.stage('load') as stage:
+            df = load_table(args.file, ANALYSIS_SCHEMA)
+            stage.add(len(df))
+    except FileNotFoundError:
+        print(f"❌ File not found: {args.file}", file=sys.stderr)
+        return 1
+    
+    with METRICS.stage('query') as stage:
+        selected = LeadIndex(df).query(categories=args.category, min_score=args.min_score, max_score=args.max_score,
+                                       has_website=args.has_website, needs_website=args.needs_website)
+        stage.add(len(selected))
+    print(f"🔎 {len(selected)} of {len(df)} leads match")
+    
+    if args.summary and len(selected):
+        print_summary(selected)
+    
+    if args.export:
+        with METRICS.stage('export') as stage:
+            selected.to_csv(args.export, index=False)
+            stage.add(len(selected))
+        METRICS.inc('export_bytes_total', os.path.getsize(args.export), exporter='dashboard')
+        print(f"✅ Exported {len(selected)} leads to {args.export}")
+    
+    if args.export_by_category:
+        with METRICS.stage('export') as stage:
+            written = export_by_category(selected, args.export_by_category, categories=args.category)
+            stage.add(len(selected))
+        METRICS.inc('export_bytes_total', sum(os.path.getsize(path) for path in written), exporter='dashboard')
+        print(f"✅ Exported {len(selected)} leads into {len(written)} category files in {args.export_by_category}")
+    
+    if args.metrics:
+        METRICS.write('dashboard')
+    return 0
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Lead Scout dashboard (interactive without options)")
+    parser.add_argument('--file', default='data/analyzed_leads.csv', help="analyzed leads CSV")
+    parser.add_argument('--category', action='append', help="only this category (repeatable)")
+    parser.add_argument('--min-score', type=int)
+    parser.add_argument('--max-score', type=int)
+    parser.add_argument('--has-website', dest='has_website', action='store_const', const=True)
+    parser.add_argument('--no-website', dest='has_website', action='store_const', const=False)
+    parser.add_argument('--needs-website', action='store_const', const=True)
+    parser.add_argument('--summary', action='store_true', help="print totals and score distribution")
+    parser.add_argument('--export', metavar='CSV', help="write matching leads to one CSV")
+    parser.add_argument('--export-by-category', metavar='DIR', help="write matching leads to one CSV per category")
+    parser.add_argument('--metrics', action='store_true', help="write run metrics to data/metrics/dashboard.*")
+    
+    args = parser.parse_args(argv)
+    options = [args.category, args.min_score, args.max_score, args.has_website, args.needs_website,
+               args.export, args.export_by_category]
+    if not args.summary and all(option is None for option in options):
+        show_dashboard(args.file)
+        return 0
+    return run_query(args)
+
 if __name__ == "__main__":
-    show_dashboard()
\ No newline at end of file
+    sys.exit(main())
@@ -3,42 +3,49 @@
 Export REAL Dublin business leads for Evolution Media
 """
 
-import pandas as pd
-import csv
+import os
 
-def export_real_leads():
+from utils.lead_store import BUSINESS_SCHEMA, TableWriter, iter_table
+from utils.metrics import METRICS
+
+def has_website(chunk):
+    return (chunk['website'] != '') & (chunk['website'] != 'NO_WEBSITE')
+
+def export_real_leads(input_file='data/multi_category_businesses.csv',
+                      export_file='data/evolution_media_leads_export.csv', chunk_size=10_000):
+    """Stream businesses into the export file chunk by chunk, listing the ones without websites"""
     print("=== EXPORTING REAL DUBLIN BUSINESS LEADS ===")
     print("")
     
     # Load the real Google Maps data
-    try:
-        df = pd.read_csv('data/multi_category_businesses.csv')
-        print(f"✅ Loaded {len(df)} real Dublin businesses")
-    except FileNotFoundError:
+    if not os.path.exists(input_file):
         print("❌ Real business data not found")
         print("Run the Google Maps scraper first")
         return
     
+    total = 0
+    websites_found = 0
+    
     # All businesses need websites (for Evolution Media)
     # In reality, we'd score them, but for now export all
-    export_df = df.copy()
+    with METRICS.stage('export') as stage, TableWriter(export_file, BUSINESS_SCHEMA) as writer:
+        for chunk in iter_table(input_file, BUSINESS_SCHEMA, chunk_size):
+            # Add a column for notes
+            chunk['evolution_media_notes'] = 'Qualified lead - needs website'
+            writer.write(chunk)
+            
+            total += len(chunk)
+            websites_found += int(has_website(chunk).sum())
+            stage.add(len(chunk))
+    METRICS.inc('export_bytes_total', os.path.getsize(export_file), exporter='export_real_leads')
     
-    # Add a column for notes
-    export_df['evolution_media_notes'] = 'Qualified lead - needs website'
-    
-    # Save to export file
-    export_file = 'data/evolution_media_leads_export.csv'
-    export_df.to_csv(export_file, index=False)
-    
-    print(f"✅ Exported {len(export_df)} leads to: {export_file}")
+    no_websites = total - websites_found
+    print(f"✅ Loaded {total} real Dublin businesses")
+    print(f"✅ Exported {total} leads to: {export_file}")
     print("")
     
-    # Show summary
-    websites_found = sum(1 for b in df['website'] if b and b != 'NO_WEBSITE')
-    no_websites = len(df) - websites_found
-    
     print("📊 LEAD SUMMARY:")
-    print(f"   Total businesses: {len(df)}")
+    print(f"   Total businesses: {total}")
     print(f"   With websites: {websites_found} (need improvement)")
     print(f"   Without websites: {no_websites} (PERFECT LEADS!)")
     print("")
@@ -47,18 +54,19 @@ def export_real_leads():
     if no_websites > 0:
         print("🔥 BEST LEADS (NO WEBSITE):")
         print("="*50)
-        no_website_df = df[df['website'].isna() | (df['website'] == '') | (df['website'] == 'NO_WEBSITE')]
         
-        for idx, row in no_website_df.iterrows():
-            print(f"\n❌ {row['name']}")
-            print(f"   Category: {row['category']}")
-            print(f"   Phone: {row['phone']}")
-            print(f"   Address: {row['address'][:60]}...")
-            print(f"   ACTION: CALL NOW - 'Hi, I noticed you don't have a website...'")
+        # Second streaming pass rather than holding every lead until the summary is out
+        for chunk in iter_table(input_file, BUSINESS_SCHEMA, chunk_size):
+            for row in chunk[~has_website(chunk)].to_dict('records'):
+                print(f"\n❌ {row['name']}")
+                print(f"   Category: {row['category']}")
+                print(f"   Phone: {row['phone']}")
+                print(f"   Address: {row['address'][:60]}...")
+                print(f"   ACTION: CALL NOW - 'Hi, I noticed you don't have a website...'")
     
     print("")
     print("📧 EMAIL OUTREACH READY:")
-    print("   File: data/evolution_media_leads_export.csv")
+    print(f"   File: {export_file}")
     print("   Format: CSV (compatible with Mailchimp, HubSpot, etc.)")
     print("")
     print("📞 CALL LIST READY:")
@@ -67,7 +75,7 @@ def export_real_leads():
     print("")
     print("💰 REVENUE POTENTIAL:")
     print(f"   Immediate (no website): €{no_websites * 500}")
-    print(f"   Potential (all): €{len(df) * 500}")
+    print(f"   Potential (all): €{total * 500}")
     print("")
     print("🚀 NEXT STEPS:")
     print("   1. Import CSV into your email marketing tool")
@@ -76,4 +84,5 @@ def export_real_leads():
     print("   4. Scale to 500+ businesses (cost: ~$0.025)")
 
 if __name__ == "__main__":
-    export_real_leads()
\ No newline at end of file
+    export_real_leads()
+    METRICS.write('export_real_leads')
\ No newline at end of file
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Append-only scrape journal for resumable runs
+One NDJSON line per completed (source, category, page) unit, fsynced as
+it is written, so a restarted run can skip everything already done
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+def journal_path(output_file: str) -> str:
+    """Journal companion of an output file ('x.csv' -> 'x.journal.ndjson'), never the output itself"""
+    return os.path.splitext(output_file)[0] + '.journal.ndjson'
+
+class ScrapeJournal:
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._units = {}  # (source, category, page) -> businesses
+        
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        if os.path.exists(path):
+            self._load()
+            if self._units:
+                print(f"📒 Resuming from {path}: {len(self._units)} units already done")
+        
+        self._file = open(path, 'a', encoding='utf-8')
+    
+    def _load(self):
+        with open(self.path, 'rb') as f:
+            data = f.read()
+        
+        # A crash mid-write leaves a partial last line - drop it so new
+        # entries start on a fresh line; that unit just reruns
+        complete = data[:data.rfind(b'\n') + 1]
+        if len(complete) < len(data):
+            with open(self.path, 'r+b') as f:
+                f.truncate(len(complete))
+        
+        for line in complete.decode('utf-8').splitlines():
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            self._units[(entry['source'], entry['category'], entry['page'])] = entry['businesses']
+    
+    def get(self, source: str, category: str, page: Optional[int] = None) -> Optional[List[Dict]]:
+        """Businesses from a completed unit, or None if it still needs scraping"""
+        with self._lock:
+            return self._units.get((source, category, page))
+    
+    def is_done(self, source: str, category: str, page: Optional[int] = None) -> bool:
+        return self.get(source, category, page) is not None
+    
+    def record(self, source: str, category: str, page: Optional[int], businesses: List[Dict]):
+        """Append a completed unit and fsync it before returning"""
+        entry = {
+            'source': source,
+            'category': category,
+            'page': page,
+            'completed_at': time.time(),
+            'businesses': businesses
+        }
+        line = json.dumps(entry, ensure_ascii=False) + '\n'
+        
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._units[(source, category, page)] = businesses
+    
+    def businesses(self) -> List[Dict]:
+        """All businesses recorded so far, in the order units completed"""
+        with self._lock:
+            return [business for units in self._units.values() for business in units]
+    
+    def close(self, remove: bool = False):
+        """Close the journal; remove=True once its results are safely saved elsewhere"""
+        with self._lock:
+            self._file.close()
+        if remove:
+            os.remove(self.path)
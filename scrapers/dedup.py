@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Cross-source business deduplication
+Normalizes phones (E.164), names and addresses, groups records through
+blocking keys so matching stays near-linear, and merges each duplicate
+group field by field
+"""
+
+import re
+import unicodedata
+from array import array
+from collections import defaultdict
+from typing import Dict, Iterable, Iterator, List
+
+# Lower number wins when two records disagree on a field
+SOURCE_PRIORITY = {'google_places_api': 0, 'goldenpages.ie': 1, 'yell.ie': 2}
+
+# Fields whose every distinct value is also kept, '|'-separated, in a list column;
+# the field itself keeps one value like any other so exact matches still work
+MULTI_VALUE_FIELDS = {'category': 'categories', 'source': 'sources'}
+
+NAME_STOPWORDS = {'the', 'ltd', 'limited', 'and', 'co', 'company', 'of', 'dublin', 'ireland', 'teo', 'plc'}
+ADDRESS_ABBREVIATIONS = {'st': 'street', 'rd': 'road', 'ave': 'avenue', 'sq': 'square', 'pl': 'place',
+                         'tce': 'terrace', 'upr': 'upper', 'lwr': 'lower', 'nth': 'north', 'sth': 'south'}
+
+NON_DIGIT = re.compile(r'\D')
+WORD = re.compile(r'[a-z0-9]+')
+DUBLIN_DISTRICT = re.compile(r'\bdublin\s*(\d{1,2}w?)\b')
+EIRCODE = re.compile(r'\b([ac-fhknprtv-y]\d[\dw])(\s?[\dac-fhknprtv-y]{4})?\b')
+HOUSE_AND_STREET = re.compile(r'\b(\d+[a-z]?)\s+([a-z]+)')
+
+def normalize_phone(phone, country_code: str = '353') -> str:
+    """E.164 form of a phone number (Irish by default), or '' if it doesn't look valid"""
+    if not isinstance(phone, str) or not phone:
+        return ''
+    digits = NON_DIGIT.sub('', phone)
+    
+    if phone.strip().startswith('+'):
+        number = digits
+    elif digits.startswith('00'):
+        number = digits[2:]
+    elif digits.startswith(country_code):
+        number = digits
+    elif digits.startswith('0'):
+        number = country_code + digits[1:]
+    else:
+        return ''
+    
+    # '+353 (0)1 ...': the national trunk 0 is written after the country code but isn't dialled
+    if number.startswith(country_code + '0'):
+        number = country_code + number[len(country_code) + 1:]
+    
+    # E.164 allows at most 15 digits; shorter than 9 is a local fragment
+    if not 9 <= len(number) <= 15:
+        return ''
+    return '+' + number
+
+def _ascii_lower(text) -> str:
+    if not isinstance(text, str):
+        return ''
+    text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii')
+    return text.lower().replace('&', ' and ').replace("'", '')
+
+def normalize_name(name) -> str:
+    """Lowercase, accent-free name tokens without filler words"""
+    tokens = [token for token in WORD.findall(_ascii_lower(name)) if token not in NAME_STOPWORDS]
+    return ' '.join(tokens)
+
+def normalize_address(address) -> str:
+    """Lowercase address with common abbreviations expanded"""
+    tokens = WORD.findall(_ascii_lower(address))
+    return ' '.join(ADDRESS_ABBREVIATIONS.get(token, token) for token in tokens)
+
+def postcode(address: str) -> str:
+    """Eircode routing key (e.g. 'D02') from a normalized address, mapping 'Dublin 2' style districts"""
+    match = DUBLIN_DISTRICT.search(address)
+    if match:
+        district = match.group(1).upper()
+        return 'D6W' if district == '6W' else 'D' + district.rjust(2, '0')
+    match = EIRCODE.search(address)
+    if match:
+        return match.group(1).upper()
+    return ''
+
+def name_similarity(a: str, b: str) -> float:
+    """Token Jaccard similarity of two normalized names"""
+    tokens_a, tokens_b = set(a.split()), set(b.split())
+    if not tokens_a or not tokens_b:
+        return 0.0
+    return len(tokens_a & tokens_b) / len(tokens_a | tokens_b)
+
+class Deduplicator:
+    """
+    Two-pass deduplication: add() every record to build the blocking index,
+    then merge() the same records (in the same order) to get merged groups
+    Records sharing a phone or place_id are the same business. Records at
+    the same house number and street (and postcode, when known) whose names
+    share a first token are compared by name similarity. Only small tables are kept per
+    record (match keys, normalized name), so memory stays proportional to
+    the number of records rather than their size.
+    """
+    
+    def __init__(self, name_threshold: float = 0.6, max_block: int = 50):
+        self.name_threshold = name_threshold
+        self.max_block = max_block  # Bigger fuzzy blocks are skipped, not compared pairwise
+        self._parent = array('q')
+        self._names = []
+        self._exact = {}                  # exact key -> first record id
+        self._blocks = defaultdict(list)  # fuzzy key -> record ids
+        self._resolved = False
+    
+    def __len__(self):
+        return len(self._parent)
+    
+    def _find(self, i: int) -> int:
+        parent = self._parent
+        root = i
+        while parent[root] != root:
+            root = parent[root]
+        while parent[i] != root:  # Path compression
+            parent[i], i = root, parent[i]
+        return root
+    
+    def _union(self, a: int, b: int):
+        root_a, root_b = self._find(a), self._find(b)
+        if root_a != root_b:
+            # Keep the earliest record as the root
+            if root_a < root_b:
+                self._parent[root_b] = root_a
+            else:
+                self._parent[root_a] = root_b
+    
+    def add(self, record: Dict) -> int:
+        """Index one record, returns its id"""
+        record_id = len(self._parent)
+        self._parent.append(record_id)
+        self._resolved = False
+        
+        name = normalize_name(record.get('name'))
+        self._names.append(name)
+        
+        exact_keys = []
+        phone = normalize_phone(record.get('phone'))
+        if phone:
+            exact_keys.append('phone:' + phone)
+        place_id = record.get('place_id')
+        if isinstance(place_id, str) and place_id:
+            exact_keys.append('place:' + place_id)
+        
+        for key in exact_keys:
+            first = self._exact.setdefault(key, record_id)
+            if first != record_id:
+                self._union(first, record_id)
+        
+        if name:
+            address = normalize_address(record.get('address'))
+            match = HOUSE_AND_STREET.search(address)
+            number, street = match.groups() if match else ('', '')
+            if street:
+                self._blocks[f"{postcode(address)}|{street}|{number}|{name.split()[0]}"].append(record_id)
+        
+        return record_id
+    
+    def resolve(self):
+        """Compare names within each fuzzy block and link matches"""
+        for ids in self._blocks.values():
+            if len(ids) < 2 or len(ids) > self.max_block:
+                continue
+            for i, a in enumerate(ids):
+                for b in ids[i + 1:]:
+                    if self._find(a) != self._find(b) and \
+                            name_similarity(self._names[a], self._names[b]) >= self.name_threshold:
+                        self._union(a, b)
+        self._resolved = True
+    
+    def duplicate_count(self) -> int:
+        if not self._resolved:
+            self.resolve()
+        return sum(1 for i in range(len(self._parent)) if self._find(i) != i)
+    
+    def merge(self, records: Iterable[Dict]) -> Iterator[Dict]:
+        """
+        Second pass over the records given to add(), in the same order
+        Yields one merged record per business as soon as its last member is seen
+        """
+        if not self._resolved:
+            self.resolve()
+        
+        roots = array('q', (self._find(i) for i in range(len(self._parent))))
+        remaining = defaultdict(int)
+        for root in roots:
+            remaining[root] += 1
+        
+        open_groups = {}
+        for record_id, record in enumerate(records):
+            root = roots[record_id]
+            group = open_groups.get(root)
+            if group is None:
+                group = open_groups[root] = _MergedRecord()
+            group.add(record)
+            
+            remaining[root] -= 1
+            if remaining[root] == 0:
+                del open_groups[root], remaining[root]
+                yield group.result()
+
+class _MergedRecord:
+    """Field-by-field merge: best-priority non-empty value, multi-value fields also listed"""
+    
+    def __init__(self):
+        self.values = {}
+        self.priorities = {}
+        self.multi = defaultdict(list)
+    
+    def add(self, record: Dict):
+        priority = SOURCE_PRIORITY.get(record.get('source'), len(SOURCE_PRIORITY))
+        for field, list_field in MULTI_VALUE_FIELDS.items():
+            # An already merged record brings its list along
+            for value in (record.get(field), record.get(list_field)):
+                for part in str(value).split('|') if _present(value) else []:
+                    if part not in self.multi[list_field]:
+                        self.multi[list_field].append(part)
+        
+        for field, value in record.items():
+            if field in MULTI_VALUE_FIELDS.values():
+                continue
+            if field in MULTI_VALUE_FIELDS and isinstance(value, str):
+                value = value.split('|')[0]  # Primary value of an older 'a|b' merge
+            if _present(value) and priority < self.priorities.get(field, float('inf')):
+                self.values[field] = value
+                self.priorities[field] = priority
+            else:
+                self.values.setdefault(field, value)
+    
+    def result(self) -> Dict:
+        merged = dict(self.values)
+        for list_field in MULTI_VALUE_FIELDS.values():
+            merged[list_field] = '|'.join(self.multi[list_field])
+        return merged
+
+def _present(value) -> bool:
+    return value is not None and value == value and value != ''  # value == value filters NaN
+
+def dedupe(records: List[Dict], **options) -> List[Dict]:
+    """Deduplicate an in-memory list of records"""
+    deduplicator = Deduplicator(**options)
+    for record in records:
+        deduplicator.add(record)
+    return list(deduplicator.merge(records))
@@ -4,14 +4,17 @@ Full Dublin Business Scrape
 Get 100+ businesses across multiple categories
 """
 
-import time
-import random
 import os
 import sys
 
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from scrapers.google_maps_api import GoogleMapsPlacesScraper
+from scrapers.places_cache import PlaceDetailsCache
+from scrapers.checkpoint import ScrapeJournal
+from scrapers.dedup import dedupe
+from utils.http_client import print_connection_stats
+from utils.metrics import METRICS
 
 def main():
     print("=== FULL DUBLIN BUSINESS SCRAPE ===")
@@ -19,7 +22,9 @@ def main():
     print("")
     
     # Initialize scraper - will use environment variable
-    scraper = GoogleMapsPlacesScraper()
+    # Place Details are cached on disk so re-runs skip known businesses
+    cache = PlaceDetailsCache('data/places_cache.db', ttl_days=30)
+    scraper = GoogleMapsPlacesScraper(cache=cache)
     
     # Dublin business categories
     categories = [
@@ -35,29 +40,47 @@ def main():
         ('builders', 10)
     ]
     
+    # Each finished category is journaled (fsynced) so a crash loses at most one
+    # category; page tokens expire, so a category is the smallest resumable unit
+    journal = ScrapeJournal('data/full_dublin_businesses.journal.ndjson')
+    
     all_businesses = []
     
-    for category, max_results in categories:
-        print(f"📊 Scraping: {category} ({max_results} businesses)")
-        
-        businesses = scraper.search_businesses(
-            query=category,
-            location="Dublin, Ireland",
-            max_results=max_results
-        )
-        
-        all_businesses.extend(businesses)
-        print(f"   Found: {len(businesses)} businesses")
-        print(f"   Total so far: {len(all_businesses)}")
-        print("")
-        
-        # Random delay to avoid rate limits
-        delay = random.uniform(3, 6)
-        time.sleep(delay)
+    with METRICS.stage('scrape') as stage:
+        for category, max_results in categories:
+            businesses = journal.get('google_places_api', category)
+            if businesses is not None:
+                print(f"⏭️  Skipping: {category} (already scraped, {len(businesses)} businesses)")
+                all_businesses.extend(businesses)
+                continue
+            
+            print(f"📊 Scraping: {category} ({max_results} businesses)")
+            
+            businesses = scraper.search_businesses(
+                query=category,
+                location="Dublin, Ireland",
+                max_results=max_results
+            )
+            if businesses:  # search_businesses returns [] on errors - retry those next run
+                journal.record('google_places_api', category, None, businesses)
+            
+            all_businesses.extend(businesses)
+            print(f"   Found: {len(businesses)} businesses")
+            print(f"   Total so far: {len(all_businesses)}")
+            print("")
+            # No sleep between categories: every API call waits for the shared rate limiter
+        stage.add(len(all_businesses))
     
     # Save all businesses
     if all_businesses:
+        # A business found under two categories (e.g. cafe and restaurant) is merged
+        scraped = len(all_businesses)
+        all_businesses = dedupe(all_businesses)
+        if scraped > len(all_businesses):
+            print(f"🔗 Merged {scraped - len(all_businesses)} duplicate listings")
+        
         scraper.save_to_csv(all_businesses, 'data/full_dublin_businesses.csv')
+        journal.close(remove=True)
         
         # Quick stats
         websites_found = sum(1 for b in all_businesses if b['website'])
@@ -67,7 +90,12 @@ def main():
         print(f"Total businesses: {len(all_businesses)}")
         print(f"With websites: {websites_found} ({websites_found/len(all_businesses)*100:.1f}%)")
         print(f"Without websites: {len(all_businesses) - websites_found}")
-        print(f"Estimated API cost: ${len(all_businesses) * 0.00005:.4f}")
+        print(f"Estimated API cost: ${scraper.estimated_cost():.4f} (Places calls actually made)")
+        cache_stats = cache.stats()
+        print(f"Details cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses "
+              f"({cache_stats['hit_rate']*100:.0f}% hit rate, {cache_stats['entries']} cached)")
+        print(f"Places request rate: {scraper.limiter.rate():.1f}/s (adapts to OVER_QUERY_LIMIT)")
+        print_connection_stats()
         print("")
         print("📁 Saved to: data/full_dublin_businesses.csv")
         print("")
@@ -85,7 +113,12 @@ def main():
                 print(f"   Website: NO WEBSITE - PERFECT LEAD!")
             print()
     else:
+        journal.close()
         print("❌ No businesses collected")
+    
+    cache.close()
+    scraper.estimated_cost()  # Also sets the places_estimated_cost_usd gauge
+    METRICS.write('full_scrape')
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -4,30 +4,39 @@ Golden Pages Ireland Scraper
 Real business data for Dublin
 """
 
-import requests
 import time
 import csv
 import re
 from bs4 import BeautifulSoup
-import random
+import os
+import sys
 
-HEADERS = {
-    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-    'Accept-Language': 'en-US,en;q=0.5',
-    'Accept-Encoding': 'gzip, deflate, br',
-    'DNT': '1',
-    'Connection': 'keep-alive',
-    'Upgrade-Insecure-Requests': '1',
-    'Sec-Fetch-Dest': 'document',
-    'Sec-Fetch-Mode': 'navigate',
-    'Sec-Fetch-Site': 'none',
-    'Sec-Fetch-User': '?1',
-    'Cache-Control': 'max-age=0',
-}
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.http_client import get_client
+from utils.html_parsing import HTML_PARSER, class_strainer
+from utils.lead_store import BUSINESS_SCHEMA, save_columnar
+from utils.rate_limit import HostThrottle
+from utils.metrics import METRICS
+from scrapers.pagination import crawl_pages, page_fetcher
+from scrapers.checkpoint import ScrapeJournal, journal_path
 
-def search_golden_pages(query, location="Dublin", max_results=20):
-    """Search Golden Pages for businesses"""
+SOURCE = 'goldenpages.ie'
+RESULTS_PER_PAGE = 20
+
+# Minimum gap between requests to goldenpages.ie, shared by all page fetches
+THROTTLE = HostThrottle(1.0)
+
+# Only listing containers are parsed; the rest of the page is skipped
+LISTING_STRAINER = class_strainer(['div', 'article'], 'listing', 'result')
+TEL_HREF = re.compile(r'^tel:')
+HTTP_HREF = re.compile(r'^https?://')
+
+def search_golden_pages(query, location="Dublin", max_results=20, max_in_flight=3, journal=None):
+    """
+    Search Golden Pages for businesses, following results pages up to max_results
+    With a ScrapeJournal, pages already journaled are reused and new ones recorded
+    """
     base_url = "https://www.goldenpages.ie"
     
     # Golden Pages search pattern
@@ -35,32 +44,33 @@ def search_golden_pages(query, location="Dublin", max_results=20):
     
     print(f"Searching Golden Pages: {query} in {location}")
     
-    try:
-        response = requests.get(search_url, headers=HEADERS, timeout=15)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.text, 'html.parser')
-        businesses = []
-        
-        # Look for business listings - Golden Pages structure
-        listings = soup.find_all('div', {'class': ['listing', 'result']})
-        
-        if not listings:
-            # Try alternative class names
-            listings = soup.find_all('article', {'class': 'listing'})
-        
-        print(f"Found {len(listings)} listings on page")
-        
-        for listing in listings[:max_results]:
-            business = extract_golden_pages_info(listing, query)
-            if business:
-                businesses.append(business)
-        
-        return businesses
-        
-    except Exception as e:
-        print(f"Error searching Golden Pages: {e}")
-        return []
+    fetch_page = page_fetcher(SOURCE, 'Golden Pages', query,
+                              lambda page: search_url if page == 1 else f"{search_url}?page={page}",
+                              'golden_pages', THROTTLE, lambda html: parse_golden_pages(html, query, max_results),
+                              journal)
+    
+    return crawl_pages(fetch_page, max_results, RESULTS_PER_PAGE, max_in_flight)
+
+def parse_golden_pages(html, query, max_results=20):
+    """Parse business listings from a Golden Pages results page"""
+    soup = BeautifulSoup(html, HTML_PARSER, parse_only=LISTING_STRAINER)
+    businesses = []
+    
+    # Look for business listings - Golden Pages structure
+    listings = soup.find_all('div', {'class': ['listing', 'result']})
+    
+    if not listings:
+        # Try alternative class names
+        listings = soup.find_all('article', {'class': 'listing'})
+    
+    print(f"Found {len(listings)} listings on page")
+    
+    for listing in listings[:max_results]:
+        business = extract_golden_pages_info(listing, query)
+        if business:
+            businesses.append(business)
+    
+    return businesses
 
 def extract_golden_pages_info(listing, category):
     """Extract business info from Golden Pages listing"""
@@ -76,13 +86,13 @@ def extract_golden_pages_info(listing, category):
         address = address_elem.get_text(strip=True) if address_elem else ""
         
         # Phone
-        phone_elem = listing.find('a', {'href': re.compile(r'^tel:')}) or \
+        phone_elem = listing.find('a', {'href': TEL_HREF}) or \
                     listing.find('span', {'class': 'phone'}) or \
                     listing.find('div', {'class': 'telephone'})
         phone = phone_elem.get_text(strip=True) if phone_elem else ""
         
         # Website
-        website_elem = listing.find('a', {'href': re.compile(r'^https?://')})
+        website_elem = listing.find('a', {'href': HTTP_HREF})
         website = ""
         if website_elem and website_elem.get('href'):
             href = website_elem['href']
@@ -119,6 +129,7 @@ def save_to_csv(businesses, filename):
         writer.writeheader()
         for business in businesses:
             writer.writerow(business)
+    save_columnar(businesses, filename, BUSINESS_SCHEMA)
     
     print(f"✅ Saved {len(businesses)} businesses to {filename}")
 
@@ -136,10 +147,6 @@ def test_golden_pages():
         businesses = search_golden_pages(term, max_results=5)
         print(f"Found: {len(businesses)} businesses")
         all_businesses.extend(businesses)
-        
-        # Be polite - random delay between requests
-        delay = random.uniform(2, 4)
-        time.sleep(delay)
     
     if all_businesses:
         save_to_csv(all_businesses, 'data/golden_pages_test.csv')
@@ -159,7 +166,7 @@ def test_golden_pages():
         print(f"   Total businesses: {len(all_businesses)}")
         print(f"   With website: {websites_found} ({websites_found/len(all_businesses)*100:.1f}%)")
         print(f"   Without website: {len(all_businesses) - websites_found}")
-        
+    
     else:
         print("\n❌ No businesses found from Golden Pages")
         print("   This could be due to:")
@@ -168,9 +175,12 @@ def test_golden_pages():
         print("   - Need to adjust scraping logic")
 
 def full_scrape(output_file='data/golden_pages_full.csv'):
-    """Full scrape of Dublin businesses"""
+    """Full scrape of Dublin businesses, resumable via an append-only journal"""
     print("=== FULL GOLDEN PAGES SCRAPE ===")
     
+    # Completed pages are journaled as they finish; a restart skips them
+    journal = ScrapeJournal(journal_path(output_file))
+    
     # Common business categories in Dublin
     categories = [
         'restaurants', 'dentists', 'plumbers', 'cafes', 'hotels',
@@ -180,26 +190,25 @@ def full_scrape(output_file='data/golden_pages_full.csv'):
     
     all_businesses = []
     
-    for category in categories:
-        print(f"\nScraping: {category}")
-        businesses = search_golden_pages(category, max_results=15)
-        print(f"Found: {len(businesses)} businesses")
-        all_businesses.extend(businesses)
-        
-        # Random delay to avoid blocking
-        delay = random.uniform(3, 6)
-        time.sleep(delay)
-        
-        # Save progress every 3 categories
-        if len(all_businesses) >= 20:
-            save_to_csv(all_businesses, output_file)
+    with METRICS.stage('scrape') as stage:
+        for category in categories:
+            resumed = journal.is_done(SOURCE, category, 1)
+            print(f"\nScraping: {category}" + (" (resumed)" if resumed else ""))
+            businesses = search_golden_pages(category, max_results=15, journal=journal)
+            print(f"Found: {len(businesses)} businesses")
+            all_businesses.extend(businesses)
+            stage.add(len(businesses))
     
-    # Final save
+    # Final save - written once; the journal holds progress until then
     if all_businesses:
         save_to_csv(all_businesses, output_file)
+        journal.close(remove=True)
         print(f"\n🎉 COMPLETE: Saved {len(all_businesses)} Dublin businesses")
     else:
+        journal.close()
         print("\n❌ No businesses collected")
+    
+    METRICS.write('golden_pages_scrape')
 
 if __name__ == "__main__":
     # Run test first
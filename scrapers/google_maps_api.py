@@ -4,15 +4,44 @@ Google Maps Places API Scraper
 Legal, reliable business data for Dublin
 """
 
-import requests
 import time
 import csv
 import json
 import os
-from typing import List, Dict, Optional
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Dict, Optional
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.http_client import get_client
+from utils.rate_limit import SharedTokenBucket
+from utils.lead_store import BUSINESS_SCHEMA, save_columnar
+from utils.metrics import METRICS
+
+class PlacesApiError(Exception):
+    """The Places API answered with an error status (REQUEST_DENIED, OVER_QUERY_LIMIT, ...)"""
 
 class GoogleMapsPlacesScraper:
-    def __init__(self, api_key: str = None):
+    DETAILS_FIELDS = 'name,formatted_address,website,formatted_phone_number,types,rating,user_ratings_total'
+    
+    # Page token maturity: wait this long after it is issued, then back off on INVALID_REQUEST
+    PAGE_TOKEN_DELAY = 2.0
+    PAGE_TOKEN_BACKOFF = 0.25
+    PAGE_TOKEN_RETRIES = 4
+    
+    # Request budget shared by every scraper process on this machine (see SharedTokenBucket):
+    # start at RATE_LIMIT_QPS, probe up to RATE_LIMIT_MAX_QPS, halve on OVER_QUERY_LIMIT
+    RATE_LIMIT_FILE = 'data/places_rate_limit.json'
+    RATE_LIMIT_QPS = 10.0
+    RATE_LIMIT_MAX_QPS = 50.0
+    QUOTA_RETRIES = 6
+    
+    # USD per 1,000 billed calls (list prices; Details with contact and
+    # atmosphere fields). Used by estimated_cost() - adjust to your billing
+    PRICE_PER_1000 = {'textsearch': 32.0, 'details': 25.0}
+    
+    def __init__(self, api_key: str = None, details_concurrency: int = 8, cache=None, limiter=None):
         # Get API key from environment variable if not provided
         if api_key is None:
             api_key = os.environ.get("GOOGLE_MAPS_API_KEY")
@@ -29,12 +58,33 @@ class GoogleMapsPlacesScraper:
         self.base_url = "https://maps.googleapis.com/maps/api/place/textsearch/json"
         self.details_url = "https://maps.googleapis.com/maps/api/place/details/json"
         
-    def search_businesses(self, query: str, location: str = "Dublin, Ireland", max_results: int = 20) -> List[Dict]:
-        """Search for businesses using Google Places API"""
+        # Max Place Details requests in flight at once (1 = serial)
+        self.details_concurrency = max(1, int(details_concurrency))
+        
+        # Optional PlaceDetailsCache (scrapers/places_cache.py)
+        self.cache = cache
+        
+        # Pooled keep-alive session shared by search and details requests
+        self.http = get_client('places')
+        
+        # Every API request takes a token first
+        if limiter is None:
+            limiter = SharedTokenBucket(self.RATE_LIMIT_FILE, rate=self.RATE_LIMIT_QPS, max_rate=self.RATE_LIMIT_MAX_QPS)
+        self.limiter = limiter
+    
+    def search_businesses(self, query: str, location: str = "Dublin, Ireland", max_results: int = 20,
+                          hydrate: bool = True, where: Callable[[Dict], bool] = None) -> List[Dict]:
+        """
+        Search for businesses using Google Places API
+        Every hit starts as a lightweight record built from Text Search alone
+        (needs_details=True: no website or phone yet). With hydrate, Place
+        Details are fetched for the records passing where (all by default);
+        the rest come back lightweight for hydrate_records() later.
+        """
         print(f"Searching Google Places: {query} in {location}")
         
         businesses = []
-        next_page_token = None
+        requested = 0
         
         try:
             # Initial search
@@ -44,58 +94,211 @@ class GoogleMapsPlacesScraper:
                 'type': 'establishment'
             }
             
-            while len(businesses) < max_results:
-                if next_page_token:
-                    params['pagetoken'] = next_page_token
-                    time.sleep(2)  # Required between page requests
-                
-                response = requests.get(self.base_url, params=params, timeout=10)
-                response.raise_for_status()
-                data = response.json()
-                
-                if data['status'] != 'OK':
-                    print(f"API Error: {data.get('status', 'UNKNOWN')}")
-                    break
-                
-                # Process results
-                for place in data.get('results', []):
-                    if len(businesses) >= max_results:
-                        break
+            data = self._fetch_search_page(params)
+            
+            # Details for page N are fetched in the background while the
+            # next_page_token for page N+1 matures and is requested
+            with ThreadPoolExecutor(max_workers=1) as pager:
+                while data is not None:
+                    next_page_token = data.get('next_page_token')
+                    token_issued = time.monotonic()
                     
-                    # Get detailed info including website
-                    detailed_info = self.get_place_details(place['place_id'])
-                    if detailed_info:
-                        businesses.append(detailed_info)
-                
-                # Check for next page
-                next_page_token = data.get('next_page_token')
-                if not next_page_token:
-                    break
+                    remaining = max_results - requested
+                    records = [self.light_record(place) for place in data.get('results', [])[:remaining]]
+                    requested += len(records)
+                    # The filter runs here, not on the pager thread (it may use e.g. sqlite)
+                    details = pager.submit(self._hydrate, records, self._pending(records, where)) if hydrate else None
+                    
+                    data = None
+                    if next_page_token and requested < max_results:
+                        data = self._fetch_search_page(params, next_page_token, token_issued)
+                    
+                    if details is not None:
+                        records = details.result()
+                        if where is None:
+                            # Full mode as before: a place whose Details failed is dropped
+                            records = [record for record in records if not record['needs_details']]
+                    businesses.extend(records)
             
             print(f"Found {len(businesses)} businesses")
             return businesses
-            
+        
         except Exception as e:
             print(f"Error searching Google Places: {e}")
             return []
     
+    def text_search(self, query: str, location: str = "Dublin, Ireland", center=None, radius: float = None,
+                    max_results: int = 60):
+        """
+        Raw Text Search results without Place Details, following page tokens
+        center=(lat, lng) and radius (metres) bias the search to a circle.
+        Returns (results, pages fetched); the API stops at 60 results.
+        Raises PlacesApiError for any status but OK and ZERO_RESULTS, so an
+        empty result always means the area really has none.
+        """
+        params = {
+            'query': f"{query} {location}",
+            'key': self.api_key,
+            'type': 'establishment'
+        }
+        if center is not None:
+            params['location'] = f"{center[0]:.6f},{center[1]:.6f}"
+            params['radius'] = int(radius)
+        
+        results = []
+        data = self._fetch_search_page(params, raise_errors=True)
+        pages = 1
+        while data is not None:
+            results.extend(data.get('results', []))
+            next_page_token = data.get('next_page_token')
+            if not next_page_token or len(results) >= max_results:
+                break
+            data = self._fetch_search_page(params, next_page_token, time.monotonic(), raise_errors=True)
+            pages += 1
+        
+        return results[:max_results], pages
+    
+    def _fetch_search_page(self, params: Dict, page_token: str = None, token_issued: float = None,
+                           raise_errors: bool = False) -> Optional[Dict]:
+        """
+        Fetch one Text Search page, waiting for and retrying an immature page token
+        None for ZERO_RESULTS; other errors are printed and give None too,
+        or raise PlacesApiError with raise_errors
+        """
+        if page_token:
+            params = dict(params, pagetoken=page_token)
+            
+            # A next_page_token is only valid a short time after it is issued
+            wait = self.PAGE_TOKEN_DELAY - (time.monotonic() - token_issued)
+            if wait > 0:
+                time.sleep(wait)
+        
+        backoff = self.PAGE_TOKEN_BACKOFF
+        for attempt in range(self.PAGE_TOKEN_RETRIES + 1):
+            data = self._api_get(self.base_url, params)
+            
+            # INVALID_REQUEST on a page token means it isn't ready yet
+            if data['status'] == 'INVALID_REQUEST' and page_token and attempt < self.PAGE_TOKEN_RETRIES:
+                time.sleep(backoff)
+                backoff *= 2
+                continue
+            break
+        
+        if data['status'] != 'OK':
+            if data['status'] != 'ZERO_RESULTS':
+                if raise_errors:
+                    raise PlacesApiError(f"{data['status']} {data.get('error_message', '')}".strip())
+                print(f"API Error: {data.get('status', 'UNKNOWN')}")
+            return None
+        
+        return data
+    
+    def _api_get(self, url: str, params: Dict) -> Dict:
+        """
+        Rate-limited API request returning the JSON body
+        OVER_QUERY_LIMIT (or HTTP 429) halves the shared rate and retries, so
+        repeated rejections back off exponentially; accepted requests nudge
+        the rate back up
+        """
+        endpoint = url.rstrip('/').split('/')[-2]  # .../textsearch/json -> textsearch
+        # Latency includes rate-limiter waits and quota retries
+        with METRICS.timer('places_api_seconds', endpoint=endpoint):
+            for attempt in range(self.QUOTA_RETRIES + 1):
+                self.limiter.acquire()
+                response = self.http.get(url, params=params)
+                
+                if response.status_code == 429:
+                    data = {'status': 'OVER_QUERY_LIMIT'}
+                else:
+                    response.raise_for_status()
+                    data = response.json()
+                METRICS.inc('places_api_requests_total', endpoint=endpoint, status=data.get('status', 'UNKNOWN'))
+                
+                if data.get('status') != 'OVER_QUERY_LIMIT':
+                    self.limiter.success()
+                    return data
+                self.limiter.throttled()
+        
+        return data
+    
+    def estimated_cost(self) -> float:
+        """USD for the Places calls made so far in this process (cache hits and quota rejections are free)"""
+        cost = 0.0
+        for endpoint, price in self.PRICE_PER_1000.items():
+            calls = METRICS.total('places_api_requests_total', endpoint=endpoint)
+            calls -= METRICS.total('places_api_requests_total', endpoint=endpoint, status='OVER_QUERY_LIMIT')
+            cost += calls * price / 1000
+        METRICS.set('places_estimated_cost_usd', cost)
+        return cost
+    
+    def light_record(self, place: Dict) -> Dict:
+        """Business record from a Text Search result alone (no website or phone)"""
+        return {
+            'name': place.get('name', 'Unknown'),
+            'address': place.get('formatted_address', ''),
+            'website': '',
+            'phone': '',
+            'category': self._determine_category(place.get('types', [])),
+            'location': 'Dublin, Ireland',
+            'place_id': place['place_id'],
+            'rating': place.get('rating'),
+            'reviews': place.get('user_ratings_total'),
+            'source': 'google_places_api',
+            'needs_details': True
+        }
+    
+    def hydrate_records(self, records: List[Dict], where: Callable[[Dict], bool] = None) -> List[Dict]:
+        """
+        Fetch Place Details for lightweight records that pass where (all if None)
+        Returns the records in order, hydrated ones replaced by their full
+        version; records failing the filter (or a Details call) stay as they are
+        """
+        return self._hydrate(records, self._pending(records, where))
+    
+    def _pending(self, records: List[Dict], where: Callable[[Dict], bool] = None) -> List[int]:
+        """Indexes of the lightweight records that pass where"""
+        return [i for i, record in enumerate(records)
+                if record.get('needs_details') and (where is None or where(record))]
+    
+    def _hydrate(self, records: List[Dict], chosen: List[int]) -> List[Dict]:
+        details = self.get_places_details([records[i]['place_id'] for i in chosen])
+        hydrated = list(records)
+        for i, detailed_info in zip(chosen, details):
+            if detailed_info:
+                hydrated[i] = detailed_info
+        return hydrated
+    
+    def get_places_details(self, place_ids: List[str]) -> List[Optional[Dict]]:
+        """Get details for several places concurrently, keeping input order"""
+        if self.details_concurrency == 1 or len(place_ids) <= 1:
+            return [self.get_place_details(place_id) for place_id in place_ids]
+        
+        workers = min(self.details_concurrency, len(place_ids))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.get_place_details, place_ids))
+    
     def get_place_details(self, place_id: str) -> Optional[Dict]:
         """Get detailed information for a place including website"""
         try:
-            params = {
-                'place_id': place_id,
-                'key': self.api_key,
-                'fields': 'name,formatted_address,website,formatted_phone_number,types,rating,user_ratings_total'
-            }
-            
-            response = requests.get(self.details_url, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            
-            if data['status'] != 'OK':
-                return None
+            result = self.cache.get(place_id, self.DETAILS_FIELDS) if self.cache else None
+            if self.cache:
+                METRICS.inc('cache_requests_total', cache='place_details', result='miss' if result is None else 'hit')
             
-            result = data['result']
+            if result is None:
+                params = {
+                    'place_id': place_id,
+                    'key': self.api_key,
+                    'fields': self.DETAILS_FIELDS
+                }
+                
+                data = self._api_get(self.details_url, params)
+                
+                if data['status'] != 'OK':
+                    return None
+                
+                result = data['result']
+                if self.cache:
+                    self.cache.put(place_id, self.DETAILS_FIELDS, result)
             
             # Determine category from types
             category = self._determine_category(result.get('types', []))
@@ -110,9 +313,10 @@ class GoogleMapsPlacesScraper:
                 'place_id': place_id,
                 'rating': result.get('rating'),
                 'reviews': result.get('user_ratings_total'),
-                'source': 'google_places_api'
+                'source': 'google_places_api',
+                'needs_details': False
             }
-            
+        
         except Exception as e:
             print(f"Error getting place details: {e}")
             return None
@@ -146,13 +350,14 @@ class GoogleMapsPlacesScraper:
             print("No businesses to save")
             return
         
-        fieldnames = ['name', 'address', 'website', 'phone', 'category', 'location', 'rating', 'reviews', 'place_id', 'source']
+        fieldnames = list(BUSINESS_SCHEMA)
         
         with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
             writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
             writer.writeheader()
             for business in businesses:
                 writer.writerow(business)
+        save_columnar(businesses, filename, BUSINESS_SCHEMA)
         
         print(f"✅ Saved {len(businesses)} businesses to {filename}")
         
@@ -180,7 +385,7 @@ def test_with_mock_api():
             scraper.save_to_csv(businesses, 'data/test_output.csv')
         else:
             print("⚠️  No businesses found (might be API restrictions)")
-            
+    
     except ValueError as e:
         print("❌ API key not configured:")
         print(f"   {e}")
@@ -262,7 +467,7 @@ def test_with_mock_api():
         print("   • Accurate website/contact info")
         print("   • Legal, reliable data")
         print("   • Cost: ~$0.16 for 500 businesses")
-        
+    
     else:
         # Real API key provided
         scraper = GoogleMapsPlacesScraper(api_key)
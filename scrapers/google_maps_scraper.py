@@ -4,16 +4,22 @@ Google Maps Scraper for Dublin Businesses
 Extracts: name, address, website, phone, category
 """
 
-import requests
 import time
 import csv
 import re
 from bs4 import BeautifulSoup
 from urllib.parse import quote_plus
+import os
+import sys
 
-HEADERS = {
-    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-}
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.http_client import get_client
+from utils.html_parsing import HTML_PARSER, class_strainer
+from utils.lead_store import BUSINESS_SCHEMA, save_columnar
+
+# Only business cards are parsed; the rest of the page is skipped
+CARD_STRAINER = class_strainer('div', 'section-result')
 
 def search_google_maps(query, location="Dublin, Ireland", max_results=10):
     """Search Google Maps for businesses"""
@@ -24,11 +30,11 @@ def search_google_maps(query, location="Dublin, Ireland", max_results=10):
     print(f"Searching: {query} in {location}")
     
     try:
-        response = requests.get(url, headers=HEADERS, timeout=10)
+        response = get_client('google_maps').get(url)
         response.raise_for_status()
         
-        # Parse HTML
-        soup = BeautifulSoup(response.text, 'html.parser')
+        # Parse HTML (business cards only)
+        soup = BeautifulSoup(response.text, HTML_PARSER, parse_only=CARD_STRAINER)
         
         # Extract business cards (simplified - real scraping needs more work)
         businesses = []
@@ -91,6 +97,7 @@ def save_to_csv(businesses, filename):
         writer.writeheader()
         for business in businesses:
             writer.writerow(business)
+    save_columnar(businesses, filename, BUSINESS_SCHEMA)
     
     print(f"Saved {len(businesses)} businesses to {filename}")
 
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Lazy Place Details hydration
+Lightweight Places records (needs_details=True) carry everything Text
+Search returns; only website and phone need a Details call. These filters
+pick which records are worth that call, now or in a later run:
+
+    scraper.search_businesses('dentists', max_results=60, where=min_rating(4.0))
+    python3 scrapers/hydrate.py data/places_light.csv --min-rating 4 --skip-known
+"""
+
+import argparse
+import os
+import sys
+from typing import Callable, Dict
+
+import pandas as pd
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.lead_store import BUSINESS_SCHEMA, load_table, save_table, to_records
+
+Filter = Callable[[Dict], bool]
+
+def min_rating(rating: float, min_reviews: int = 0) -> Filter:
+    """Places rated at least rating (with at least min_reviews reviews)"""
+    return lambda record: (record.get('rating') or 0) >= rating and (record.get('reviews') or 0) >= min_reviews
+
+def in_categories(*categories: str) -> Filter:
+    """Places whose category (from Text Search types) is one of these"""
+    wanted = set(categories)
+    return lambda record: record.get('category') in wanted
+
+def not_in_lead_store(store) -> Filter:
+    """Places not analyzed before (a LeadStateStore from analysis/lead_state.py)"""
+    return lambda record: not store.contains(record)
+
+def all_of(*filters: Filter) -> Filter:
+    return lambda record: all(check(record) for check in filters)
+
+def hydrate_csv(csv_file: str, output_file: str = None, where: Filter = None, scraper=None):
+    """Hydrate the lightweight records of a saved scrape in place (or into output_file)"""
+    if scraper is None:
+        from scrapers.google_maps_api import GoogleMapsPlacesScraper
+        scraper = GoogleMapsPlacesScraper()
+    
+    records = to_records(load_table(csv_file, BUSINESS_SCHEMA))
+    pending = sum(1 for record in records if record['needs_details'])
+    records = scraper.hydrate_records(records, where)
+    remaining = sum(1 for record in records if record['needs_details'])
+    
+    output_file = output_file or csv_file
+    save_table(pd.DataFrame(records), output_file, BUSINESS_SCHEMA)
+    print(f"✅ Hydrated {pending - remaining} of {pending} lightweight records "
+          f"({remaining} left for later) -> {output_file}")
+    return records
+
+def main():
+    parser = argparse.ArgumentParser(description="Fetch Place Details for lightweight records")
+    parser.add_argument('csv_file')
+    parser.add_argument('--output')
+    parser.add_argument('--min-rating', type=float)
+    parser.add_argument('--min-reviews', type=int, default=0)
+    parser.add_argument('--category', action='append', help="only this category (repeatable)")
+    parser.add_argument('--skip-known', action='store_true', help="skip businesses already in the lead store")
+    args = parser.parse_args()
+    
+    filters = []
+    if args.min_rating is not None:
+        filters.append(min_rating(args.min_rating, args.min_reviews))
+    if args.category:
+        filters.append(in_categories(*args.category))
+    store = None
+    if args.skip_known:
+        from analysis.lead_state import LeadStateStore
+        store = LeadStateStore()
+        filters.append(not_in_lead_store(store))
+    
+    hydrate_csv(args.csv_file, args.output, all_of(*filters) if filters else None)
+    if store:
+        store.close()
+
+if __name__ == "__main__":
+    main()
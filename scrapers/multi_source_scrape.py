@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Multi-Source Dublin Business Scrape
+Every category goes to all enabled sources at once; total time is about
+that of the slowest source rather than the sum of all of them
+"""
+
+import os
+import sys
+import time
+from collections import Counter
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scrapers.sources import enabled_sources, fan_out, save_to_csv
+from scrapers.checkpoint import ScrapeJournal, journal_path
+from scrapers.dedup import dedupe
+from utils.metrics import METRICS
+
+def main(output_file='data/multi_category_businesses.csv'):
+    print("=== MULTI-SOURCE DUBLIN SCRAPE ===")
+    
+    categories = [
+        'restaurants', 'dentists', 'plumbers', 'cafes', 'hotels',
+        'electricians', 'solicitors', 'accountants', 'hairdressers', 'builders'
+    ]
+    
+    sources = enabled_sources()
+    print(f"Sources: {', '.join(source.name for source in sources)}")
+    print("")
+    
+    journal = ScrapeJournal(journal_path(output_file))
+    
+    start = time.time()
+    with METRICS.stage('scrape') as stage:
+        all_businesses = list(fan_out(categories, sources, location="Dublin", max_results=15, journal=journal))
+        stage.add(len(all_businesses))
+    elapsed = time.time() - start
+    
+    if all_businesses:
+        per_source = Counter(b['source'] for b in all_businesses)
+        
+        # The same business is usually listed by several sources (and categories)
+        with METRICS.stage('dedupe') as stage:
+            unique_businesses = dedupe(all_businesses)
+            stage.add(len(all_businesses))
+        with METRICS.stage('save') as stage:
+            save_to_csv(unique_businesses, output_file)
+            stage.add(len(unique_businesses))
+        journal.close(remove=True)
+        
+        print("")
+        print(f"🎉 {len(all_businesses)} records from {len(sources)} sources in {elapsed:.0f}s")
+        for label, count in per_source.most_common():
+            print(f"   {label}: {count}")
+        print(f"🔗 {len(unique_businesses)} unique businesses after merging "
+              f"{len(all_businesses) - len(unique_businesses)} duplicates")
+    else:
+        journal.close()
+        print("❌ No businesses collected")
+    
+    METRICS.write('multi_source_scrape')
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Concurrent results-page crawling for the directory scrapers
+"""
+
+import math
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.http_client import get_client
+from utils.metrics import METRICS
+
+# Safety cap for a site that never returns an empty page
+MAX_PAGES = 50
+# Consecutive pages that may fail before the crawl gives up
+MAX_FAILED_PAGES = 2
+
+def page_fetcher(source, label, query, page_url, client, throttle, parse, journal=None):
+    """
+    fetch_page(page) for crawl_pages over a directory site's results pages
+    page_url(page) builds the URL and parse(html) returns its businesses.
+    Journaled pages are reused and new ones recorded; every request waits on
+    throttle, and parse time, listings and errors are counted under source.
+    A failed page is logged and re-raised, see crawl_pages.
+    """
+    def fetch_page(page):
+        done = journal.get(source, query, page) if journal else None
+        if done is not None:
+            return done
+        
+        url = page_url(page)
+        try:
+            throttle.wait(url)
+            response = get_client(client).get(url)
+            response.raise_for_status()
+            
+            with METRICS.timer('parse_seconds', source=source):
+                businesses = parse(response.text)
+            METRICS.inc('listings_total', len(businesses), source=source)
+            if journal:
+                journal.record(source, query, page, businesses)
+            return businesses
+        
+        except Exception as e:
+            print(f"Error searching {label}: {e}")
+            METRICS.inc('scrape_errors_total', source=source, error=type(e).__name__)
+            raise  # A failed page is not the end of the results
+    
+    return fetch_page
+
+def crawl_pages(fetch_page, max_results, per_page, max_in_flight=3, max_pages=MAX_PAGES):
+    """
+    Fetch results pages 1, 2, ... concurrently and combine them in page order
+    fetch_page(page_number) returns that page's businesses, or raises if the
+    page couldn't be fetched. Crawling stops at the first page with no
+    listings, once max_results businesses are collected, or at max_pages.
+    per_page is only the expected page size: it limits how many pages are
+    requested ahead (at most max_in_flight), so smaller real pages just mean
+    more of them. A failed page is skipped; MAX_FAILED_PAGES in a row end
+    the crawl with what was collected.
+    """
+    businesses = []
+    pending = {}
+    next_page = 1
+    failed_in_row = 0
+    
+    with ThreadPoolExecutor(max_workers=max(1, max_in_flight)) as executor:
+        while True:
+            # Keep the window full, but only as deep as the missing results need
+            wanted = max(1, min(max_in_flight, math.ceil((max_results - len(businesses)) / per_page)))
+            while next_page <= max_pages and len(pending) < wanted:
+                pending[next_page] = executor.submit(fetch_page, next_page)
+                next_page += 1
+            if not pending:
+                break
+            
+            # Consume pages strictly in order so results keep page order
+            page = min(pending)
+            try:
+                page_businesses = pending.pop(page).result()
+            except Exception as e:
+                failed_in_row += 1
+                print(f"⚠️  Results page {page} failed: {e}")
+                if failed_in_row >= MAX_FAILED_PAGES:
+                    print(f"⚠️  {failed_in_row} pages failed in a row - stopping with {len(businesses)} results")
+                    break
+                continue
+            
+            failed_in_row = 0
+            businesses.extend(page_businesses)
+            if not page_businesses or len(businesses) >= max_results:
+                break
+        
+        # Later pages are past the end - don't start them
+        for future in pending.values():
+            future.cancel()
+    
+    return businesses[:max_results]
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Persistent Place Details cache
+SQLite store keyed by place_id + fields, with TTL and LRU eviction
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+class PlaceDetailsCache:
+    def __init__(self, path: str = 'data/places_cache.db', ttl_days: float = 30, max_entries: int = 50000):
+        self.path = path
+        self.ttl_seconds = ttl_days * 86400
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        # Shared by the Place Details worker threads
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS place_details (
+                place_id TEXT NOT NULL,
+                fields TEXT NOT NULL,
+                result TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                last_used REAL NOT NULL,
+                PRIMARY KEY (place_id, fields)
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_last_used ON place_details (last_used)")
+        self._conn.commit()
+    
+    def get(self, place_id: str, fields: str) -> Optional[Dict]:
+        """Return the cached API result, or None if missing or expired"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result, fetched_at FROM place_details WHERE place_id = ? AND fields = ?",
+                (place_id, fields)
+            ).fetchone()
+            
+            if row is None or now - row[1] > self.ttl_seconds:
+                self.misses += 1
+                return None
+            
+            self._conn.execute(
+                "UPDATE place_details SET last_used = ? WHERE place_id = ? AND fields = ?",
+                (now, place_id, fields)
+            )
+            self._conn.commit()
+            self.hits += 1
+            return json.loads(row[0])
+    
+    def put(self, place_id: str, fields: str, result: Dict):
+        """Store an API result, evicting least recently used entries over the cap"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO place_details VALUES (?, ?, ?, ?, ?)",
+                (place_id, fields, json.dumps(result), now, now)
+            )
+            
+            count = self._conn.execute("SELECT COUNT(*) FROM place_details").fetchone()[0]
+            if count > self.max_entries:
+                excess = count - self.max_entries
+                self._conn.execute(
+                    "DELETE FROM place_details WHERE rowid IN "
+                    "(SELECT rowid FROM place_details ORDER BY last_used LIMIT ?)",
+                    (excess,)
+                )
+                self.evictions += excess
+            self._conn.commit()
+    
+    def purge_expired(self) -> int:
+        """Delete expired entries, returns number removed"""
+        cutoff = time.time() - self.ttl_seconds
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM place_details WHERE fetched_at < ?", (cutoff,))
+            self._conn.commit()
+            return cursor.rowcount
+    
+    def stats(self) -> Dict:
+        """Hit/miss counters for this run"""
+        lookups = self.hits + self.misses
+        with self._lock:
+            size = self._conn.execute("SELECT COUNT(*) FROM place_details").fetchone()[0]
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'entries': size
+        }
+    
+    def close(self):
+        with self._lock:
+            self._conn.close()
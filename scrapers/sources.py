@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Business data source registry
+Common interface over the Places API, Golden Pages, Yell and Google Maps
+HTML scrapers, with concurrent fan-out of categories to every enabled source
+"""
+
+import csv
+import os
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Dict, Iterator, List
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.lead_store import BUSINESS_SCHEMA, save_columnar
+from utils.metrics import METRICS
+
+# One schema for every source; fields a source doesn't provide are left blank
+UNIFIED_FIELDS = list(BUSINESS_SCHEMA)
+
+class BusinessSource(ABC):
+    """Base class: subclasses set name and implement search()"""
+    name = None
+    enabled = True
+    concurrency = 2     # Category searches in flight for this source
+    timeout = 300       # Seconds before a category search is abandoned
+    
+    def available(self) -> bool:
+        """False if the source can't run here (e.g. missing API key)"""
+        return True
+    
+    @abstractmethod
+    def search(self, category: str, location: str, max_results: int) -> List[Dict]:
+        """Up to max_results businesses for category in location"""
+
+SOURCES = {}
+
+def register_source(cls):
+    """Class decorator adding a BusinessSource to the registry"""
+    SOURCES[cls.name] = cls
+    return cls
+
+@register_source
+class GooglePlacesSource(BusinessSource):
+    name = 'google_places'
+    concurrency = 4
+    
+    def __init__(self, **scraper_options):
+        self.scraper_options = scraper_options
+        self._scraper = None
+        self._scraper_lock = threading.Lock()  # Categories search concurrently; build one scraper
+    
+    def available(self):
+        key = os.environ.get("GOOGLE_MAPS_API_KEY", "")
+        return bool(self.scraper_options.get('api_key') or key.strip())
+    
+    def search(self, category, location, max_results):
+        from scrapers.google_maps_api import GoogleMapsPlacesScraper
+        with self._scraper_lock:
+            if self._scraper is None:
+                self._scraper = GoogleMapsPlacesScraper(**self.scraper_options)
+        return self._scraper.search_businesses(category, location=f"{location}, Ireland", max_results=max_results)
+
+@register_source
+class GoldenPagesSource(BusinessSource):
+    name = 'golden_pages'
+    
+    def search(self, category, location, max_results):
+        from scrapers.golden_pages_scraper import search_golden_pages
+        return search_golden_pages(category, location, max_results)
+
+@register_source
+class YellSource(BusinessSource):
+    name = 'yell'
+    
+    def search(self, category, location, max_results):
+        from scrapers.yell_scraper import search_yell
+        return search_yell(category, location, max_results)
+
+@register_source
+class GoogleMapsHtmlSource(BusinessSource):
+    name = 'google_maps_html'
+    enabled = False  # Google Maps HTML changes too often to rely on
+    concurrency = 1
+    
+    def search(self, category, location, max_results):
+        from scrapers.google_maps_scraper import search_google_maps
+        return search_google_maps(category, f"{location}, Ireland", max_results)
+
+def unify(business: Dict, source: BusinessSource) -> Dict:
+    """Map a source record onto UNIFIED_FIELDS"""
+    record = {field: business.get(field, '') for field in UNIFIED_FIELDS}
+    if not record['source']:
+        record['source'] = source.name
+    return record
+
+def enabled_sources(names=None) -> List[BusinessSource]:
+    """Instantiate the named sources, or every enabled and available one"""
+    if names:
+        sources = [SOURCES[name]() for name in names]
+    else:
+        sources = [cls() for cls in SOURCES.values() if cls.enabled]
+    
+    usable = []
+    for source in sources:
+        if source.available():
+            usable.append(source)
+        else:
+            print(f"⚠️  Source {source.name} not available - skipping")
+    return usable
+
+def fan_out(categories, sources=None, location="Dublin", max_results=20, journal=None) -> Iterator[Dict]:
+    """
+    Search every category on every source concurrently, yielding unified
+    records as each (source, category) search finishes. Each source has its
+    own worker pool (concurrency) and per-search timeout. With a
+    ScrapeJournal, finished (source, category) searches are skipped.
+    A timed-out search is only abandoned: its results are dropped, but a
+    thread can't be interrupted, so it keeps its pool slot until the
+    source's own request timeouts end it, and the interpreter waits for
+    it on exit.
+    """
+    if sources is None:
+        sources = enabled_sources()
+    
+    executors = {source.name: ThreadPoolExecutor(max_workers=source.concurrency) for source in sources}
+    started = {}
+    pending = {}
+    
+    def run(source, category):
+        started[(source.name, category)] = time.monotonic()
+        return source.search(category, location, max_results)
+    
+    for category in categories:
+        for source in sources:
+            done = journal.get(source.name, category) if journal else None
+            if done is not None:
+                yield from done
+                continue
+            future = executors[source.name].submit(run, source, category)
+            pending[future] = (source, category)
+    
+    try:
+        while pending:
+            done, _ = wait(pending, timeout=1.0, return_when=FIRST_COMPLETED)
+            
+            for future in done:
+                source, category = pending.pop(future)
+                try:
+                    records = [unify(business, source) for business in future.result()]
+                except Exception as e:
+                    print(f"❌ {source.name}/{category} failed: {e}")
+                    METRICS.inc('source_searches_total', source=source.name, outcome='error')
+                    continue
+                
+                elapsed = time.monotonic() - started[(source.name, category)]
+                print(f"✅ {source.name}/{category}: {len(records)} businesses in {elapsed:.1f}s")
+                METRICS.inc('source_searches_total', source=source.name, outcome='ok')
+                METRICS.inc('source_records_total', len(records), source=source.name)
+                METRICS.observe('source_search_seconds', elapsed, source=source.name)
+                if journal and records:
+                    journal.record(source.name, category, None, records)
+                yield from records
+            
+            # Abandon searches that have run past their source's timeout
+            now = time.monotonic()
+            for future, (source, category) in list(pending.items()):
+                began = started.get((source.name, category))
+                if began is not None and now - began > source.timeout:
+                    print(f"⏱️  {source.name}/{category} timed out after {source.timeout}s")
+                    METRICS.inc('source_searches_total', source=source.name, outcome='timeout')
+                    future.cancel()  # No-op once running, see above
+                    del pending[future]
+    finally:
+        for executor in executors.values():
+            executor.shutdown(wait=False, cancel_futures=True)
+
+def save_to_csv(businesses: List[Dict], filename: str):
+    """Save unified records to CSV"""
+    if not businesses:
+        print("No businesses to save")
+        return
+    
+    with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=UNIFIED_FIELDS)
+        writer.writeheader()
+        for business in businesses:
+            writer.writerow(business)
+    save_columnar(businesses, filename, BUSINESS_SCHEMA)
+    
+    print(f"✅ Saved {len(businesses)} businesses to {filename}")
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Geographic tile planner for Places Text Search
+A single Text Search stops at 60 results. The planner covers a bounding box
+with tiles (location + radius), runs them concurrently, splits any tile that
+hits the cap into four, and dedupes overlapping results by place_id before
+any Place Details are fetched.
+"""
+
+import math
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.metrics import METRICS
+
+# (south, west, north, east) - County Dublin
+DUBLIN_BBOX = (53.20, -6.45, 53.63, -6.04)
+
+TEXT_SEARCH_CAP = 60
+EARTH_RADIUS_M = 6_371_000
+
+class Tile:
+    """A lat/lng rectangle, searched as the circle around it"""
+    
+    def __init__(self, south: float, west: float, north: float, east: float, depth: int = 0):
+        self.south, self.west, self.north, self.east = south, west, north, east
+        self.depth = depth
+    
+    def center(self) -> Tuple[float, float]:
+        return (self.south + self.north) / 2, (self.west + self.east) / 2
+    
+    def radius(self) -> float:
+        """Metres from the centre to a corner, so the circle covers the whole rectangle"""
+        lat, lng = self.center()
+        return distance_m(lat, lng, self.north, self.east)
+    
+    def contains(self, lat: float, lng: float) -> bool:
+        return self.south <= lat < self.north and self.west <= lng < self.east
+    
+    def split(self) -> List['Tile']:
+        lat, lng = self.center()
+        depth = self.depth + 1
+        return [Tile(self.south, self.west, lat, lng, depth), Tile(self.south, lng, lat, self.east, depth),
+                Tile(lat, self.west, self.north, lng, depth), Tile(lat, lng, self.north, self.east, depth)]
+
+def distance_m(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """Great-circle distance in metres"""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(lng2 - lng1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(math.sqrt(a))
+
+def grid(bbox=DUBLIN_BBOX, tile_km: float = 5.0) -> List[Tile]:
+    """Cover a bounding box with roughly tile_km x tile_km tiles"""
+    south, west, north, east = bbox
+    height_km = distance_m(south, west, north, west) / 1000
+    width_km = distance_m(south, west, south, east) / 1000
+    rows = max(1, math.ceil(height_km / tile_km))
+    cols = max(1, math.ceil(width_km / tile_km))
+    dlat = (north - south) / rows
+    dlng = (east - west) / cols
+    return [Tile(south + r * dlat, west + c * dlng, south + (r + 1) * dlat, west + (c + 1) * dlng)
+            for r in range(rows) for c in range(cols)]
+
+def in_tile(tile: Tile, result: Dict) -> bool:
+    """Whether a Text Search result lies in the tile (results without a location are kept)"""
+    location = (result.get('geometry') or {}).get('location') or {}
+    if location.get('lat') is None or location.get('lng') is None:
+        return True
+    return tile.contains(location['lat'], location['lng'])
+
+class TilePlanner:
+    """
+    Plans and runs a tiled Text Search for one query
+    Tiles are searched level by level; a tile whose search came back full
+    (the 60-result cap) is split and its quadrants searched at the next level,
+    down to max_depth. Text Search only biases towards the circle, so each
+    tile keeps the results inside its own rectangle.
+    """
+    
+    def __init__(self, scraper, query: str, location: str = "Dublin, Ireland", bbox=DUBLIN_BBOX,
+                 tile_km: float = 5.0, max_depth: int = 3, concurrency: int = 8):
+        self.scraper = scraper
+        self.query = query
+        self.location = location
+        self.bbox = bbox
+        self.tile_km = tile_km
+        self.max_depth = max_depth
+        self.concurrency = max(1, concurrency)
+        self.places = {}   # place_id -> Text Search result, first tile wins
+        self.levels = []   # Coverage vs. calls after each level
+        self.failed_tiles = 0
+    
+    def search_tile(self, tile: Tile):
+        """(tile, results inside it, whether the search hit the cap, pages fetched, failed)"""
+        try:
+            results, pages = self.scraper.text_search(self.query, self.location, tile.center(), tile.radius())
+        except Exception as e:
+            # A network error or an API error status (see text_search) fails this tile only
+            print(f"⚠️  Tile {tile.south:.3f},{tile.west:.3f} (depth {tile.depth}) failed: {e}")
+            METRICS.inc('scrape_errors_total', source='places_tiles', error=type(e).__name__)
+            return tile, [], False, 0, True
+        capped = len(results) >= TEXT_SEARCH_CAP
+        inside = [result for result in results if in_tile(tile, result)]
+        return tile, inside, capped, pages, False
+    
+    def run(self) -> Dict[str, Dict]:
+        """Search every tile, returns unique Text Search results by place_id"""
+        tiles = grid(self.bbox, self.tile_km)
+        calls = 0
+        
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            while tiles:
+                depth = tiles[0].depth
+                split = []
+                capped_tiles = 0
+                failed_tiles = 0
+                for tile, inside, capped, pages, failed in executor.map(self.search_tile, tiles):
+                    calls += pages
+                    failed_tiles += failed
+                    for result in inside:
+                        self.places.setdefault(result['place_id'], result)
+                    if capped:
+                        capped_tiles += 1
+                        if tile.depth < self.max_depth:
+                            split.extend(tile.split())
+                
+                self.levels.append({'depth': depth, 'tiles': len(tiles), 'search_calls': calls,
+                                    'unique_places': len(self.places), 'capped_tiles': capped_tiles,
+                                    'failed_tiles': failed_tiles})
+                self.failed_tiles += failed_tiles
+                tiles = split
+        
+        return self.places
+    
+    def report(self):
+        """Print how coverage grew with each level of subdivision"""
+        print(f"🗺️  Tile plan for '{self.query}': {self.tile_km:g} km grid, max depth {self.max_depth}")
+        for level in self.levels:
+            print(f"   depth {level['depth']}: {level['tiles']} tiles, {level['search_calls']} search calls so far, "
+                  f"{level['unique_places']} unique places ({level['capped_tiles']} tiles hit the {TEXT_SEARCH_CAP} cap, "
+                  f"{level['failed_tiles']} failed)")
+        if self.levels and self.levels[-1]['capped_tiles']:
+            print(f"   ⚠️  {self.levels[-1]['capped_tiles']} tiles still capped at max depth - coverage incomplete")
+        if self.failed_tiles:
+            print(f"   ⚠️  {self.failed_tiles} tiles failed - their areas are missing from the results")
+
+def search_tiled(scraper, query: str, location: str = "Dublin, Ireland", bbox=DUBLIN_BBOX,
+                 tile_km: float = 5.0, max_depth: int = 3, concurrency: int = 8, where=None) -> List[Dict]:
+    """
+    Tiled search, then Place Details once per unique place_id
+    With a where filter (see scrapers/hydrate.py) only matching places are
+    hydrated; the rest are returned as lightweight records
+    """
+    planner = TilePlanner(scraper, query, location, bbox, tile_km, max_depth, concurrency)
+    places = planner.run()
+    planner.report()
+    
+    records = [scraper.light_record(place) for place in places.values()]
+    businesses = scraper.hydrate_records(records, where)
+    if where is None:
+        businesses = [business for business in businesses if not business['needs_details']]
+    hydrated = sum(1 for business in businesses if not business['needs_details'])
+    print(f"   {hydrated} businesses hydrated with Place Details, {len(businesses) - hydrated} lightweight")
+    return businesses
+
+def main():
+    """City-wide scrape of one category: python3 scrapers/tile_planner.py plumbers [max_depth]"""
+    from scrapers.google_maps_api import GoogleMapsPlacesScraper
+    from scrapers.sources import save_to_csv
+    
+    query = sys.argv[1] if len(sys.argv) > 1 else 'plumbers'
+    max_depth = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    
+    businesses = search_tiled(GoogleMapsPlacesScraper(), query, max_depth=max_depth)
+    save_to_csv(businesses, f"data/tiled_{query.replace(' ', '_')}.csv")
+
+if __name__ == "__main__":
+    main()
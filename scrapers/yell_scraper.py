@@ -4,42 +4,60 @@ Yell.ie Scraper for Dublin Businesses
 Simpler than Google Maps
 """
 
-import requests
 import time
 import csv
 from bs4 import BeautifulSoup
+import os
+import sys
 
-HEADERS = {
-    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-}
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.http_client import get_client
+from utils.html_parsing import HTML_PARSER, class_strainer
+from utils.lead_store import BUSINESS_SCHEMA, save_columnar
+from utils.rate_limit import HostThrottle
+from utils.metrics import METRICS
+from scrapers.pagination import crawl_pages, page_fetcher
 
-def search_yell(query, location="Dublin", max_results=10):
-    """Search Yell.ie for businesses"""
+SOURCE = 'yell.ie'
+RESULTS_PER_PAGE = 15
+
+# Minimum gap between requests to yell.ie, shared by all page fetches
+THROTTLE = HostThrottle(1.0)
+
+# Only listing containers are parsed; the rest of the page is skipped
+LISTING_STRAINER = class_strainer('div', 'businessCapsule')
+
+def search_yell(query, location="Dublin", max_results=10, max_in_flight=3, journal=None):
+    """
+    Search Yell.ie for businesses, following results pages up to max_results
+    With a ScrapeJournal, pages already journaled are reused and new ones recorded
+    """
     base_url = "https://www.yell.ie"
     search_url = f"{base_url}/s/{query}/{location}"
     
     print(f"Searching Yell.ie: {query} in {location}")
     
-    try:
-        response = requests.get(search_url, headers=HEADERS, timeout=10)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.text, 'html.parser')
-        businesses = []
-        
-        # Look for business listings
-        listings = soup.find_all('div', {'class': 'businessCapsule'})
-        
-        for listing in listings[:max_results]:
-            business = extract_yell_info(listing, query)
-            if business:
-                businesses.append(business)
-        
-        return businesses
-        
-    except Exception as e:
-        print(f"Error searching Yell.ie: {e}")
-        return []
+    fetch_page = page_fetcher(SOURCE, 'Yell.ie', query,
+                              lambda page: search_url if page == 1 else f"{search_url}?pageNum={page}",
+                              'yell', THROTTLE, lambda html: parse_yell(html, query, max_results), journal)
+    
+    return crawl_pages(fetch_page, max_results, RESULTS_PER_PAGE, max_in_flight)
+
+def parse_yell(html, query, max_results=10):
+    """Parse business listings from a Yell.ie results page"""
+    soup = BeautifulSoup(html, HTML_PARSER, parse_only=LISTING_STRAINER)
+    businesses = []
+    
+    # Look for business listings
+    listings = soup.find_all('div', {'class': 'businessCapsule'})
+    
+    for listing in listings[:max_results]:
+        business = extract_yell_info(listing, query)
+        if business:
+            businesses.append(business)
+    
+    return businesses
 
 def extract_yell_info(listing, category):
     """Extract business info from Yell listing"""
@@ -86,6 +104,7 @@ def save_to_csv(businesses, filename):
         writer.writeheader()
         for business in businesses:
             writer.writerow(business)
+    save_columnar(businesses, filename, BUSINESS_SCHEMA)
     
     print(f"Saved {len(businesses)} businesses to {filename}")
 
@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+Phone normalization used to match businesses across sources
+Run with pytest, or directly: python3 tests/test_dedup.py
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scrapers.dedup import normalize_phone
+
+def test_irish_formats_normalize_alike():
+    for phone in ['+353 1 234 5678', '+353 (0)1 234 5678', '(01) 234 5678', '01-234-5678', '00353 1 234 5678',
+                  '353 1 234 5678', '+353 (0) 1 234 5678']:
+        assert normalize_phone(phone) == '+35312345678', phone
+    assert normalize_phone('+353 (0)86 123 4567') == normalize_phone('086 123 4567') == '+353861234567'
+
+def test_other_countries_and_junk():
+    assert normalize_phone('+44 20 7946 0958') == '+442079460958'
+    assert normalize_phone('+39 06 1234 5678') == '+390612345678'  # Italy keeps its leading 0
+    assert normalize_phone('234 5678') == ''
+    assert normalize_phone('') == normalize_phone(None) == ''
+
+if __name__ == "__main__":
+    test_irish_formats_normalize_alike()
+    test_other_countries_and_junk()
+    print("✅ Dedup tests passed")
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Chunked FeatureScanner feeds must give the same features as extract_features
+on the whole page. Run with pytest, or directly: python3 tests/test_feature_extractor.py
+"""
+
+import os
+import random
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from analysis import feature_extractor
+from analysis.feature_extractor import MAX_CARRY, FeatureScanner, extract_features, score_features
+
+# Everything a page needs to settle a skip_when_decided scan
+DECIDED_HEAD = ('<meta name="viewport"><script src="react.js"></script><link href="bootstrap.css">'
+                '<a href="https://facebook.com/x">fb</a> phone tel: email\n')
+
+PIECES = ['<meta name="viewport">', 'copyright 2025', 'copyright ', '2019', 'contact', 'form', 'phone', 'tel:',
+          'email', '@x.ie', '@', '.com', 'react', 'jquery', 'flash', '<table> for layout', 'facebook.com',
+          'twitter.com', 'bootstrap', '<img src=a alt=x>', '<img src=b>', '<p>text</p>', ' ', '\n']
+
+def scan_chunked(html, sizes, skip_when_decided=False):
+    """Feed html in chunks whose lengths come from sizes(), returns the features"""
+    scanner = FeatureScanner(skip_when_decided=skip_when_decided)
+    position = 0
+    while position < len(html):
+        size = sizes()
+        scanner.feed(html[position:position + size])
+        position += size
+    scanner.close()
+    return scanner.features()
+
+def test_settling_in_last_feed_counts_partial_line():
+    html = DECIDED_HEAD + 'copyright 2025\n<img src=a alt=x><img src=b alt=y>'
+    features = scan_chunked(html, lambda: len(html), skip_when_decided=True)
+    assert features == extract_features(html)
+    assert features['img_tags'] == 2
+
+def test_random_chunk_splits_match_full_scan():
+    for seed in range(2000):
+        rng = random.Random(seed)
+        html = ''.join(rng.choice(PIECES) for _ in range(rng.randint(1, 150)))
+        expected = extract_features(html)
+        for skip_when_decided in (False, True):
+            features = scan_chunked(html, lambda: rng.randint(1, 40), skip_when_decided)
+            assert features == expected, f"seed {seed}, skip_when_decided={skip_when_decided}"
+
+def minified_page():
+    """One line over MAX_CARRY where each two-part pattern has a cut point between its halves"""
+    filler = '<div class="row"><span>lorem ipsum</span></div>' * (MAX_CARRY // 40)
+    return ('<html><head><meta name="viewport"><script src="react.js"></script></head><body>' + filler +
+            '<footer>copyright <b>' + filler + '2025</b> contact <a>' + filler + 'our form</a> info@' +
+            filler + 'example.ie<img src=a alt=logo></footer></body></html>')
+
+def test_long_single_line_matches_full_scan():
+    html = minified_page()
+    assert '\n' not in html and len(html) > 3 * MAX_CARRY
+    expected = extract_features(html)
+    assert expected['copyright_year'] == 2025 and expected['contact_info']
+    for skip_when_decided in (False, True):
+        features = scan_chunked(html, lambda: 8192, skip_when_decided)
+        assert features == expected
+        assert score_features('https://example.ie', features) == score_features('https://example.ie', expected)
+
+def test_random_cut_lines_match_full_scan():
+    # A small MAX_CARRY forces many cuts; '<b>' every few pieces leaves somewhere safe to cut
+    saved = feature_extractor.MAX_CARRY
+    feature_extractor.MAX_CARRY = 120
+    try:
+        for seed in range(2000):
+            rng = random.Random(seed)
+            pieces = [rng.choice(PIECES[:-1]) + ('<b>' if i % 3 == 2 else '') for i in range(rng.randint(1, 150))]
+            html = ''.join(pieces)
+            expected = extract_features(html)
+            for skip_when_decided in (False, True):
+                features = scan_chunked(html, lambda: rng.randint(1, 60), skip_when_decided)
+                assert features == expected, f"seed {seed}, skip_when_decided={skip_when_decided}"
+    finally:
+        feature_extractor.MAX_CARRY = saved
+
+if __name__ == "__main__":
+    test_settling_in_last_feed_counts_partial_line()
+    test_random_chunk_splits_match_full_scan()
+    test_long_single_line_matches_full_scan()
+    test_random_cut_lines_match_full_scan()
+    print("✅ Feature scanner tests passed")
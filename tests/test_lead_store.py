@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+TableWriter chunks must land in one CSV and one Parquet copy whatever the
+chunks hold. Run with pytest, or directly: python3 tests/test_lead_store.py
+"""
+
+import os
+import sys
+import tempfile
+
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.lead_store import BUSINESS_SCHEMA, COLUMNAR, TableWriter, columnar_path, load_table
+
+def business(i, notes):
+    return {'name': f'Business {i}', 'address': f'{i} Main Street', 'website': '', 'phone': '01 555 0100',
+            'category': 'cafe', 'location': 'Dublin', 'notes': notes}
+
+def test_extra_column_empty_in_first_chunk():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'export.csv')
+        with TableWriter(path, BUSINESS_SCHEMA) as writer:
+            writer.write([business(i, None) for i in range(5)])
+            writer.write([business(i, 'hello') for i in range(5, 10)])
+        
+        assert sorted(os.listdir(tmp)) == sorted(['export.csv'] + (['export.parquet'] if COLUMNAR else []))
+        assert pd.read_csv(path)['notes'].fillna('').tolist() == [''] * 5 + ['hello'] * 5
+        if COLUMNAR:
+            assert pd.read_parquet(columnar_path(path))['notes'].fillna('').tolist() == [''] * 5 + ['hello'] * 5
+        assert len(load_table(path, BUSINESS_SCHEMA)) == 10
+
+if __name__ == "__main__":
+    test_extra_column_empty_in_first_chunk()
+    print("✅ Lead store tests passed")
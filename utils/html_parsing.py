@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""
+HTML parser selection for the directory scrapers
+lxml is much faster than the pure-Python html.parser; fall back if it's missing
+"""
+
+import re
+
+from bs4 import SoupStrainer
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+def class_strainer(tags, *classes):
+    """
+    SoupStrainer that parses only tags carrying one of the given classes
+    At parse time class is still the raw string ('listing featured'), so
+    each class is matched as a whitespace-separated token
+    """
+    tokens = '|'.join(re.escape(name) for name in classes)
+    return SoupStrainer(tags, {'class': re.compile(rf'(^|\s)({tokens})(\s|$)')})
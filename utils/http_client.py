@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP client for Lead Scout
+Pooled keep-alive sessions with retries, shared by scrapers and analyzer
+"""
+
+import threading
+import time
+from typing import Dict, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from utils.metrics import METRICS
+
+# Browser-like headers for directory sites that block plain clients
+BROWSER_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Sec-Fetch-User': '?1',
+    'Cache-Control': 'max-age=0',
+}
+
+CHROME_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+BASIC_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+
+DEFAULT_TIMEOUT = 10
+DIRECTORY_TIMEOUT = 15
+
+SERVER_ERROR_STATUSES = [500, 502, 503, 504]
+RETRY_STATUSES = [429] + SERVER_ERROR_STATUSES
+
+# Settings for each shared client, see get_client()
+CLIENT_PROFILES = {
+    # 429 is left to the caller: the Places scraper backs off through its SharedTokenBucket
+    'places': {'headers': {}, 'timeout': DEFAULT_TIMEOUT, 'per_host_connections': 16, 'retries': 2,
+               'retry_statuses': SERVER_ERROR_STATUSES},
+    'golden_pages': {'headers': BROWSER_HEADERS, 'timeout': DIRECTORY_TIMEOUT},
+    'yell': {'headers': BASIC_HEADERS, 'timeout': DEFAULT_TIMEOUT},
+    'google_maps': {'headers': CHROME_HEADERS, 'timeout': DEFAULT_TIMEOUT},
+    # Business websites: many hosts, few requests each, fail fast
+    'websites': {'headers': BASIC_HEADERS, 'timeout': DEFAULT_TIMEOUT, 'max_hosts': 256,
+                 'per_host_connections': 2, 'retries': 0},
+}
+
+class HttpClient:
+    """
+    A pooled requests.Session with retry adapters and connection-reuse stats
+    Every request is also recorded in METRICS under the client's name:
+    count by status (or error type), latency, and body bytes when not streamed
+    """
+    
+    def __init__(self, headers: Optional[Dict] = None, timeout: float = DEFAULT_TIMEOUT,
+                 per_host_connections: int = 10, max_hosts: int = 32, retries: int = 2,
+                 backoff_factor: float = 0.5, block_when_full: bool = True, name: str = 'default',
+                 retry_statuses: Optional[List[int]] = None):
+        self.name = name
+        self.timeout = timeout
+        self.session = requests.Session()
+        if headers:
+            self.session.headers.update(headers)
+        
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUSES if retry_statuses is None else retry_statuses,
+            allowed_methods=['GET', 'HEAD'],
+            raise_on_status=False  # Callers still see the final response
+        )
+        # pool_connections = hosts kept in the pool, pool_maxsize = connections per host
+        self.adapter = HTTPAdapter(
+            pool_connections=max_hosts,
+            pool_maxsize=per_host_connections,
+            pool_block=block_when_full,
+            max_retries=retry
+        )
+        self.session.mount('http://', self.adapter)
+        self.session.mount('https://', self.adapter)
+        
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+    
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        kwargs.setdefault('timeout', self.timeout)
+        with self._lock:
+            self.requests += 1
+        start = time.perf_counter()
+        try:
+            response = self.session.request(method, url, **kwargs)
+        except requests.exceptions.RequestException as e:
+            with self._lock:
+                self.errors += 1
+            METRICS.inc('http_requests_total', client=self.name, status=type(e).__name__)
+            raise
+        finally:
+            # Streamed responses: time to headers; the body is read by the caller
+            METRICS.observe('http_request_seconds', time.perf_counter() - start, client=self.name)
+        
+        METRICS.inc('http_requests_total', client=self.name, status=response.status_code)
+        if not kwargs.get('stream'):
+            METRICS.inc('http_response_bytes_total', len(response.content), client=self.name)
+        return response
+    
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request('GET', url, **kwargs)
+    
+    def head(self, url: str, **kwargs) -> requests.Response:
+        return self.request('HEAD', url, **kwargs)
+    
+    def stats(self) -> Dict:
+        """Connection-reuse statistics from the underlying urllib3 pools"""
+        pools = self.adapter.poolmanager.pools
+        connections_opened = 0
+        requests_sent = 0
+        with pools.lock:
+            host_pools = list(pools._container.values())
+        for pool in host_pools:
+            connections_opened += pool.num_connections
+            requests_sent += pool.num_requests
+        
+        reused = max(requests_sent - connections_opened, 0)
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'hosts': len(host_pools),
+            'connections_opened': connections_opened,
+            'requests_sent': requests_sent,
+            'connections_reused': reused,
+            'reuse_rate': reused / requests_sent if requests_sent else 0.0
+        }
+    
+    def close(self):
+        self.session.close()
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+def get_client(name: str) -> HttpClient:
+    """Return the shared client for a profile in CLIENT_PROFILES"""
+    with _clients_lock:
+        if name not in _clients:
+            _clients[name] = HttpClient(**CLIENT_PROFILES.get(name, {}), name=name)
+        return _clients[name]
+
+def configure_client(name: str, **settings) -> HttpClient:
+    """Replace a shared client with new settings (e.g. per_host_connections=32)"""
+    with _clients_lock:
+        old = _clients.pop(name, None)
+        if old:
+            old.close()
+        _clients[name] = HttpClient(**{**CLIENT_PROFILES.get(name, {}), 'name': name, **settings})
+        return _clients[name]
+
+def connection_stats() -> Dict[str, Dict]:
+    """Stats for every shared client created so far"""
+    with _clients_lock:
+        clients = dict(_clients)
+    return {name: client.stats() for name, client in clients.items()}
+
+def print_connection_stats():
+    for name, stats in connection_stats().items():
+        print(f"🔌 {name}: {stats['requests']} requests, {stats['connections_opened']} connections opened, "
+              f"{stats['reuse_rate']*100:.0f}% reused, {stats['errors']} errors")
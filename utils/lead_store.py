@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Typed columnar storage for every pipeline stage
+Each stage still writes its CSV (the export format) and, when pyarrow is
+installed, a Parquet copy next to it with a fixed schema. Loads prefer the
+Parquet copy, so types survive the round trip and no re-inference is needed.
+"""
+
+import os
+
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401
+    COLUMNAR = True
+except ImportError:
+    COLUMNAR = False
+
+# Scraped businesses (the unified record shared by every source)
+BUSINESS_SCHEMA = {
+    'name': 'string',
+    'address': 'string',
+    'website': 'string',
+    'phone': 'string',
+    'category': 'category',
+    'location': 'category',
+    'rating': 'Float32',
+    'reviews': 'Int32',
+    'place_id': 'string',
+    'source': 'category',
+    'categories': 'string',  # Every category/source a deduplicated business was found under, '|'-separated
+    'sources': 'string',
+    'needs_details': 'bool',  # Lightweight Places record: website/phone not fetched yet
+}
+
+# Website analysis output (analysis/website_analyzer.py build_result)
+ANALYSIS_SCHEMA = {
+    'name': 'string',
+    'address': 'string',
+    'original_website': 'string',
+    'phone': 'string',
+    'category': 'category',
+    'location': 'category',
+    'score': 'int16',
+    'has_website': 'bool',
+    'analysis_details': 'string',
+    'needs_website': 'bool',
+    'categories': 'string',      # All categories of a deduplicated business, '|'-separated
+    'final_url': 'string',       # Where the homepage was actually served from
+    'redirect_chain': 'string',  # 'a > b > c' when the website redirected
+    'tls': 'category',           # 'ok', 'invalid', or 'none' for plain HTTP
+    'content_type': 'category',
+}
+
+TRUE_STRINGS = {'true', 'yes', '1'}
+FALSE_STRINGS = {'false', 'no', '0', ''}
+CSV_TRUE_VALUES = ['True', 'true', 'TRUE', 'YES', 'Yes', 'yes']
+CSV_FALSE_VALUES = ['False', 'false', 'FALSE', 'NO', 'No', 'no']
+
+def columnar_path(path):
+    """Parquet companion of a CSV path"""
+    return os.path.splitext(path)[0] + '.parquet'
+
+def _to_bool(column):
+    if column.dtype == bool:
+        return column
+    text = column.astype('string').str.strip().str.lower()
+    unknown = set(text.dropna().unique()) - TRUE_STRINGS - FALSE_STRINGS
+    if unknown:
+        raise ValueError(f"Not a boolean column {column.name!r}: {sorted(unknown)[:5]}")
+    return text.isin(TRUE_STRINGS).fillna(False).astype(bool)
+
+def apply_schema(df, schema):
+    """Coerce a frame to a schema: schema columns first (missing ones added empty), extras kept"""
+    df = df.copy()
+    for column, dtype in schema.items():
+        if column not in df:
+            df[column] = pd.Series(pd.NA, index=df.index, dtype='object')
+        if dtype == 'bool':
+            df[column] = _to_bool(df[column])
+        elif dtype in ('int16', 'int32', 'int64'):
+            df[column] = pd.to_numeric(df[column], errors='coerce').fillna(0).astype(dtype)
+        elif dtype in ('Float32', 'Int32'):
+            df[column] = pd.to_numeric(df[column], errors='coerce').astype(dtype)
+        elif dtype == 'string':
+            # Missing text is '' whether it came from CSV or Parquet
+            df[column] = df[column].astype('string').fillna('')
+        else:
+            df[column] = df[column].astype(dtype)
+    extras = [column for column in df.columns if column not in schema]
+    return df[list(schema) + extras]
+
+def save_columnar(data, csv_path, schema):
+    """Write the Parquet companion of csv_path if pyarrow is available, returns its path or None"""
+    if not COLUMNAR:
+        return None
+    df = data if isinstance(data, pd.DataFrame) else pd.DataFrame(list(data))
+    path = columnar_path(csv_path)
+    apply_schema(df, schema).to_parquet(path, index=False)
+    return path
+
+def save_table(df, csv_path, schema):
+    """Write a stage's CSV export plus its typed Parquet copy"""
+    df = apply_schema(df, schema)
+    df.to_csv(csv_path, index=False)
+    save_columnar(df, csv_path, schema)
+    return df
+
+def load_table(csv_path, schema, columns=None):
+    """
+    Load a stage's output with its schema applied
+    Reads the Parquet copy when it is at least as new as the CSV (only the
+    requested columns), otherwise parses the CSV with text columns pinned
+    so only numbers and booleans are inferred before the schema is applied.
+    Raises FileNotFoundError if neither exists.
+    """
+    if _parquet_fresh(csv_path):
+        df = pd.read_parquet(columnar_path(csv_path), columns=columns)
+    else:
+        df = pd.read_csv(csv_path, usecols=columns, **_csv_options(schema))
+    
+    if columns:
+        schema = {column: dtype for column, dtype in schema.items() if column in columns}
+    return apply_schema(df, schema)
+
+def iter_table(csv_path, schema, chunk_size=10_000):
+    """Like load_table, but yields the table chunk_size rows at a time"""
+    if _parquet_fresh(csv_path):
+        import pyarrow.parquet as pq
+        for batch in pq.ParquetFile(columnar_path(csv_path)).iter_batches(batch_size=chunk_size):
+            yield apply_schema(batch.to_pandas(), schema)
+    else:
+        with pd.read_csv(csv_path, chunksize=chunk_size, **_csv_options(schema)) as reader:
+            for chunk in reader:
+                yield apply_schema(chunk, schema)
+
+def _parquet_fresh(csv_path):
+    path = columnar_path(csv_path)
+    return COLUMNAR and os.path.exists(path) and \
+        (not os.path.exists(csv_path) or os.path.getmtime(path) >= os.path.getmtime(csv_path))
+
+def _csv_options(schema):
+    # Pin text columns so only numbers and booleans are inferred
+    text_columns = {column: dtype for column, dtype in schema.items() if dtype in ('string', 'category')}
+    return {'dtype': text_columns, 'true_values': CSV_TRUE_VALUES, 'false_values': CSV_FALSE_VALUES}
+
+class TableWriter:
+    """
+    Writes a stage's output chunk by chunk
+    Rows go to '<csv_path>.partial', flushed and fsynced after every chunk so
+    an interrupted run leaves a readable CSV of everything finished so far.
+    close() renames it into place (and the Parquet copy, if pyarrow is there).
+    The first chunk fixes the columns (the CSV header); columns outside the
+    schema are stored as text, since an all-empty one in the first chunk
+    says nothing about its type.
+    """
+    
+    def __init__(self, csv_path, schema):
+        self.csv_path = csv_path
+        self.schema = schema
+        self.rows = 0
+        self.columns = None
+        self.partial_path = csv_path + '.partial'
+        self._csv = open(self.partial_path, 'w', newline='', encoding='utf-8')
+        self._parquet = None
+    
+    def write(self, data):
+        """Append a DataFrame or list of records, returns it with the schema applied"""
+        df = apply_schema(data if isinstance(data, pd.DataFrame) else pd.DataFrame(list(data)), self.schema)
+        if self.columns is None:
+            self.columns = list(df.columns)
+        extras = {column: 'string' for column in self.columns if column not in self.schema}
+        df = df.reindex(columns=self.columns).astype(extras)
+        df.to_csv(self._csv, index=False, header=self.rows == 0)
+        self._csv.flush()
+        os.fsync(self._csv.fileno())
+        self.rows += len(df)
+        
+        if COLUMNAR and len(df):
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            # Categories differ between chunks; store them as plain strings
+            # (Parquet dictionary-encodes them anyway) so every chunk has one schema
+            plain = df.astype({column: 'string' for column, dtype in self.schema.items() if dtype == 'category'})
+            table = pa.Table.from_pandas(plain, preserve_index=False)
+            if self._parquet is None:
+                self._parquet = pq.ParquetWriter(columnar_path(self.csv_path) + '.partial', table.schema)
+            self._parquet.write_table(table.cast(self._parquet.schema))
+        return df
+    
+    def close(self):
+        self._csv.close()
+        os.replace(self.partial_path, self.csv_path)
+        if self._parquet is not None:
+            self._parquet.close()
+            os.replace(columnar_path(self.csv_path) + '.partial', columnar_path(self.csv_path))
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        # On failure keep the .partial files for inspection instead of replacing the last good output
+        if exc_type is None:
+            self.close()
+        else:
+            self._csv.close()
+            if self._parquet is not None:
+                self._parquet.close()
+
+def to_records(df):
+    """Rows as plain dicts, with missing values as None instead of pd.NA"""
+    return df.astype(object).where(df.notna(), None).to_dict('records')
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Run metrics for every pipeline stage
+Counters, gauges and latency histograms kept in one process-wide registry
+(METRICS) and written at the end of a run as a Prometheus textfile (for
+node_exporter's textfile collector) plus a JSON summary, one pair per run
+name, in data/metrics/ or LEAD_SCOUT_METRICS_DIR.
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Tuple
+
+NAMESPACE = 'leadscout'
+METRICS_DIR = os.environ.get('LEAD_SCOUT_METRICS_DIR', 'data/metrics')
+
+# Seconds; from a cached lookup up to a request that ran into its timeout
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+def _key(labels: Dict) -> Tuple:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+def _finite(value: float):
+    # JSON has no infinity; a quantile past the last bucket is reported as null
+    return value if value != float('inf') else None
+
+def _with_run(key: Tuple, run: str = None) -> Tuple:
+    """Label key with run="<run>" added, so series from different runs' files never collide"""
+    return tuple(sorted(dict(key, run=run).items())) if run else key
+
+def _format_labels(key: Tuple, extra: str = '') -> str:
+    parts = ['{}="{}"'.format(name, value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+             for name, value in key]
+    if extra:
+        parts.append(extra)
+    return '{' + ','.join(parts) + '}' if parts else ''
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus sense"""
+    
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+    
+    def observe(self, value: float):
+        self.count += 1
+        self.sum += value
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+    
+    def cumulative(self):
+        total = 0
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            yield bound, total
+    
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th observation (inf past the last bucket)"""
+        rank = q * self.count
+        for bound, total in self.cumulative():
+            if total >= rank:
+                return bound
+        return float('inf')
+
+class Metrics:
+    """Thread-safe registry of counters, gauges and histograms, keyed by name and labels"""
+    
+    def __init__(self, namespace: str = NAMESPACE):
+        self.namespace = namespace
+        self._lock = threading.Lock()
+        self.reset()
+    
+    def reset(self):
+        with self._lock:
+            self.counters = {}
+            self.gauges = {}
+            self.histograms = {}
+            self.started = time.time()
+    
+    def inc(self, name: str, value: float = 1, **labels):
+        """Add to a counter (names end in _total)"""
+        key = (name, _key(labels))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+    
+    def set(self, name: str, value: float, **labels):
+        key = (name, _key(labels))
+        with self._lock:
+            self.gauges[key] = value
+    
+    def observe(self, name: str, value: float, **labels):
+        """Record a latency (seconds) in a histogram"""
+        key = (name, _key(labels))
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram()
+            histogram.observe(value)
+    
+    @contextmanager
+    def timer(self, name: str, **labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+    
+    @contextmanager
+    def stage(self, name: str):
+        """
+        Time a pipeline stage and count the rows it handles
+        Yields a StageRun; call add(rows) as rows are produced. A stage run
+        several times (e.g. once per chunk) accumulates into stage_seconds_total
+        and stage_rows_total; stage_rows_per_second is their ratio.
+        """
+        run = StageRun()
+        try:
+            yield run
+        finally:
+            self.inc('stage_seconds_total', time.perf_counter() - run.start, stage=name)
+            self.inc('stage_rows_total', run.rows, stage=name)
+            seconds = self.total('stage_seconds_total', stage=name)
+            rows = self.total('stage_rows_total', stage=name)
+            self.set('stage_rows_per_second', rows / seconds if seconds > 0 else 0.0, stage=name)
+    
+    def total(self, name: str, **labels) -> float:
+        """Sum of a counter over every label set matching labels"""
+        wanted = set(_key(labels))
+        with self._lock:
+            return sum(value for (counter, key), value in self.counters.items()
+                       if counter == name and wanted <= set(key))
+    
+    def to_prometheus(self, run: str = None) -> str:
+        """Prometheus text exposition format, every series labelled run="<run>" if given"""
+        lines = []
+        with self._lock:
+            counters = sorted(self.counters.items())
+            gauges = sorted(self.gauges.items())
+            histograms = sorted(self.histograms.items(), key=lambda item: item[0])
+        
+        def series(kind, items, render):
+            seen = set()
+            for (name, key), value in items:
+                full = f"{self.namespace}_{name}"
+                if name not in seen:
+                    seen.add(name)
+                    lines.append(f"# TYPE {full} {kind}")
+                render(full, _with_run(key, run), value)
+        
+        def render_value(full, key, value):
+            lines.append(f"{full}{_format_labels(key)} {value}")
+        
+        def render_histogram(full, key, histogram):
+            for bound, total in histogram.cumulative():
+                le = 'le="{}"'.format(bound)
+                lines.append(f"{full}_bucket{_format_labels(key, le)} {total}")
+            le = 'le="+Inf"'
+            lines.append(f"{full}_bucket{_format_labels(key, le)} {histogram.count}")
+            lines.append(f"{full}_sum{_format_labels(key)} {histogram.sum}")
+            lines.append(f"{full}_count{_format_labels(key)} {histogram.count}")
+        
+        series('counter', counters, render_value)
+        series('gauge', gauges, render_value)
+        series('histogram', histograms, render_histogram)
+        return '\n'.join(lines) + '\n'
+    
+    def summary(self) -> Dict:
+        """JSON-friendly view: counters and gauges by label set, histograms as count/mean/p50/p95"""
+        def labelled(name, key):
+            return name + _format_labels(key)
+        
+        with self._lock:
+            summary = {
+                'started': self.started,
+                'duration_seconds': time.time() - self.started,
+                'counters': {labelled(name, key): value for (name, key), value in sorted(self.counters.items())},
+                'gauges': {labelled(name, key): value for (name, key), value in sorted(self.gauges.items())},
+                'histograms': {
+                    labelled(name, key): {
+                        'count': histogram.count,
+                        'mean': histogram.sum / histogram.count if histogram.count else 0.0,
+                        'p50': _finite(histogram.quantile(0.5)),
+                        'p95': _finite(histogram.quantile(0.95)),
+                    }
+                    for (name, key), histogram in sorted(self.histograms.items(), key=lambda item: item[0])
+                },
+            }
+        return summary
+    
+    def write(self, run: str, directory: str = None) -> Tuple[str, str]:
+        """
+        Write <run>.prom and <run>.json, returns their paths
+        Every series in <run>.prom carries run="<run>": node_exporter's textfile
+        collector rejects the same series appearing in two files. Files are
+        written aside and renamed so the collector never reads half a file
+        """
+        directory = directory or METRICS_DIR
+        os.makedirs(directory, exist_ok=True)
+        self.set('run_duration_seconds', time.time() - self.started)
+        self.set('run_finished_timestamp_seconds', time.time())
+        
+        prom_path = os.path.join(directory, f"{run}.prom")
+        json_path = os.path.join(directory, f"{run}.json")
+        for path, text in ((prom_path, self.to_prometheus(run)),
+                           (json_path, json.dumps(self.summary(), indent=2, default=str))):
+            with open(path + '.partial', 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(path + '.partial', path)
+        
+        print(f"📈 Metrics written to {prom_path} and {json_path}")
+        return prom_path, json_path
+
+class StageRun:
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.rows = 0
+    
+    def add(self, rows: int):
+        self.rows += rows
+
+# Process-wide registry used by every module
+METRICS = Metrics()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Politeness and rate limiting helpers
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+try:
+    import fcntl
+except ImportError:  # Windows: the bucket is then shared by threads only
+    fcntl = None
+
+class HostThrottle:
+    """Enforce a minimum delay between requests to the same host, across threads"""
+    
+    def __init__(self, min_delay: float = 0.5):
+        self.min_delay = min_delay
+        self._lock = threading.Lock()
+        self._next_allowed = {}
+    
+    def wait(self, url: str) -> float:
+        """Block until this URL's host may be requested again, returns seconds waited"""
+        host = urlparse(url).hostname if isinstance(url, str) else None
+        if not host or self.min_delay <= 0:
+            return 0.0
+        
+        # Reserve the next slot under the lock, sleep outside it
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_allowed.get(host, now))
+            self._next_allowed[host] = slot + self.min_delay
+        
+        wait = slot - now
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+class SharedTokenBucket:
+    """
+    Token bucket shared by every thread and process using the same state file
+    The bucket (tokens, current rate) lives in a small JSON file guarded by an
+    flock, so separate worker processes draw from one quota. The rate adapts
+    AIMD-style: throttled() halves it and empties the bucket, each success()
+    adds a little back until max_rate is reached again. A learned rate only
+    carries over while the bucket is in use: after stale_after idle seconds,
+    or once a process passes a different starting rate, it starts again from
+    rate (processes sharing a file should pass the same one).
+    """
+    
+    def __init__(self, path: str, rate: float = 10.0, capacity: float = None, min_rate: float = 0.2,
+                 max_rate: float = None, increase: float = None, decrease: float = 0.5,
+                 stale_after: float = 600.0):
+        self.path = path
+        self.initial_rate = rate
+        self.stale_after = stale_after
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.min_rate = min_rate
+        self.max_rate = max_rate if max_rate is not None else rate
+        self.increase = increase if increase is not None else self.max_rate / 50  # tokens/s per success
+        self.decrease = decrease
+        self._lock = threading.Lock()  # flock doesn't exclude threads sharing a descriptor
+        
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+    
+    @contextmanager
+    def _state(self):
+        """Locked read-modify-write of the shared state"""
+        with self._lock, open(self.path, 'a+') as f:
+            if fcntl:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                try:
+                    state = json.loads(f.read())
+                except ValueError:
+                    state = {'tokens': self.capacity, 'rate': self.initial_rate, 'updated': time.time()}
+                
+                # Refill for the time since the last writer (wall clock: shared across processes)
+                now = time.time()
+                elapsed = max(0.0, now - state['updated'])
+                if state.get('initial') != self.initial_rate or elapsed > self.stale_after:
+                    # An old run's throttled rate says little about now
+                    state['rate'] = self.initial_rate
+                    state['initial'] = self.initial_rate
+                state['tokens'] = min(self.capacity, state['tokens'] + elapsed * state['rate'])
+                state['updated'] = now
+                
+                yield state
+                
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps(state))
+                f.flush()
+            finally:
+                if fcntl:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+    
+    def acquire(self) -> float:
+        """Block until a token is available and take it, returns seconds waited"""
+        waited = 0.0
+        while True:
+            with self._state() as state:
+                if state['tokens'] >= 1:
+                    state['tokens'] -= 1
+                    return waited
+                wait = (1 - state['tokens']) / state['rate']
+            time.sleep(wait)
+            waited += wait
+    
+    def success(self):
+        """Additive increase after a request the API accepted"""
+        with self._state() as state:
+            state['rate'] = min(self.max_rate, state['rate'] + self.increase)
+    
+    def throttled(self):
+        """Multiplicative decrease after the API reported we are over quota"""
+        with self._state() as state:
+            state['rate'] = max(self.min_rate, state['rate'] * self.decrease)
+            state['tokens'] = min(state['tokens'], 0.0)
+    
+    def rate(self) -> float:
+        with self._state() as state:
+            return state['rate']